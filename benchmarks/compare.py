@@ -0,0 +1,124 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the results of a benchmark run with the committed baseline.
+
+Run the benchmarks saving the results, then compare them::
+
+    pytest benchmarks --benchmark-json=results.json
+    python benchmarks/compare.py results.json
+
+Any benchmark whose median time is slower than the baseline by more than
+the threshold fails the comparison.
+Timings depend on the machine, so the baseline should be made on the
+machine that does the comparisons, by adding ``--update``.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+#: The baseline committed with the benchmarks
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+#: The fraction slower than the baseline that counts as a regression
+THRESHOLD = 0.25
+
+
+def read_medians(results_file: str) -> Dict[str, float]:
+    """
+    Reads the median time of each benchmark from a pytest-benchmark JSON
+    results file.
+
+    :param str results_file: The file written by ``--benchmark-json``
+    :return: The median time in seconds of each benchmark by full name
+    """
+    with open(results_file, encoding="utf-8") as f:
+        results = json.load(f)
+    return {
+        benchmark["fullname"]: benchmark["stats"]["median"]
+        for benchmark in results["benchmarks"]}
+
+
+def compare(medians: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    """
+    Compares the medians with the baseline, printing each.
+
+    :param medians: The median time of each benchmark just run
+    :param baseline: The median time of each benchmark in the baseline
+    :param float threshold: The fraction slower that is a regression
+    :return: The names of the benchmarks that have regressed
+    """
+    regressions = []
+    for name, median in sorted(medians.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"NEW        {median:12.6f}s {name}")
+            continue
+        ratio = median / base
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            status = "REGRESSED"
+        elif ratio < 1 - threshold:
+            status = "IMPROVED"
+        else:
+            status = "OK"
+        print(f"{status:10} {median:12.6f}s {ratio:6.2f}x {name}")
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Compares a results file with the baseline, or updates the baseline.
+
+    :return: The exit code; 1 if any benchmark has regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("results", help="pytest-benchmark JSON results")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="the baseline file to compare with")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="the fraction slower that is a regression")
+    parser.add_argument("--update", action="store_true",
+                        help="replace the baseline with the results")
+    options = parser.parse_args(args)
+
+    medians = read_medians(options.results)
+    if options.update:
+        threshold = options.threshold
+        if threshold is None:
+            threshold = THRESHOLD
+        with open(options.baseline, "w", encoding="utf-8") as f:
+            json.dump({"threshold": threshold, "medians": medians}, f,
+                      indent=2, sort_keys=True)
+            f.write("\n")
+        return 0
+
+    with open(options.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    threshold = options.threshold
+    if threshold is None:
+        threshold = baseline.get("threshold", THRESHOLD)
+    regressions = compare(medians, baseline["medians"], threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmarks are more than "
+              f"{threshold:.0%} slower than the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
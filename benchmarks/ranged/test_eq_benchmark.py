@@ -0,0 +1,33 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged.abstract_list import _eq
+
+pytest.importorskip("pytest_benchmark")
+
+#: The number of comparisons done in each round
+COMPARISONS = 2000
+
+
+@pytest.mark.parametrize("compare", [
+    pytest.param(_eq, id="eq"),
+    pytest.param(numpy.array_equal, id="array_equal")])
+def test_scalar_compare(benchmark, compare):
+    def comparisons():
+        for _ in range(COMPARISONS):
+            compare(1, 2)
+
+    benchmark(comparisons)
@@ -0,0 +1,44 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import (
+    BlockedRangeStore, ListRangeStore, RangedList)
+
+pytest.importorskip("pytest_benchmark")
+
+#: The number of updates done in each round
+UPDATES = 1000
+
+
+@pytest.mark.parametrize("n_ranges", [1000, 100000, 1000000])
+@pytest.mark.parametrize("range_store", [ListRangeStore, BlockedRangeStore])
+def test_fragmented_updates(benchmark, range_store, n_ranges):
+    # Ranges of two IDs with alternating values
+    values = (numpy.arange(n_ranges * 2) // 2) % 2
+    ranged_list = RangedList.from_numpy(
+        values, range_store=range_store, compaction=None)
+    assert len(ranged_list.get_ranges()) == n_ranges
+    ids = numpy.random.default_rng(0).integers(
+        n_ranges * 2, size=UPDATES).tolist()
+
+    def updates():
+        # Each pair splits a range then merges it back together
+        for the_id in ids:
+            ranged_list[the_id] = 2
+            ranged_list[the_id] = int(values[the_id])
+
+    benchmark(updates)
+    assert len(ranged_list.get_ranges()) == n_ranges
@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import RangeDictionary, RangedList
+
+pytest.importorskip("pytest_benchmark")
+
+#: The number of updates done in each round
+UPDATES = 1000
+#: The number of keys in each dictionary
+KEYS = 10
+#: The number of rounds of benchmarks that need a new list each round
+ROUNDS = 20
+
+#: (size, number of ranges) of each list
+SHAPES = [
+    pytest.param(size, n_ranges, id=f"{size}-{n_ranges}")
+    for size in (10000, 1000000)
+    for n_ranges in (10, 1000, 100000)
+    if n_ranges * 10 <= size]
+
+
+def _fragmented(size, n_ranges, offset=0):
+    """
+    Makes a range based list of alternating values with the given number of
+    ranges of about the same length.
+    """
+    values = ((numpy.arange(size) * n_ranges // size) + offset) % 2
+    return RangedList.from_numpy(values, compaction=None)
+
+
+def _dictionary(size, n_ranges):
+    """
+    Makes a dictionary with keys whose ranges are all in different places.
+    """
+    values = _fragmented(size, n_ranges).to_numpy()
+    range_dict = RangeDictionary(size)
+    for key in range(KEYS):
+        range_dict[f"key{key}"] = RangedList.from_numpy(
+            numpy.roll(values, key * 7), compaction=None)
+    return range_dict
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_construction(benchmark, size, n_ranges):
+    values = _fragmented(size, n_ranges).to_numpy()
+    ranged_list = benchmark(RangedList.from_numpy, values)
+    assert len(ranged_list.get_ranges()) == n_ranges
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_set_value_by_id(benchmark, size, n_ranges):
+    ids = numpy.random.default_rng(0).integers(size, size=UPDATES).tolist()
+
+    def setup():
+        # A new list each round so every round updates the same ranges
+        return (_fragmented(size, n_ranges), ), {}
+
+    def updates(ranged_list):
+        for the_id in ids:
+            ranged_list[the_id] = 2
+            ranged_list[the_id] = 3
+
+    benchmark.pedantic(updates, setup=setup, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_set_value_by_slice(benchmark, size, n_ranges):
+    starts = numpy.random.default_rng(0).integers(
+        size - 100, size=UPDATES).tolist()
+
+    def setup():
+        # A new list each round so every round updates the same ranges
+        return (_fragmented(size, n_ranges), ), {}
+
+    def updates(ranged_list):
+        for start in starts:
+            ranged_list.set_value_by_slice(start, start + 100, 2)
+
+    benchmark.pedantic(updates, setup=setup, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_iter_ranges(benchmark, size, n_ranges):
+    ranged_list = _fragmented(size, n_ranges)
+    ranges = benchmark(lambda: list(ranged_list.iter_ranges()))
+    assert len(ranges) == n_ranges
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_merge_keys(benchmark, size, n_ranges):
+    range_dict = _dictionary(size, n_ranges)
+    benchmark(lambda: list(range_dict.iter_ranges()))
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_view_iteration(benchmark, size, n_ranges):
+    range_dict = _dictionary(size, n_ranges)
+    ids = numpy.sort(numpy.random.default_rng(0).choice(
+        size, size=size // 100, replace=False))
+    view = range_dict[ids]
+    benchmark(lambda: list(view.iter_all_values("key0")))
+
+
+@pytest.mark.parametrize("size, n_ranges", SHAPES)
+def test_derived_evaluation(benchmark, size, n_ranges):
+    left = _fragmented(size, n_ranges)
+    right = _fragmented(size, n_ranges, offset=1)
+
+    def evaluate():
+        # A new derived list each time, so nothing is cached
+        return list(((left + right) * 2 - left).iter_ranges())
+
+    benchmark(evaluate)
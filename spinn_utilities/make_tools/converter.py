@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
-from .file_converter import FileConverter
+from .file_converter import FileConverter, source_state
 from .log_sqllite_database import LogSqlLiteDatabase
 
 ALLOWED_EXTENSIONS = frozenset([".c", ".cpp", ".h"])
@@ -24,7 +25,8 @@ SKIPPABLE_FILES = frozenset([
     "neural_build.mk", "Makefile.neural_build"])
 
 
-def convert(src, dest, new_dict):
+def convert(src, dest, new_dict, processes=1, incremental=False,
+            log_lookup=True):
     """
     Converts a whole directory including sub-directories.
 
@@ -33,6 +35,22 @@ def convert(src, dest, new_dict):
     :param bool new_dict:
         Whether we should generate a new dictionary/DB.
         If not, we add to the existing one.
+    :param processes:
+        How many processes to convert files in. With more than one, files
+        are converted across a process pool and their logs written to the
+        database by this process, giving the same IDs as converting them
+        one at a time. `None` uses as many processes as there are CPUs.
+    :type processes: int or None
+    :param bool incremental:
+        Whether to skip files whose source is unchanged since they were
+        last converted and whose destination still exists; their logs keep
+        the IDs they already have.
+        Off by default, as a file is also skipped if only the converter has
+        changed since.
+    :param bool log_lookup:
+        Whether to make the table that looks up logs by ID when done,
+        unless it is still up to date, so that replacing each log is a
+        single lookup.
     """
     if new_dict:
         LogSqlLiteDatabase(new_dict)
@@ -42,19 +60,29 @@ def convert(src, dest, new_dict):
         raise FileNotFoundError(
             f"Unable to locate source directory {src_path}")
     dest_path = os.path.abspath(dest)
-    _convert_dir(src_path, dest_path)
+    _convert_dir(src_path, dest_path, processes=processes,
+                 incremental=incremental)
+    if log_lookup:
+        with LogSqlLiteDatabase() as log_database:
+            if not log_database.has_log_lookup():
+                log_database.make_log_lookup()
 
 
-def _convert_dir(src_path, dest_path, make_directories=False):
+def _find_files(src_path, dest_path, make_directories=False):
     """
-    Converts a whole directory including sub directories.
+    Finds the files to convert in a whole directory including sub
+    directories.
 
     :param str src_path: Full source directory
     :param str dest_path: Full destination directory
     :param bool make_directories: Whether to do `mkdir()` first
+    :return: The source directory, destination directory and name of each
+        file in the order they should be converted
+    :rtype: list(tuple(str, str, str))
     """
     if make_directories:
         _mkdir(dest_path)
+    files = []
     for src_dir, _, file_list in os.walk(src_path):
         dest_dir = os.path.join(dest_path, os.path.relpath(src_dir, src_path))
         if make_directories:
@@ -62,12 +90,90 @@ def _convert_dir(src_path, dest_path, make_directories=False):
         for file_name in file_list:
             _, extension = os.path.splitext(file_name)
             if extension in ALLOWED_EXTENSIONS:
-                FileConverter.convert(src_dir, dest_dir, file_name)
+                files.append((src_dir, dest_dir, file_name))
             elif file_name in SKIPPABLE_FILES:
                 pass
             else:
                 source = os.path.join(src_dir, file_name)
                 print(f"Unexpected file {source}")
+    return files
+
+
+def _is_unchanged(log_database, src_dir, dest_dir, file_name):
+    """
+    Checks if a file has been converted and its source not changed since.
+
+    The source is only hashed if its modified time or size has changed,
+    and if the content is the same the new modified time is saved.
+
+    :param LogSqlLiteDatabase log_database:
+    :param str src_dir: Source directory
+    :param str dest_dir: Destination directory
+    :param str file_name: The name of the file in both directories
+    :rtype: bool
+    """
+    if not os.path.exists(os.path.join(dest_dir, file_name)):
+        return False
+    directory_id = log_database.get_directory_id(src_dir, dest_dir)
+    state = log_database.get_source_state(directory_id, file_name)
+    if state is None:
+        return False
+    file_id, content_hash, mtime_ns, size = state
+    source = os.path.join(src_dir, file_name)
+    stat = os.stat(source)
+    if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+        return True
+    new_state = source_state(source)
+    if new_state[0] != content_hash:
+        return False
+    log_database.set_source_state(file_id, *new_state)
+    return True
+
+
+def _convert_dir(src_path, dest_path, make_directories=False, processes=1,
+                 incremental=False):
+    """
+    Converts a whole directory including sub directories.
+
+    :param str src_path: Full source directory
+    :param str dest_path: Full destination directory
+    :param bool make_directories: Whether to do `mkdir()` first
+    :param processes: How many processes to convert files in
+    :type processes: int or None
+    :param bool incremental: Whether to skip files that are unchanged
+    """
+    files = _find_files(src_path, dest_path, make_directories)
+    if incremental and files:
+        with LogSqlLiteDatabase() as log_database:
+            files = [file for file in files
+                     if not _is_unchanged(log_database, *file)]
+    if processes == 1 or len(files) < 2:
+        for src_dir, dest_dir, file_name in files:
+            FileConverter.convert(src_dir, dest_dir, file_name)
+        return
+
+    src_dirs, dest_dirs, file_names = zip(*files)
+    with ProcessPoolExecutor(processes) as executor:
+        # map gives the results in order so the IDs are as if serial
+        parsed = executor.map(_parse, src_dirs, dest_dirs, file_names)
+        with LogSqlLiteDatabase() as log_database:
+            for (src_dir, dest_dir, file_name), (records, text, state) in zip(
+                    files, parsed):
+                FileConverter.save(log_database, src_dir, dest_dir,
+                                   file_name, records, text, state)
+
+
+def _parse(src_dir, dest_dir, file_name):
+    """
+    Converts a file in a worker process with :py:meth:`FileConverter.parse`.
+
+    :return: The logs found in the file, the converted file with
+        placeholders for their IDs, and the state of the source
+    :rtype: tuple(list(tuple(int, int, str)), str, tuple(str, int, int))
+    """
+    state = source_state(os.path.join(src_dir, file_name))
+    records, text = FileConverter.parse(src_dir, dest_dir, file_name)
+    return records, text, state
 
 
 def _mkdir(destination):
@@ -85,4 +191,8 @@ if __name__ == '__main__':
         _new_dict = bool(sys.argv[3])
     else:
         _new_dict = False
-    convert(_src, _dest, _new_dict)
+    if len(sys.argv) > 4:
+        _processes = int(sys.argv[4]) or None
+    else:
+        _processes = 1
+    convert(_src, _dest, _new_dict, _processes)
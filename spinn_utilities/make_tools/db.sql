@@ -25,6 +25,10 @@ CREATE TABLE IF NOT EXISTS log(
     file_id  STRING NOT NULL REFERENCES file(file_id) ON DELETE RESTRICT
 	);
 
+-- Each log message has one number, reused while it is unchanged
+CREATE UNIQUE INDEX IF NOT EXISTS log_lookup
+    ON log(log_level, line_num, original);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding data on the converted file
 CREATE TABLE IF NOT EXISTS file(
@@ -35,6 +39,13 @@ CREATE TABLE IF NOT EXISTS file(
     last_build INTEGER
 	);
 
+-- Find the builds of a file and which is the last
+CREATE INDEX IF NOT EXISTS file_lookup
+    ON file(directory_id, file_name, last_build);
+CREATE INDEX IF NOT EXISTS file_last_build ON file(last_build);
+-- Find the logs of a file
+CREATE INDEX IF NOT EXISTS log_file ON log(file_id);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding data on the converted file
 CREATE TABLE IF NOT EXISTS directory(
@@ -43,6 +54,32 @@ CREATE TABLE IF NOT EXISTS directory(
 	dest_path STRING NOT NULL
 	);
 
+-- Find a directory by its paths
+CREATE INDEX IF NOT EXISTS directory_lookup
+    ON directory(src_path, dest_path);
+
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- A copy of the logs in current_file_view made when a build finishes,
+-- so each log can be found with just its log_id
+-- Emptied whenever a file is converted again, until remade
+CREATE TABLE IF NOT EXISTS current_log(
+    log_id INTEGER PRIMARY KEY,
+    log_level INTEGER NOT NULL,
+    file_name STRING NOT NULL,
+    line_num INTEGER NOT NULL,
+    original STRING NOT NULL
+	);
+
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- A table holding the state of the source of each converted file
+-- so an unchanged source does not have to be converted again
+CREATE TABLE IF NOT EXISTS source(
+    file_id INTEGER PRIMARY KEY REFERENCES file(file_id) ON DELETE CASCADE,
+    content_hash STRING NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+	);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- Glue the bits together to show the information that people think is here
 CREATE VIEW IF NOT EXISTS current_file_view AS
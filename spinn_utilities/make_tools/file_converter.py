@@ -12,12 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import enum
+import hashlib
+import io
 import os
 import re
 from spinn_utilities.exceptions import UnexpectedCException
 from .log_sqllite_database import LogSqlLiteDatabase
 
 TOKEN = chr(30)  # Record Separator
+# Marks where the ID of a log goes until it is known
+_PLACEHOLDER = chr(31)  # Unit Separator
+_PLACEHOLDER_REGEX = re.compile(f"{_PLACEHOLDER}(\\d+){_PLACEHOLDER}")
 
 COMMA_SPLIITER = re.compile(r'(?!\B"[^"]*),(?![^"]*"\B)')
 STRING_REGEXP = re.compile(r'"([^"]|\\"|(""))*"')
@@ -38,6 +43,21 @@ MINIS = {"log_info(": "log_mini_info(",
          "log_warning(": "log_mini_warning("}
 
 
+def source_state(source):
+    """
+    Gets the state of a source file, to tell if it has changed since it was
+    last converted.
+
+    :param str source: Absolute path to source file
+    :return: The hash of the content, modified time in nanoseconds and size
+    :rtype: tuple(str, int, int)
+    """
+    stat = os.stat(source)
+    with open(source, "rb") as src_f:
+        content_hash = hashlib.sha256(src_f.read()).hexdigest()
+    return content_hash, stat.st_mtime_ns, stat.st_size
+
+
 class State(enum.Enum):
     """
     Status values.
@@ -66,7 +86,7 @@ class FileConverter(object):
         "_too_many_lines"
     ]
 
-    def __call__(self, src, dest, log_file_id, log_database):
+    def __call__(self, src, dest, log_file_id, log_database, dest_f=None):
         """
         Creates the file_convertor to convert one file.
 
@@ -76,6 +96,8 @@ class FileConverter(object):
             Id in the database for this file
         :param LogSqlLiteDatabase log_database:
             The database which handles the mapping of id to log messages.
+        :param dest_f: Open file like Object to write modified source to
+            instead of writing the destination file
         """
         #: Absolute path to source file
         #:
@@ -122,24 +144,36 @@ class FileConverter(object):
         #: :type: State
         self._previous_status = None
 
-        with open(src, encoding="utf-8") as src_f:
-            with open(dest, 'w', encoding="utf-8") as dest_f:
-                dest_f.write(
-                    f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
-                    f"{os.path.relpath(src, dest)}\n\n")
-                self._too_many_lines = 2
-                self._status = State.NORMAL_CODE
-                for line_num, text in enumerate(src_f):
-                    if self._too_many_lines > 0:
-                        # Try to recover the lines added by do not edit
-                        check = text.strip()
-                        if len(check) == 0 or check == "*":
-                            self._too_many_lines -= 1
-                            continue
-                    previous_status = self._status
-                    if not self._process_line(dest_f, line_num, text):
-                        self._status = previous_status
-                        self._process_chars(dest_f, line_num, text)
+        if dest_f is not None:
+            self._convert_lines(dest, dest_f)
+            return
+        with open(dest, 'w', encoding="utf-8") as new_f:
+            self._convert_lines(dest, new_f)
+
+    def _convert_lines(self, dest, dest_f):
+        """
+        Writes the converted lines of the source file.
+
+        :param str dest: Absolute path to destination file
+        :param dest_f: Open file like Object to write modified source to
+        """
+        with open(self._src, encoding="utf-8") as src_f:
+            dest_f.write(
+                f"// DO NOT EDIT! THIS FILE WAS GENERATED FROM "
+                f"{os.path.relpath(self._src, dest)}\n\n")
+            self._too_many_lines = 2
+            self._status = State.NORMAL_CODE
+            for line_num, text in enumerate(src_f):
+                if self._too_many_lines > 0:
+                    # Try to recover the lines added by do not edit
+                    check = text.strip()
+                    if len(check) == 0 or check == "*":
+                        self._too_many_lines -= 1
+                        continue
+                previous_status = self._status
+                if not self._process_line(dest_f, line_num, text):
+                    self._status = previous_status
+                    self._process_chars(dest_f, line_num, text)
         self._check_end_status()
 
     def _check_end_status(self):
@@ -642,10 +676,100 @@ class FileConverter(object):
         source = os.path.join(src_dir, file_name)
         if not os.path.exists(source):
             raise UnexpectedCException(f"Unable to locate source {source}")
+        state = source_state(source)
+        records, text = FileConverter.parse(src_dir, dest_dir, file_name)
+        with LogSqlLiteDatabase() as log_database:
+            FileConverter.save(log_database, src_dir, dest_dir, file_name,
+                               records, text, state)
+
+    @staticmethod
+    def parse(src_dir, dest_dir, file_name):
+        """
+        Static method to convert a file without writing it or using the
+        database, so that many files can be converted at once.
+
+        Each log message is given a placeholder in place of its ID, to be
+        replaced by :py:meth:`fill_ids` once the IDs are known.
+
+        :param str src_dir: Source directory
+        :param str dest_dir: Destination directory
+        :param str file_name:
+            The name of the file to convert within the source directory
+        :return: The level, line number and original message of each log
+            in order, and the text of the converted file
+        :rtype: tuple(list(tuple(int, int, str)), str)
+        """
+        source = os.path.join(src_dir, file_name)
+        if not os.path.exists(source):
+            raise UnexpectedCException(f"Unable to locate source {source}")
+        recorder = _LogRecorder()
+        dest_f = io.StringIO()
+        FileConverter()(source, os.path.join(dest_dir, file_name), None,
+                        recorder, dest_f)
+        return recorder.records, dest_f.getvalue()
+
+    @staticmethod
+    def fill_ids(text, log_ids):
+        """
+        Replaces the placeholders in a file converted by :py:meth:`parse`
+        with the IDs of the logs.
+
+        :param str text: The converted text with placeholders
+        :param list(int) log_ids: The ID of each log in order
+        :rtype: str
+        """
+        return _PLACEHOLDER_REGEX.sub(
+            lambda match: str(log_ids[int(match.group(1))]), text)
+
+    @staticmethod
+    def save(log_database, src_dir, dest_dir, file_name, records, text,
+             state):
+        """
+        Saves the logs of a file converted by :py:meth:`parse` in one
+        transaction and writes the file with their IDs.
+
+        :param LogSqlLiteDatabase log_database:
+        :param str src_dir: Source directory
+        :param str dest_dir: Destination directory
+        :param str file_name: The name of the file in both directories
+        :param list(tuple(int, int, str)) records: The logs found in the file
+        :param str text: The converted file with placeholders for the IDs
+        :param tuple(str, int, int) state:
+            The state of the source from :py:func:`source_state`
+        """
+        directory_id = log_database.get_directory_id(src_dir, dest_dir)
+        file_id = log_database.get_file_id(directory_id, file_name)
+        log_ids = log_database.set_log_infos(records, file_id)
         if not os.path.exists(dest_dir):
             os.makedirs(dest_dir)
-        destination = os.path.join(dest_dir, file_name)
-        with LogSqlLiteDatabase() as log_database:
-            directory_id = log_database.get_directory_id(src_dir, dest_dir)
-            file_id = log_database.get_file_id(directory_id, file_name)
-            FileConverter()(source, destination, file_id, log_database)
+        with open(os.path.join(dest_dir, file_name), "w",
+                  encoding="utf-8") as dest_f:
+            dest_f.write(FileConverter.fill_ids(text, log_ids))
+        log_database.set_source_state(file_id, *state)
+
+
+class _LogRecorder:
+    """
+    Stands in for the database while parsing a file, recording each log and
+    giving it a placeholder ID.
+    """
+
+    __slots__ = ["records"]
+
+    def __init__(self):
+        self.records = []
+
+    def set_log_info(self, log_level, line_num, original, file_id):
+        """
+        Records a log to be saved once the whole file has been parsed.
+
+        :param int log_level:
+        :param int line_num:
+        :param str original:
+        :param int file_id: Not used as the file ID is given when saved
+        :return: The placeholder to write in place of the log ID
+        :rtype: str
+        """
+        # pylint: disable=unused-argument
+        self.records.append((log_level, line_num, original))
+        return f"{_PLACEHOLDER}{len(self.records) - 1}{_PLACEHOLDER}"
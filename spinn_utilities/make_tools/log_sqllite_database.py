@@ -13,10 +13,11 @@
 # limitations under the License.
 
 import os
+import pathlib
 import sqlite3
 import sys
 import time
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 from spinn_utilities.abstract_context_manager import AbstractContextManager
 
 _DDL_FILE = os.path.join(os.path.dirname(__file__), "db.sql")
@@ -28,6 +29,43 @@ def _timestamp():
     return int(time.time() * _SECONDS_TO_MICRO_SECONDS_CONVERSION)
 
 
+def _read_log_info(
+        db: sqlite3.Connection, has_log_table: bool,
+        log_id: str) -> Optional[Tuple[int, str, int, str]]:
+    """
+    Does :py:meth:`LogSqlLiteDatabase.get_log_info` with just the
+    connection, so that it can be cached without the cache referring back
+    to the database object and keeping it open.
+
+    :param ~sqlite3.Connection db: The connection to the database
+    :param bool has_log_table:
+        Whether the database has the table to look up logs by ID
+    :param str log_id: The int id as a String
+    :rtype: tuple(int, str, int, str)
+    """
+    with db:
+        if has_log_table:
+            for row in db.execute(
+                    """
+                    SELECT log_level, file_name, line_num , original
+                    FROM current_log
+                    WHERE log_id = ?
+                    LIMIT 1
+                    """, [log_id]):
+                return (row["log_level"], row["file_name"], row["line_num"],
+                        row["original"])
+        for row in db.execute(
+                """
+                SELECT log_level, file_name, line_num , original
+                FROM current_file_view
+                WHERE log_id = ?
+                LIMIT 1
+                """, [log_id]):
+            return (row["log_level"], row["file_name"], row["line_num"],
+                    row["original"])
+    return None
+
+
 class LogSqlLiteDatabase(AbstractContextManager):
     """
     Specific implementation of the Database for SQLite 3.
@@ -44,19 +82,28 @@ class LogSqlLiteDatabase(AbstractContextManager):
     __slots__ = [
         # the database holding the data to store
         "_db",
+        # whether the database has the table to look up logs by ID
+        "_has_log_table",
     ]
 
-    def __init__(self, new_dict=False):
+    def __init__(self, new_dict=False, read_only=False):
         """
         Connects to a log dict. The location of the file can be overridden
         using the ``C_LOGS_DICT`` environment variable.
 
+        Opening an existing dict that is not read only adds any tables and
+        indexes it is missing, so changes the file.
+
         :param bool new_dict: Flag to say if this is a new dict or not.
             If True, clears and previous values.
             If False, makes sure the dict exists.
+        :param bool read_only: Whether to open an existing dict without
+            changing it. Logs can then still be looked up, even in a dict
+            made before the table to look them up by ID was added.
         """
         # To Avoid an Attribute error on close after an exception
         self._db = None
+        self._has_log_table = False
         database_file = os.environ.get('C_LOGS_DICT', None)
         if database_file is None:
             script = sys.modules[self.__module__].__file__
@@ -72,8 +119,13 @@ class LogSqlLiteDatabase(AbstractContextManager):
             raise FileNotFoundError(message)
 
         try:
-            self._db = sqlite3.connect(database_file)
-            self.__init_db()
+            if read_only and not new_dict:
+                self._db = sqlite3.connect(
+                    pathlib.Path(database_file).resolve().as_uri() +
+                    "?mode=ro", uri=True)
+            else:
+                self._db = sqlite3.connect(database_file)
+            self.__init_db(read_only and not new_dict)
             if new_dict:
                 self.__clear_db()
         except Exception as ex:
@@ -105,20 +157,33 @@ class LogSqlLiteDatabase(AbstractContextManager):
             pass
         self._db = None
 
-    def __init_db(self):
+    def __init_db(self, read_only):
         """
         Set up the database if required.
+
+        :param bool read_only: Whether to leave the database as it is
         """
         self._db.row_factory = sqlite3.Row
         # Don't use memoryview / buffer as hard to deal with difference
         self._db.text_factory = str
+        if read_only:
+            for _ in self._db.execute(
+                    """
+                    SELECT 1 FROM sqlite_master
+                    WHERE type = 'table' AND name = 'current_log'
+                    """):
+                self._has_log_table = True
+            return
         with open(_DDL_FILE, encoding="utf-8") as f:
             sql = f.read()
         self._db.executescript(sql)
+        self._has_log_table = True
 
     def __clear_db(self):
         with self._db:
             cursor = self._db.cursor()
+            cursor.execute("DELETE FROM current_log")
+            cursor.execute("DELETE FROM source")
             cursor.execute("DELETE FROM log")
             cursor.execute("UPDATE SQLITE_SEQUENCE SET SEQ=0 WHERE NAME='log'")
             cursor.execute("DELETE FROM file")
@@ -168,6 +233,8 @@ class LogSqlLiteDatabase(AbstractContextManager):
             # Make previous one as not last
             with self._db:
                 cursor = self._db.cursor()
+                # The logs change so the lookup must be made again
+                cursor.execute("DELETE FROM current_log")
                 cursor.execute(
                     """
                     UPDATE file SET last_build = 0
@@ -182,6 +249,49 @@ class LogSqlLiteDatabase(AbstractContextManager):
                     """, (directory_id, file_name, _timestamp()))
                 return cursor.lastrowid
 
+    def get_source_state(
+            self, directory_id: int,
+            file_name: str) -> Optional[Tuple[int, str, int, int]]:
+        """
+        Gets the state of the source of the last build of a file.
+
+        :param int directory_id:
+        :param str file_name:
+        :return: The file id, and the hash, modified time in nanoseconds and
+            size of the source when it was converted, or `None` if unknown
+        :rtype: tuple(int, str, int, int) or None
+        """
+        with self._db:
+            for row in self._db.execute(
+                    """
+                    SELECT file_id, content_hash, mtime_ns, size
+                    FROM source NATURAL JOIN file
+                    WHERE directory_id = ? AND file_name = ?
+                        AND last_build = 1
+                    LIMIT 1
+                    """, [directory_id, file_name]):
+                return (row["file_id"], row["content_hash"], row["mtime_ns"],
+                        row["size"])
+        return None
+
+    def set_source_state(
+            self, file_id: int, content_hash: str, mtime_ns: int, size: int):
+        """
+        Saves the state of the source of a file once it is converted.
+
+        :param int file_id:
+        :param str content_hash: The hash of the content of the source
+        :param int mtime_ns: The modified time of the source in nanoseconds
+        :param int size: The size of the source in bytes
+        """
+        with self._db:
+            self._db.execute(
+                """
+                INSERT OR REPLACE INTO source(
+                    file_id, content_hash, mtime_ns, size)
+                VALUES(?, ?, ?, ?)
+                """, (file_id, content_hash, mtime_ns, size))
+
     def set_log_info(
             self, log_level: int, line_num: int, original: str, file_id: int):
         """
@@ -221,24 +331,139 @@ class LogSqlLiteDatabase(AbstractContextManager):
                         """, (log_level, line_num, original, file_id)):
                     return row["log_id"]
 
+    def set_log_infos(
+            self, records: Iterable[Tuple[int, int, str]],
+            file_id: int) -> List[int]:
+        """
+        Saves the data needed to replace many short logs back to their
+        originals, such as all those of a file, in one transaction.
+
+        The logs are matched with those already known by a join with a
+        temporary table of them, so as with :py:meth:`set_log_info` an
+        unchanged log keeps its ID and new logs get new IDs in order.
+
+        :param records: The level, line number and original of each log
+        :type records: iterable(tuple(int, int, str))
+        :param int file_id:
+        :return: The ID of each log in order
+        :rtype: list(int)
+        """
+        with self._db:
+            cursor = self._db.cursor()
+            cursor.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS new_log(
+                    position INTEGER PRIMARY KEY,
+                    log_level INTEGER NOT NULL,
+                    line_num INTEGER NOT NULL,
+                    original STRING NOT NULL)
+                """)
+            cursor.executemany(
+                """
+                INSERT INTO new_log(position, log_level, line_num, original)
+                VALUES(?, ?, ?, ?)
+                """, ((position, ) + tuple(record)
+                      for position, record in enumerate(records)))
+            # reuse the existing numbers but of this file now
+            cursor.execute(
+                """
+                UPDATE log SET
+                    file_id = ?
+                WHERE log_id IN (
+                    SELECT log_id
+                    FROM new_log JOIN log
+                        USING (log_level, line_num, original))
+                """, [file_id])
+            # create new numbers, in order, for the rest
+            cursor.executemany(
+                """
+                INSERT INTO log(log_level, line_num, original, file_id)
+                VALUES(?, ?, ?, ?)
+                """, ((row["log_level"], row["line_num"], row["original"],
+                       file_id)
+                      for row in self._db.execute(
+                          """
+                          SELECT log_level, line_num, original
+                          FROM new_log LEFT JOIN log
+                              USING (log_level, line_num, original)
+                          WHERE log_id IS NULL
+                          GROUP BY log_level, line_num, original
+                          ORDER BY MIN(position)
+                          """).fetchall()))
+            log_ids = [
+                row["log_id"] for row in self._db.execute(
+                    """
+                    SELECT log_id
+                    FROM new_log JOIN log
+                        USING (log_level, line_num, original)
+                    ORDER BY position
+                    """)]
+            cursor.execute("DELETE FROM new_log")
+            return log_ids
+
     def get_log_info(self, log_id: str) -> Optional[Tuple[int, str, int, str]]:
         """
         Gets the data needed to replace a short log back to the original.
 
+        Uses the lookup made by :py:meth:`make_log_lookup` if there is one.
+
         :param str log_id: The int id as a String
         :rtype: tuple(int, str, int, str)
         """
+        return _read_log_info(self._db, self._has_log_table, log_id)
+
+    def iter_log_infos(self) -> Iterator[
+            Tuple[int, Tuple[int, str, int, str]]]:
+        """
+        Gets the data needed to replace all the short logs of the last
+        build of each file back to their originals.
+
+        :return: The id of each log, and its data as from
+            :py:meth:`get_log_info`
+        :rtype: iterable(tuple(int, tuple(int, str, int, str)))
+        """
         with self._db:
             for row in self._db.execute(
                     """
-                    SELECT log_level, file_name, line_num , original
+                    SELECT log_id, log_level, file_name, line_num , original
                     FROM current_file_view
-                    WHERE log_id = ?
-                    LIMIT 1
-                    """, [log_id]):
-                return (row["log_level"], row["file_name"], row["line_num"],
-                        row["original"])
-        return None
+                    """):
+                yield row["log_id"], (
+                    row["log_level"], row["file_name"], row["line_num"],
+                    row["original"])
+
+    def make_log_lookup(self):
+        """
+        Makes the table used to look up the logs by ID, with the logs of the
+        last build of each file, once a build has finished.
+
+        The table is emptied when a file is next converted, so until it is
+        made again logs are looked up in the view it copies.
+        """
+        with self._db:
+            cursor = self._db.cursor()
+            cursor.execute("DELETE FROM current_log")
+            cursor.execute(
+                """
+                INSERT INTO current_log(
+                    log_id, log_level, file_name, line_num, original)
+                SELECT log_id, log_level, file_name, line_num, original
+                FROM current_file_view
+                """)
+
+    def has_log_lookup(self) -> bool:
+        """
+        Whether the table used to look up the logs by ID has been made
+        since a file was last converted.
+
+        :rtype: bool
+        """
+        if not self._has_log_table:
+            return False
+        with self._db:
+            for _ in self._db.execute("SELECT 1 FROM current_log LIMIT 1"):
+                return True
+        return False
 
     def check_original(self, original: str):
         """
@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache, partial
 import logging
+import sqlite3
 import struct
 import sys
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+from typing_extensions import TypeAlias
 from spinn_utilities.log import FormatAdapter
 from .file_converter import FORMAT_EXP
 from .file_converter import TOKEN
-from .log_sqllite_database import LogSqlLiteDatabase
+from .log_sqllite_database import LogSqlLiteDatabase, _read_log_info
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
@@ -29,11 +32,77 @@ LEVELS = {10: "[DEBUG]",
           40: "[ERROR]"}
 
 
+#: The level, file name, line number, unescaped original and format
+#: matches of a log, ready to replace
+_Log: TypeAlias = Tuple[int, str, int, str, Tuple[str, ...]]
+
+
+def _prepare(log_level: int, file_name: str, line_num: int,
+             original: str) -> _Log:
+    """
+    Does the work needed to replace a log that does not depend on the
+    values in a short message.
+    """
+    original = str(original)
+    replaced = original.encode("latin-1").decode("unicode_escape")
+    # Remove any blanks due to double spacing
+    matches = tuple(x for x in FORMAT_EXP.findall(original) if x != "")
+    return (log_level, file_name, line_num, replaced, matches)
+
+
+def _read_log(db: sqlite3.Connection, has_log_table: bool,
+              log_id: int) -> Optional[_Log]:
+    """
+    Reads a log and prepares it to replace.
+
+    This is at module level so that caching it does not make the
+    :py:class:`Replacer` refer to itself, which would keep its database
+    open until the garbage collector finds the cycle.
+    """
+    data = _read_log_info(db, has_log_table, str(log_id))
+    if data is None:
+        return None
+    return _prepare(*data)
+
+
 class Replacer(LogSqlLiteDatabase):
     """
     Performs replacements.
+
+    The logs looked up are kept in a least recently used cache, or all
+    the logs can be read in at the start.
+    Either way they are kept ready to replace, so only the values in each
+    message have to be formatted.
+    Changes to the database after a log is kept are not seen.
+
+    An existing database is opened read only, so is never changed, even
+    if it was made by an older version and is missing newer tables.
     """
 
+    __slots__ = ["_get_log", "_logs"]
+
+    def __init__(self, new_dict: bool = False,
+                 cache_size: Optional[int] = 1024, preload: bool = False):
+        """
+        :param bool new_dict: Flag to say if this is a new dict or not.
+        :param cache_size: How many logs to keep in the cache, or `None`
+            to keep all logs looked up
+        :type cache_size: int or None
+        :param bool preload:
+            Whether to read in all the logs of the last build now, so the
+            database is not used again.
+        """
+        super().__init__(new_dict, read_only=not new_dict)
+        self._logs: Optional[Dict[int, _Log]] = None
+        if preload:
+            self._logs = {
+                log_id: _prepare(*data)
+                for log_id, data in self.iter_log_infos()}
+            self._get_log: Callable[[int], Optional[_Log]] = self._logs.get
+        else:
+            self._get_log = lru_cache(maxsize=cache_size)(
+                partial(_read_log, self._db, self._has_log_table))
+
     def __enter__(self):
         return self
 
@@ -56,16 +125,16 @@ class Replacer(LogSqlLiteDatabase):
         parts = short.split(TOKEN)
         if not parts[0].isdigit():
             return None
-        data = self.get_log_info(parts[0])
+        try:
+            data = self._get_log(int(parts[0]))
+        except ValueError:
+            # Digits that are not decimal
+            return None
         if data is None:
             return None
-        (log_level, file_name, line_num, original) = data
+        (log_level, file_name, line_num, replaced, matches) = data
 
-        replaced = original.encode("latin-1").decode("unicode_escape")
         if len(parts) > 1:
-            matches = FORMAT_EXP.findall(original)
-            # Remove any blanks due to double spacing
-            matches = [x for x in matches if x != ""]
             # Start at 0 so first i+1 puts you at 1 as part 0 is the short
             i = 0
             try:
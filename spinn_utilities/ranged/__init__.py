@@ -19,15 +19,20 @@ population views and assemblies.
 """
 
 from .abstract_dict import AbstractDict
-from .abstract_list import AbstractList, DualList, SingleList
+from .abstract_list import AbstractList, DualList, FusedList, SingleList
 from .abstract_sized import AbstractSized
 from .abstract_view import AbstractView
 from .multiple_values_exception import MultipleValuesException
 from .range_dictionary import RangeDictionary
+from .range_store import (
+    AbstractRangeStore, ArrayRangeStore, BlockedRangeStore, ListRangeStore)
 from .ranged_list import RangedList
 from .ranged_list_of_lists import RangedListOfList
 
 __all__ = [
-    "AbstractDict", "AbstractList", "DualList", "SingleList", "AbstractSized",
-    "AbstractView", "MultipleValuesException", "RangeDictionary",
+    "AbstractDict", "AbstractList", "DualList", "FusedList", "SingleList",
+    "AbstractSized", "AbstractView", "MultipleValuesException",
+    "RangeDictionary",
+    "AbstractRangeStore", "ArrayRangeStore", "BlockedRangeStore",
+    "ListRangeStore",
     "RangedList", "RangedListOfList"]
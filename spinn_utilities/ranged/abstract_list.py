@@ -11,13 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+# pylint: disable=too-many-lines
 from __future__ import annotations
+from bisect import bisect_right
+from heapq import heapify, heapreplace
 from numbers import Number
 from typing import (
-    Any, Callable, Generic, Iterator, Optional, Sequence, Tuple,
-    TypeVar, Union, cast)
+    Any, Callable, Dict, Generic, Hashable, Iterator, List, Optional, Sequence,
+    Tuple, TypeVar, Union, cast)
 import numpy
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from typing_extensions import Self, TypeAlias, TypeGuard
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.overrides import overrides
@@ -31,13 +34,117 @@ T = TypeVar("T")
 U = TypeVar("U")
 #: :meta private:
 IdsType: TypeAlias = Union[Sequence[int], NDArray[numpy.integer]]
+#: An expression compiled by :py:meth:`AbstractList.fuse`; it takes one
+#: value (or array) per leaf list and returns the result
+_Evaluator: TypeAlias = Callable[[Sequence[Any]], Any]
+
+
+#: Types where ``==`` gives the same answer as :py:func:`numpy.array_equal`
+_SCALAR_TYPES = (int, float, str, type(None), numpy.number, numpy.bool_)
+
+
+#: The size below which integer results of NumPy can be trusted not to
+#: have overflowed
+_INT_LIMIT = float(2 ** 62)
 
 
 def _eq(x: Any, y: Any) -> bool:
+    # The same object is always considered equal, even NaN
+    if x is y:
+        return True
+    # Plain scalars do not need the cost of building arrays
+    if isinstance(x, _SCALAR_TYPES) and isinstance(y, _SCALAR_TYPES):
+        return bool(x == y)
     # Lies!
     return numpy.array_equal(cast(float, x), cast(float, y))
 
 
+def _array_ranges(
+        values: NDArray, offset: int = 0) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Run-length encodes a one dimensional array in a single vectorised pass.
+
+    :param ~numpy.ndarray values: The values to encode
+    :param int offset: The ID of the first value
+    :return: yields each range one by one
+    """
+    if len(values) == 0:
+        return iter(())
+    changes = numpy.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = numpy.concatenate(([0], changes))
+    stops = numpy.concatenate((changes, [len(values)]))
+    return zip((starts + offset).tolist(), (stops + offset).tolist(),
+               values[starts].tolist())
+
+
+def _merge_ranges(range_iters: Sequence[Iterator[Tuple[int, int, Any]]]
+                  ) -> Iterator[Tuple[int, int, Tuple[Any, ...]]]:
+    """
+    Merges several iterators of ranges over the same IDs in a single pass.
+
+    Yields each range over which none of the iterators change value, along
+    with the value of every iterator for that range.
+    The stops are kept in a heap, so each range boundary costs O(log k)
+    however many iterators are merged.
+
+    :param range_iters: The range iterators, all over the same IDs
+    :return: yields (start, stop, values) with one value per iterator
+    """
+    values: List[Any] = []
+    heap: List[Tuple[int, int]] = []
+    start = 0
+    for index, ranges in enumerate(range_iters):
+        try:
+            (start, stop, value) = next(ranges)
+        except StopIteration:
+            return
+        values.append(value)
+        heap.append((stop, index))
+    if not heap:
+        return
+    heapify(heap)
+    while True:
+        stop = heap[0][0]
+        yield (start, stop, tuple(values))
+        # IDs may skip ahead (for example when iterating by IDs) so the
+        # next range starts at the latest of the new starts
+        start = stop
+        while heap[0][0] == stop:
+            index = heap[0][1]
+            try:
+                (next_start, next_stop, values[index]) = next(
+                    range_iters[index])
+            except StopIteration:
+                return
+            start = max(start, next_start)
+            heapreplace(heap, (next_stop, index))
+
+
+def _split_ranges(ranges: Iterator[Tuple[int, int, U]],
+                  boundaries: Sequence[int]
+                  ) -> Iterator[List[Tuple[int, int, U]]]:
+    """
+    Splits ranges, which start at the first boundary, at each boundary in a
+    single pass.
+
+    :param ranges: The ranges from the first boundary to the last one
+    :param boundaries: The sorted boundaries of the slices
+    :return: yields the ranges of each slice in turn, reduced to just the
+        IDs inside the slice
+    """
+    current = next(ranges, None)
+    for start, stop in zip(boundaries, boundaries[1:]):
+        slice_ranges: List[Tuple[int, int, U]] = []
+        while start < stop and current is not None and current[0] < stop:
+            (range_start, range_stop, value) = current
+            slice_ranges.append(
+                (max(range_start, start), min(range_stop, stop), value))
+            if range_stop > stop:
+                break
+            current = next(ranges, None)
+        yield slice_ranges
+
+
 def _is_zero(value: Any) -> bool:
     return bool(numpy.isin(0, value))
 
@@ -49,7 +156,8 @@ def is_number(value: T) -> TypeGuard[float]:
     return isinstance(value, Number)
 
 
-class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
+class AbstractList(  # pylint: disable=too-many-public-methods
+        AbstractSized, Generic[T], metaclass=AbstractBase):
     """
     A ranged implementation of list.
 
@@ -114,6 +222,17 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    @property
+    def version(self) -> Optional[Hashable]:
+        """
+        A value which changes whenever any value in the list changes,
+        or ``None`` if the list does not keep track of its changes.
+
+        Lists computed from other lists use this to know when the values
+        they have cached are out of date.
+        """
+        return None
+
     def __len__(self) -> int:
         """
         Size of the list, irrespective of actual values
@@ -272,17 +391,17 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         :return: yields the elements pointed to by IDs
         """
         ranges = self.iter_ranges()
-        (_, stop, value) = next(ranges)
+        (start, stop, value) = next(ranges)
         for id_value in ids:
 
             # If range is too far ahead, reset to start
-            if id_value < stop:
+            if id_value < start:
                 ranges = self.iter_ranges()
-                (_, stop, value) = next(ranges)
+                (start, stop, value) = next(ranges)
 
             # Move on until the ID is in range
             while id_value >= stop:
-                (_, stop, value) = next(ranges)
+                (start, stop, value) = next(ranges)
 
             yield value
 
@@ -366,6 +485,8 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return self.iter_by_ids(range(slice_start, slice_stop, step))
 
         ids = self.selector_to_ids(selector)
+        if self._is_contiguous(ids):
+            return self.iter_by_slice(ids.start, ids.stop)
         return self.iter_by_ids(ids)
 
     def get_values(self, selector: Selector = None) -> Sequence[T]:
@@ -383,6 +504,40 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         return list(self.iter_by_selector(selector))
 
+    def to_numpy(self, dtype: Optional[DTypeLike] = None,
+                 selector: Selector = None) -> NDArray:
+        """
+        Get the values of the elements pointed to by the selector as a
+        single array.
+
+        Range based lists fill the array by repeating the value of each range,
+        so no object is created per element.
+
+        :param dtype: The type of the array; if ``None``, NumPy decides
+        :type dtype: ~numpy.typing.DTypeLike or None
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: An array with one entry (row) per selected element
+        :rtype: ~numpy.ndarray
+        """
+        if not self.range_based():
+            return numpy.array(self.get_values(selector), dtype=dtype)
+        if selector is None:
+            ranges = list(self.iter_ranges())
+        elif isinstance(selector, slice) and selector.step in (None, 1):
+            ranges = list(self.iter_ranges_by_slice(
+                selector.start, selector.stop))
+        else:
+            ids = self.selector_to_ids(selector)
+            if self._is_contiguous(ids):
+                ranges = list(self.iter_ranges_by_slice(ids.start, ids.stop))
+            else:
+                ranges = list(self.iter_ranges_by_ids(ids))
+        if not ranges:
+            return numpy.empty(0, dtype=dtype)
+        values = numpy.array([value for (_, _, value) in ranges], dtype=dtype)
+        return numpy.repeat(
+            values, [stop - start for (start, stop, _) in ranges], axis=0)
+
     def __contains__(self, item: T) -> bool:
         return any(_eq(value, item)
                    for (_, _, value) in self.iter_ranges())
@@ -414,6 +569,118 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                 return start
         raise ValueError(f"{x} is not in list")
 
+    def sum(self) -> Any:
+        """
+        Adds up the values of all the elements, weighting the value of each
+        range by its length.
+
+        :return: The total, which is 0 for an empty list
+        """
+        return sum(cast(Any, value) * (stop - start)
+                   for (start, stop, value) in self.iter_ranges())
+
+    def min(self) -> T:
+        """
+        Finds the smallest value of any element.
+
+        :raises ValueError: If the list is empty
+        """
+        return min(cast(Any, value)
+                   for (start, stop, value) in self.iter_ranges()
+                   if start < stop)
+
+    def max(self) -> T:
+        """
+        Finds the largest value of any element.
+
+        :raises ValueError: If the list is empty
+        """
+        return max(cast(Any, value)
+                   for (start, stop, value) in self.iter_ranges()
+                   if start < stop)
+
+    def mean(self) -> Any:
+        """
+        Finds the mean of the values of all the elements.
+
+        :raises ValueError: If the list is empty
+        """
+        if self._size == 0:
+            raise ValueError("The mean of an empty list is undefined")
+        return self.sum() / self._size
+
+    def unique(self) -> List[T]:
+        """
+        Finds the different values of the elements.
+
+        :return: Each different value once, in the order first found
+        :rtype: list(object)
+        """
+        return [value for (value, _) in self.value_counts()]
+
+    def value_counts(self) -> List[Tuple[T, int]]:
+        """
+        Counts the number of elements with each different value.
+
+        Values that can be hashed are grouped with a dict; any others are
+        compared with those already found.
+
+        :return: Each different value and the number of elements with it,
+            in the order first found
+        :rtype: list(tuple(object, int))
+        """
+        counts: List[List[Any]] = []
+        lookup: Dict[Hashable, List[Any]] = {}
+        for (start, stop, value) in self.iter_ranges():
+            if start == stop:
+                continue
+            try:
+                entry = lookup.get(value)
+            except TypeError:
+                entry = next(
+                    (entry for entry in counts if _eq(entry[0], value)), None)
+            if entry is None:
+                entry = [value, 0]
+                counts.append(entry)
+                try:
+                    lookup[value] = entry
+                except TypeError:
+                    pass
+            entry[1] += stop - start
+        return [(entry[0], entry[1]) for entry in counts]
+
+    def diff(self, other: AbstractList[T]) -> List[Tuple[int, int, T]]:
+        """
+        Finds the ranges where another list of the same size has different
+        values to this one.
+
+        The ranges of both lists are merged in a single pass, so neither
+        list is expanded to one value per ID.
+        Adjacent differing ranges with the same new value are joined, so the
+        result is the fewest ranges needed to turn this list into the other
+        one with :py:meth:`RangedList.apply_patch`.
+
+        :param AbstractList other: The list with the new values
+        :return: (start, stop, new value) of each range that differs
+        :rtype: list(tuple(int, int, object))
+        :raises ValueError: If the lists are not the same size
+        """
+        if len(other) != self._size:
+            raise ValueError(
+                f"Can not diff a list of size {len(other)} with one of "
+                f"size {self._size}")
+        patch: List[Tuple[int, int, T]] = []
+        for (start, stop, (value, new_value)) in _merge_ranges(
+                [self.iter_ranges(), other.iter_ranges()]):
+            if _eq(value, new_value):
+                continue
+            if patch and patch[-1][1] == start and _eq(
+                    patch[-1][2], new_value):
+                patch[-1] = (patch[-1][0], stop, patch[-1][2])
+            else:
+                patch.append((start, stop, new_value))
+        return patch
+
     @abstractmethod
     def iter_ranges(self) -> Iterator[Tuple[int, int, T]]:
         """
@@ -458,6 +725,29 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    def iter_ranges_by_slices(self, boundaries: Sequence[int]) -> Iterator[
+            List[Tuple[int, int, T]]]:
+        """
+        Fast but *not* update-safe iterator of the ranges of many slices,
+        such as those a partitioner splits a population into.
+
+        The ranges are read in a single pass, so all the slices cost
+        O(slices + ranges) rather than rescanning the ranges for each slice.
+
+        :param boundaries: The sorted IDs at which slices start and stop;
+            each slice runs from one boundary up to the next
+        :type boundaries: list(int)
+        :return: yields the list of the ranges of each slice in turn,
+            reduced to just the IDs inside the slice
+        :raises ValueError: If the boundaries are not sorted or out of range
+        """
+        boundaries = self._check_boundaries(boundaries)
+        if len(boundaries) < 2:
+            return iter(())
+        return _split_ranges(
+            self.iter_ranges_by_slice(boundaries[0], boundaries[-1]),
+            boundaries)
+
     def iter_ranges_by_ids(self, ids: IdsType) -> Iterator[
             Tuple[int, int, T]]:
         """
@@ -524,10 +814,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x + y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                array_operation=d_operation)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x + other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(a_list=self, operation=s_operation,
+                              array_operation=s_operation)
         raise TypeError("__add__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -548,10 +840,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x - y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                array_operation=d_operation)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x - other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(a_list=self, operation=s_operation,
+                              array_operation=s_operation)
         raise TypeError("__sub__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -572,10 +866,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x * y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                array_operation=d_operation)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x * other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(a_list=self, operation=s_operation,
+                              array_operation=s_operation)
         raise TypeError("__mul__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -597,12 +893,14 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x / y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                array_operation=d_operation)
         if is_number(other):
             if _is_zero(other):
                 raise ZeroDivisionError()
             s_operation: Callable[[Any], float] = lambda x: x / other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(a_list=self, operation=s_operation,
+                              array_operation=s_operation)
         raise TypeError("__truediv__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -621,12 +919,17 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], int] = lambda x, y: int(x // y)
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                array_operation=lambda x, y: numpy.floor_divide(
+                    x, y).astype(numpy.int64))
         if is_number(other):
             if _is_zero(other):
                 raise ZeroDivisionError()
             s_operation: Callable[[Any], int] = lambda x: int(x / other)
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(
+                a_list=self, operation=s_operation,
+                array_operation=lambda x: numpy.trunc(
+                    x / other).astype(numpy.int64))
         raise TypeError("__floordiv__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -645,18 +948,191 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         return SingleList(a_list=self, operation=operation)
 
+    def fuse(self) -> AbstractList[T]:
+        """
+        Compiles a chain of operations on lists into a single list that
+        evaluates the whole expression in one pass.
+
+        A list such as ``(a + b) * c - 1`` is normally evaluated by each
+        operation pulling values from the ones below it.
+        The fused list instead merges the ranges of all the underlying
+        lists (``a``, ``b`` and ``c``) at once and evaluates the whole
+        expression once per merged range.
+        If any of the underlying lists is not range based and all of them
+        hold numbers, the expression is instead evaluated with NumPy over
+        whole arrays.
+
+        As with the operations themselves, the values are created on the
+        fly so any changes to the original lists are reflected.
+
+        :return: new list, or this list if there is nothing to fuse
+        :rtype: AbstractList
+        """
+        return self
+
+    def _fuse(self, leaves: List[AbstractList]
+              ) -> Tuple[_Evaluator, Optional[_Evaluator]]:
+        """
+        Compiles this list as part of an expression being fused.
+
+        :param leaves:
+            The lists which are not operations found so far;
+            this list is added if it is a new one
+        :return: a function to evaluate the values of this list from one
+            value per leaf, and a function to do the same over arrays or
+            ``None`` if the values cannot be evaluated over arrays
+        """
+        for index, leaf in enumerate(leaves):
+            if leaf is self:
+                break
+        else:
+            index = len(leaves)
+            leaves.append(self)
+
+        def evaluate(values: Sequence[Any]) -> Any:
+            return values[index]
+        return evaluate, evaluate
+
+
+class _DerivedList(AbstractList[R], Generic[R], metaclass=AbstractBase):
+    """
+    A list whose values are computed from other lists.
+
+    Once all the ranges have been computed they are kept, and reused until
+    the version of one of the source lists changes.
+    """
+    __slots__ = [
+        "_cached_ranges", "_cached_stops", "_cached_version"]
+
+    def __init__(self, size: int, key: Optional[str] = None):
+        """
+        :param int size: Fixed length of the list
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        """
+        super().__init__(size=size, key=key)
+        self._cached_ranges: Optional[List[Tuple[int, int, R]]] = None
+        self._cached_stops: List[int] = []
+        self._cached_version: Optional[Hashable] = None
+
+    @abstractmethod
+    def _sources(self) -> Sequence[AbstractList]:
+        """
+        The lists the values of this list are computed from.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        """
+        Computes the ranges from the source lists, ignoring the cache.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _compute_ranges_by_slice(
+            self, slice_start: int, slice_stop: int
+            ) -> Iterator[Tuple[int, int, R]]:
+        """
+        Computes the ranges in the slice from the source lists, ignoring the
+        cache.
+        """
+        raise NotImplementedError
+
+    @property
+    @overrides(AbstractList.version)
+    def version(self) -> Optional[Hashable]:
+        versions = tuple(source.version for source in self._sources())
+        if any(version is None for version in versions):
+            return None
+        return versions
+
+    def _valid_cache(self) -> Optional[List[Tuple[int, int, R]]]:
+        """
+        The cached ranges, or ``None`` if there are none or they are out of
+        date.
+        """
+        if self._cached_ranges is None or \
+                self._cached_version != self.version:
+            return None
+        return self._cached_ranges
+
+    def _cached_range(self, the_id: int) -> Optional[Tuple[int, int, R]]:
+        """
+        The cached range which contains the ID, or ``None`` if the cache is
+        not valid.
+        """
+        ranges = self._valid_cache()
+        if ranges is None:
+            return None
+        return ranges[bisect_right(
+            self._cached_stops, self._check_id_in_range(the_id))]
+
+    @overrides(AbstractList.__iter__)
+    def __iter__(self) -> Iterator[R]:
+        if self.version is None:
+            yield from super().__iter__()
+            return
+        for (start, stop, value) in self.iter_ranges():
+            for _ in range(stop - start):
+                yield value
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[R]:
+        if self._valid_cache() is None:
+            return super().iter_by_slice(slice_start, slice_stop)
+        return (value
+                for (start, stop, value) in self.iter_ranges_by_slice(
+                    slice_start, slice_stop)
+                for _ in range(start, stop))
+
+    @overrides(AbstractList.iter_ranges)
+    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        version = self.version
+        if version is None:
+            return self._compute_ranges()
+        if self._cached_ranges is None or self._cached_version != version:
+            self._cached_ranges = list(self._compute_ranges())
+            self._cached_stops = [
+                stop for (_, stop, _) in self._cached_ranges]
+            self._cached_version = version
+        return iter(self._cached_ranges)
+
+    @overrides(AbstractList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(
+            self, slice_start: int, slice_stop: int
+            ) -> Iterator[Tuple[int, int, R]]:
+        ranges = self._valid_cache()
+        if ranges is None:
+            return self._compute_ranges_by_slice(slice_start, slice_stop)
+        return self.__slice_ranges(ranges, slice_start, slice_stop)
+
+    def __slice_ranges(
+            self, ranges: List[Tuple[int, int, R]], slice_start: int,
+            slice_stop: int) -> Iterator[Tuple[int, int, R]]:
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        for index in range(
+                bisect_right(self._cached_stops, slice_start), len(ranges)):
+            (start, stop, value) = ranges[index]
+            yield (max(start, slice_start), min(stop, slice_stop), value)
+            if slice_stop <= stop:
+                return
+
 
-class SingleList(AbstractList[R], Generic[T, R],
+class SingleList(_DerivedList[R], Generic[T, R],
                  metaclass=AbstractBase):
     """
     A List that performs an operation on the elements of another list.
     """
     __slots__ = [
-        "_a_list", "_operation"]
+        "_a_list", "_array_operation", "_operation"]
 
     def __init__(self, a_list: AbstractList[T],
                  operation: Callable[[T], R],
-                 key: Optional[str] = None):
+                 key: Optional[str] = None,
+                 array_operation: Optional[Callable[[Any], Any]] = None):
         """
         :param AbstractList a_list: The list to perform the operation on
         :param callable operation:
@@ -664,17 +1140,50 @@ class SingleList(AbstractList[R], Generic[T, R],
             the operation on that value
         :param key: The dict key this list covers.
             This is used only for better Exception messages
+        :param array_operation:
+            A function which does the same as `operation` but over a whole
+            array of numbers at once, used by :py:meth:`fuse`
         """
         super().__init__(size=len(a_list), key=key)
         self._a_list = a_list
         self._operation = operation
+        self._array_operation = array_operation
+
+    @overrides(AbstractList.fuse)
+    def fuse(self) -> AbstractList[R]:
+        return FusedList(self, key=self._key)
+
+    @overrides(AbstractList._fuse)  # pylint: disable=protected-access
+    def _fuse(self, leaves: List[AbstractList]
+              ) -> Tuple[_Evaluator, Optional[_Evaluator]]:
+        # pylint: disable=protected-access
+        inner, inner_array = self._a_list._fuse(leaves)
+        operation = self._operation
+
+        def evaluate(values: Sequence[Any]) -> Any:
+            return operation(inner(values))
+
+        array_operation = self._array_operation
+        if inner_array is None or array_operation is None:
+            return evaluate, None
+
+        def evaluate_array(arrays: Sequence[Any]) -> Any:
+            return array_operation(inner_array(arrays))
+        return evaluate, evaluate_array
 
     @overrides(AbstractList.range_based)
     def range_based(self) -> bool:
         return self._a_list.range_based()
 
+    @overrides(_DerivedList._sources)
+    def _sources(self) -> Sequence[AbstractList]:
+        return (self._a_list, )
+
     @overrides(AbstractList.get_value_by_id)
     def get_value_by_id(self, the_id: int) -> R:
+        cached = self._cached_range(the_id)
+        if cached is not None:
+            return cached[2]
         return self._operation(self._a_list.get_value_by_id(the_id))
 
     @overrides(AbstractList.get_single_value_by_slice)
@@ -687,8 +1196,8 @@ class SingleList(AbstractList[R], Generic[T, R],
     def get_single_value_by_ids(self, ids: IdsType) -> R:
         return self._operation(self._a_list.get_single_value_by_ids(ids))
 
-    @overrides(AbstractList.iter_ranges)
-    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
+    @overrides(_DerivedList._compute_ranges)
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
         for (start, stop, value) in self._a_list.iter_ranges():
             yield (start, stop, self._operation(value))
 
@@ -699,8 +1208,8 @@ class SingleList(AbstractList[R], Generic[T, R],
             return None
         return self._operation(default)
 
-    @overrides(AbstractList.iter_ranges_by_slice)
-    def iter_ranges_by_slice(
+    @overrides(_DerivedList._compute_ranges_by_slice)
+    def _compute_ranges_by_slice(
             self, slice_start: int, slice_stop: int
             ) -> Iterator[Tuple[int, int, R]]:
         for (start, stop, value) in \
@@ -708,17 +1217,18 @@ class SingleList(AbstractList[R], Generic[T, R],
             yield (start, stop, self._operation(value))
 
 
-class DualList(AbstractList[R], Generic[T, U, R],
+class DualList(_DerivedList[R], Generic[T, U, R],
                metaclass=AbstractBase):
     """
     A list which combines two other lists with an operation.
     """
     __slots__ = [
-        "_left", "_operation", "_right"]
+        "_array_operation", "_left", "_operation", "_right"]
 
-    def __init__(self, left: AbstractList[T], right: AbstractList[U],
-                 operation: Callable[[T, U], R],
-                 key: Optional[str] = None):
+    def __init__(
+            self, left: AbstractList[T], right: AbstractList[U],
+            operation: Callable[[T, U], R], key: Optional[str] = None,
+            array_operation: Optional[Callable[[Any, Any], Any]] = None):
         """
         :param AbstractList left: The first list to combine
         :param AbstractList right: The second list to combine
@@ -728,6 +1238,9 @@ class DualList(AbstractList[R], Generic[T, U, R],
         :param key:
             The dict key this list covers.
             This is used only for better Exception messages
+        :param array_operation:
+            A function which does the same as `operation` but over two whole
+            arrays of numbers at once, used by :py:meth:`fuse`
         :raises ValueError: If list are not the same size
         """
         if len(left) != len(right):
@@ -736,13 +1249,45 @@ class DualList(AbstractList[R], Generic[T, U, R],
         self._left = left
         self._right = right
         self._operation = operation
+        self._array_operation = array_operation
+
+    @overrides(AbstractList.fuse)
+    def fuse(self) -> AbstractList[R]:
+        return FusedList(self, key=self._key)
+
+    @overrides(AbstractList._fuse)  # pylint: disable=protected-access
+    def _fuse(self, leaves: List[AbstractList]
+              ) -> Tuple[_Evaluator, Optional[_Evaluator]]:
+        # pylint: disable=protected-access
+        left, left_array = self._left._fuse(leaves)
+        right, right_array = self._right._fuse(leaves)
+        operation = self._operation
+
+        def evaluate(values: Sequence[Any]) -> Any:
+            return operation(left(values), right(values))
+
+        array_operation = self._array_operation
+        if left_array is None or right_array is None or \
+                array_operation is None:
+            return evaluate, None
+
+        def evaluate_array(arrays: Sequence[Any]) -> Any:
+            return array_operation(left_array(arrays), right_array(arrays))
+        return evaluate, evaluate_array
 
     @overrides(AbstractList.range_based)
     def range_based(self) -> bool:
         return self._left.range_based() and self._right.range_based()
 
+    @overrides(_DerivedList._sources)
+    def _sources(self) -> Sequence[AbstractList]:
+        return (self._left, self._right)
+
     @overrides(AbstractList.get_value_by_id)
     def get_value_by_id(self, the_id: int) -> R:
+        cached = self._cached_range(the_id)
+        if cached is not None:
+            return cached[2]
         return self._operation(
             self._left.get_value_by_id(the_id),
             self._right.get_value_by_id(the_id))
@@ -763,6 +1308,9 @@ class DualList(AbstractList[R], Generic[T, U, R],
     @overrides(AbstractList.iter_by_slice)
     def iter_by_slice(
             self, slice_start: int, slice_stop: int) -> Iterator[R]:
+        if self._valid_cache() is not None:
+            yield from super().iter_by_slice(slice_start, slice_stop)
+            return
         slice_start, slice_stop = self._check_slice_in_range(
             slice_start, slice_stop)
         if self._left.range_based():
@@ -807,14 +1355,14 @@ class DualList(AbstractList[R], Generic[T, U, R],
                     except StopIteration:
                         return
 
-    @overrides(AbstractList.iter_ranges)
-    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
+    @overrides(_DerivedList._compute_ranges)
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
         left_iter = self._left.iter_ranges()
         right_iter = self._right.iter_ranges()
         return self._merge_ranges(left_iter, right_iter)
 
-    @overrides(AbstractList.iter_ranges_by_slice)
-    def iter_ranges_by_slice(
+    @overrides(_DerivedList._compute_ranges_by_slice)
+    def _compute_ranges_by_slice(
             self, slice_start: int, slice_stop: int) -> Iterator[
                 Tuple[int, int, R]]:
         left_iter = self._left.iter_ranges_by_slice(slice_start, slice_stop)
@@ -850,3 +1398,155 @@ class DualList(AbstractList[R], Generic[T, U, R],
         if r_default is None:
             return None
         return self._operation(l_default, r_default)
+
+
+class FusedList(_DerivedList[R], Generic[R]):
+    """
+    A list which evaluates a whole expression of operations over other lists
+    in one pass.
+
+    Created by :py:meth:`AbstractList.fuse`.
+    """
+    __slots__ = [
+        "_evaluate", "_evaluate_array", "_leaves"]
+
+    def __init__(self, expression: AbstractList[R],
+                 key: Optional[str] = None):
+        """
+        :param AbstractList expression: The list of operations to fuse
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        """
+        super().__init__(size=len(expression), key=key)
+        self._leaves: List[AbstractList] = []
+        self._evaluate, self._evaluate_array = expression._fuse(self._leaves)
+
+    def __to_array(self) -> Optional[NDArray]:
+        """
+        Evaluates the whole list with NumPy if worthwhile and possible.
+
+        :return: The array of values or ``None`` if it should be done range
+            by range
+        """
+        if self._evaluate_array is None:
+            return None
+        if all(leaf.range_based() for leaf in self._leaves):
+            return None
+        arrays = [leaf.to_numpy() for leaf in self._leaves]
+        if any(array.ndim != 1 or array.dtype.kind not in "biuf"
+               for array in arrays):
+            return None
+        # Python does arithmetic on bools as on ints, NumPy does not
+        arrays = [array.astype(numpy.int64) if array.dtype.kind == "b"
+                  else array for array in arrays]
+        # Anything NumPy would not do as Python does (such as dividing by
+        # zero) is left to be done the Python way
+        with numpy.errstate(all="raise"):
+            try:
+                result = numpy.asarray(self._evaluate_array(arrays))
+                if result.dtype.kind not in "iu":
+                    return result
+                # Integers wrap around silently when they overflow, so
+                # check against the same done with floats
+                check = numpy.asarray(self._evaluate_array(
+                    [array.astype(numpy.float64) for array in arrays]))
+            except (FloatingPointError, TypeError):
+                return None
+        if not (bool(numpy.all(numpy.abs(check) < _INT_LIMIT)) and
+                numpy.allclose(result, check, rtol=1e-6, atol=1)):
+            return None
+        return result
+
+    @overrides(AbstractList.range_based)
+    def range_based(self) -> bool:
+        return all(leaf.range_based() for leaf in self._leaves)
+
+    @overrides(_DerivedList._sources)
+    def _sources(self) -> Sequence[AbstractList]:
+        return self._leaves
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id: int) -> R:
+        cached = self._cached_range(the_id)
+        if cached is not None:
+            return cached[2]
+        return self._evaluate(
+            [leaf.get_value_by_id(the_id) for leaf in self._leaves])
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(
+            self, slice_start: int, slice_stop: int) -> R:
+        return self._evaluate(
+            [leaf.get_single_value_by_slice(slice_start, slice_stop)
+             for leaf in self._leaves])
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids: IdsType) -> R:
+        return self._evaluate(
+            [leaf.get_single_value_by_ids(ids) for leaf in self._leaves])
+
+    @overrides(AbstractList.__iter__)
+    def __iter__(self) -> Iterator[R]:
+        # Lists that can be cached are done through the cached ranges
+        array = None if self.version is not None else self.__to_array()
+        if array is not None:
+            yield from array.tolist()
+            return
+        for (start, stop, value) in self.iter_ranges():
+            for _ in range(stop - start):
+                yield value
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[R]:
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        array = None if self._valid_cache() is not None \
+            else self.__to_array()
+        if array is not None:
+            yield from array[slice_start:slice_stop].tolist()
+            return
+        for (start, stop, value) in \
+                self.iter_ranges_by_slice(slice_start, slice_stop):
+            for _ in range(start, stop):
+                yield value
+
+    @overrides(AbstractList.to_numpy)
+    def to_numpy(self, dtype: Optional[DTypeLike] = None,
+                 selector: Selector = None) -> NDArray:
+        array = self.__to_array()
+        if array is None:
+            return super().to_numpy(dtype, selector)
+        if selector is not None:
+            array = array[self.selector_to_ids(selector)]
+        return array.astype(dtype, copy=False) if dtype is not None else array
+
+    @overrides(_DerivedList._compute_ranges)
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        array = self.__to_array()
+        if array is not None:
+            return _array_ranges(array)
+        return self.__evaluate_ranges(_merge_ranges(
+            [leaf.iter_ranges() for leaf in self._leaves]))
+
+    @overrides(_DerivedList._compute_ranges_by_slice)
+    def _compute_ranges_by_slice(
+            self, slice_start: int, slice_stop: int
+            ) -> Iterator[Tuple[int, int, R]]:
+        return self.__evaluate_ranges(_merge_ranges(
+            [leaf.iter_ranges_by_slice(slice_start, slice_stop)
+             for leaf in self._leaves]))
+
+    def __evaluate_ranges(
+            self, merged: Iterator[Tuple[int, int, Tuple[Any, ...]]]
+            ) -> Iterator[Tuple[int, int, R]]:
+        evaluate = self._evaluate
+        for (start, stop, values) in merged:
+            yield (start, stop, evaluate(values))
+
+    @overrides(AbstractList.get_default)
+    def get_default(self) -> Optional[R]:
+        defaults = [leaf.get_default() for leaf in self._leaves]
+        if any(default is None for default in defaults):
+            return None
+        return self._evaluate(defaults)
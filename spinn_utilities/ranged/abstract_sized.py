@@ -16,9 +16,12 @@ from collections.abc import Sized
 import itertools
 import logging
 import sys
-from typing import Any, Optional, Sequence, SupportsInt, Tuple, Union
+from typing import (
+    Any, Iterable, List, Optional, Sequence, SupportsInt, Tuple, Union,
+    cast)
 from typing_extensions import TypeAlias, TypeGuard
 import numpy
+from numpy.typing import NDArray
 
 logger = logging.getLogger(__file__)
 
@@ -164,6 +167,72 @@ class AbstractSized(object):
                 "but the length was only %d. All the missing entries will be "
                 "ignored!", self._size, len(selector))
 
+    def _check_boundaries(self, boundaries: Iterable[int]) -> List[int]:
+        """
+        Check that slice boundaries are sorted IDs no more than the size.
+
+        :return: The boundaries as a list of int
+        :raises ValueError: If they are not
+        """
+        checked = [int(boundary) for boundary in boundaries]
+        if checked and not 0 <= checked[0] <= checked[-1] <= self._size:
+            raise ValueError(
+                f"The boundaries {checked[0]} to {checked[-1]} are not "
+                f"within the size {self._size}")
+        if any(stop < start for start, stop in zip(checked, checked[1:])):
+            raise ValueError(f"The boundaries {checked} are not sorted")
+        return checked
+
+    @staticmethod
+    def _is_contiguous(ids: Sequence[int]) -> TypeGuard[range]:
+        """
+        Check if the IDs are a non-empty run of consecutive IDs in order,
+        so can be handled as a slice.
+        """
+        return isinstance(ids, range) and ids.step == 1 and len(ids) > 0
+
+    @staticmethod
+    def __compact_ids(ids: NDArray[numpy.integer]) -> Sequence[int]:
+        """
+        Replaces IDs that are consecutive and in order with a range.
+        """
+        if len(ids) and ids[-1] - ids[0] == len(ids) - 1 and (
+                len(ids) == 1 or bool(numpy.all(numpy.diff(ids) == 1))):
+            return range(int(ids[0]), int(ids[-1]) + 1)
+        return cast(Sequence[int], ids)
+
+    def __array_to_ids(
+            self, selector: NDArray, warn: bool) -> Optional[Sequence[int]]:
+        """
+        Gets the IDs covered by a one dimensional array selector without
+        looking at each item in Python.
+
+        :return: The IDs, or ``None`` if the array is not of bool or int type
+        """
+        if selector.dtype.kind == "b":
+            if warn:
+                self._check_mask_size(selector)
+            return self.__compact_ids(
+                numpy.flatnonzero(selector[:self._size]))
+        if selector.dtype.kind not in "iu":
+            return None
+        if len(selector):
+            lowest = int(selector.min())
+            if lowest < 0:
+                raise TypeError(
+                    f"Selector includes the ID {lowest} which is "
+                    "less than zero")
+            highest = int(selector.max())
+            if highest >= self._size:
+                raise TypeError(
+                    f"Selector includes the ID {highest} which not "
+                    f"less than the size {self._size}")
+        ids = self.__compact_ids(selector)
+        if ids is selector:
+            # So later changes to the caller's array do not change the IDs
+            return cast(Sequence[int], selector.copy())
+        return ids
+
     def selector_to_ids(self, selector: Selector, warn=False) -> Sequence[int]:
         """
         Gets the list of IDs covered by this selector.
@@ -191,11 +260,20 @@ class AbstractSized(object):
             Original order and duplication is respected so result may be
             unordered and contain duplicates.
 
+        :py:class:`numpy.ndarray` of bool or int:
+            As for the iterators, but checked with NumPy rather than item by
+            item. The result is an array of int, or a :py:class:`range` if
+            the IDs are consecutive and in order.
+
         :param selector: Some object that identifies a range of IDs.
         :param bool warn:
             If True, this method will warn about problems with the selector.
         :return: a (possibly sorted) list of IDs
         """
+        if isinstance(selector, numpy.ndarray) and selector.ndim == 1:
+            ids = self.__array_to_ids(selector, warn)
+            if ids is not None:
+                return ids
         if _is_iterable_selector(selector):
             # bool is subclass of int so if any are bool all must be
             if any(isinstance(item, (bool, numpy.bool_)) for item in selector):
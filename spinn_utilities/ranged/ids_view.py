@@ -15,6 +15,7 @@ from __future__ import annotations
 from typing import (
     Dict, Generic, Iterable, Iterator, Optional, Sequence, Tuple,
     overload, TYPE_CHECKING, Union)
+import numpy
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, _StrSeq, _Keys
 from .abstract_list import IdsType
@@ -24,21 +25,24 @@ if TYPE_CHECKING:
 
 
 class _IdsView(AbstractView[T], Generic[T]):
-    __slots__ = ("_ids", )
+    __slots__ = ("_ids", "_id_tuple")
 
     def __init__(self, range_dict: RangeDictionary[T], ids: IdsType):
         """
         Use :py:meth:`RangeDictionary.view_factory` to create views
         """
         super().__init__(range_dict)
-        self._ids = tuple(ids)
+        # A private read only copy so the IDs can be passed on without copying
+        self._ids = numpy.array(ids, dtype=numpy.intp)
+        self._ids.flags.writeable = False
+        self._id_tuple = tuple(self._ids.tolist())
 
     def __str__(self) -> str:
-        return f"View with IDs: {self._ids}"
+        return f"View with IDs: {self._id_tuple}"
 
     @overrides(AbstractDict.ids)
     def ids(self) -> Sequence[int]:
-        return self._ids
+        return self._id_tuple
 
     @overload
     def get_value(self, key: str) -> T:
@@ -67,9 +71,9 @@ class _IdsView(AbstractView[T], Generic[T]):
     @overrides(AbstractDict.set_value)
     def set_value(
             self, key: str, value: T, use_list_as_value: bool = False):
-        ranged_list = self._range_dict.get_list(key)
-        for _id in self._ids:
-            ranged_list.set_value_by_id(the_id=_id, value=value)
+        # As for a single ID, the value is given to every ID even if a list
+        self._range_dict.get_list(key).set_value_by_ids(
+            ids=self._ids, value=value, use_list_as_value=True)
 
     def set_value_by_ids(self, key: str, ids: Iterable[int], value: T):
         """
@@ -79,9 +83,9 @@ class _IdsView(AbstractView[T], Generic[T]):
         :param iter(int) ids:
         :param value:
         """
-        rl = self._range_dict[key]
-        for _id in ids:
-            rl.set_value_by_id(the_id=_id, value=value)
+        # The value is given to every ID even if it is a list
+        self._range_dict[key].set_value_by_ids(
+            ids=list(ids), value=value, use_list_as_value=True)
 
     @overload
     def iter_all_values(self, key: str, update_safe=False) -> Iterator[T]:
@@ -94,12 +98,10 @@ class _IdsView(AbstractView[T], Generic[T]):
 
     @overrides(AbstractDict.iter_all_values)
     def iter_all_values(self, key: _Keys, update_safe: bool = False):
-        if isinstance(key, str):
-            yield from self._range_dict.iter_values_by_ids(
-                ids=self._ids, key=key, update_safe=update_safe)
-        else:
-            for _id in self._ids:
-                yield self._range_dict.get_values_by_id(key, _id)
+        # Several keys are merged range by range, so as for the whole
+        # dictionary, all the IDs in a range share a dictionary
+        yield from self._range_dict.iter_values_by_ids(
+            ids=self._ids, key=key, update_safe=update_safe)
 
     @overload
     def iter_ranges(self, key: str) -> Iterator[Tuple[int, int, T]]:
@@ -12,14 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import os
+import pickle
+from concurrent.futures import Executor
 from typing import (
-    Dict, Generator, Iterable, Iterator, Optional, Sequence, Tuple, Union,
-    Generic, overload, TYPE_CHECKING)
-from typing_extensions import TypeAlias
+    Any, Callable, Dict, Generator, Iterable, Iterator, List, Literal,
+    Optional, Sequence, Tuple, Union, Generic, cast, overload,
+    TYPE_CHECKING)
+import numpy
+from numpy.typing import NDArray
+from typing_extensions import Self, TypeAlias
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, T, _StrSeq
 from .abstract_sized import AbstractSized
-from .abstract_list import IdsType
+from .abstract_list import (
+    IdsType, _merge_ranges as _merge_range_iters, _split_ranges)
 from .ids_view import _IdsView
 from .ranged_list import RangedList
 from .single_view import _SingleView
@@ -33,6 +40,52 @@ _Keys: TypeAlias = Union[None, str, _StrSeq]
 _Range: TypeAlias = Tuple[int, int, T]
 _SimpleRangeIter: TypeAlias = Iterator[_Range]
 _CompoundRangeIter: TypeAlias = Iterator[Tuple[int, int, Dict[str, T]]]
+_TupleRangeIter: TypeAlias = Iterator[Tuple[int, int, Tuple[T, ...]]]
+
+#: The file in a saved dictionary holding everything except the arrays
+_INDEX_FILE = "index.pickle"
+
+
+def _typed_values(values: List[Any]) -> Optional[NDArray]:
+    """
+    Puts the values into a typed array if that can be done without changing
+    any value.
+
+    :return: The array or ``None`` if the values need a value table
+    """
+    if not values:
+        return None
+    value_type = type(values[0])
+    if value_type not in (bool, int, float, str) and \
+            not issubclass(value_type, numpy.generic):
+        return None
+    if any(type(value) is not value_type for value in values):
+        return None
+    array = numpy.array(values)
+    if array.ndim != 1 or array.dtype.kind not in "biufU":
+        return None
+    return array
+
+
+def _interned_values(values: List[Any]) -> Tuple[NDArray, List[Any]]:
+    """
+    Puts each different value into a table once.
+
+    :return: The index into the table of each value, and the table
+    """
+    table: List[Any] = []
+    lookup: Dict[Tuple[type, Any], int] = {}
+    indices: List[int] = []
+    for value in values:
+        try:
+            index = lookup.setdefault((type(value), value), len(table))
+        except TypeError:
+            # Values that can not be hashed are each kept separately
+            index = len(table)
+        if index == len(table):
+            table.append(value)
+        indices.append(index)
+    return numpy.array(indices, dtype=numpy.int64), table
 
 
 class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
@@ -79,6 +132,24 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
         """
         return RangedList(size, value, key)
 
+    def _list_like(self, key: str, values: RangedList[T]) -> RangedList[T]:
+        """
+        Makes a list of the type given by :py:meth:`list_factory` holding
+        the values and default of another list.
+
+        The storage is shared with the other list where possible.
+
+        :param str key: The dict key the list covers
+        :param RangedList values: The list to take the values from
+        :rtype: RangedList
+        """
+        first = next(values.iter_ranges(), None)
+        new_list = self.list_factory(
+            self._size, cast(T, None) if first is None else first[2], key)
+        new_list.copy_into(values)
+        new_list.set_default(values.get_default())
+        return new_list
+
     def view_factory(self, key: _KeyType) -> AbstractView:
         """
         Main function for creating views.
@@ -120,25 +191,30 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
             # Slice is really a list of integers - change it and continue below
             key = range(self._size)[key]
 
-        # Key can only now be an int iterable so make it a list and check
-        key = list(key)
-        if not all(isinstance(x, int) for x in key):
+        # Key can only now be an int iterable so make it an array and check
+        if isinstance(key, range):
+            ids = numpy.arange(key.start, key.stop, key.step)
+        elif isinstance(key, (list, tuple, numpy.ndarray)):
+            ids = numpy.asarray(key)
+        else:
+            ids = numpy.asarray(list(key))
+        if ids.ndim != 1 or ids.dtype.kind not in "iu" or len(ids) == 0:
             raise KeyError("Only list/tuple of int are supported")
 
         # Key is really just a single int - return single view
-        if len(key) == 1:
-            return _SingleView(range_dict=self, the_id=key[0])
+        if len(ids) == 1:
+            return _SingleView(range_dict=self, the_id=int(ids[0]))
 
         # Key is really just a slice (i.e. one of each key in order without
         # holes) - return a slice view
-        if len(key) == key[-1] - key[0] + 1:
-            in_order = sorted(key)
-            if in_order == key:
-                return _SliceView(
-                    range_dict=self, start=key[0], stop=key[-1] + 1)
+        first = int(ids[0])
+        last = int(ids[-1])
+        if len(ids) == last - first + 1 and bool(
+                numpy.all(numpy.diff(ids) == 1)):
+            return _SliceView(range_dict=self, start=first, stop=last + 1)
 
         # Random jumble of int values - return an IDs view
-        return _IdsView(range_dict=self, ids=key)
+        return _IdsView(range_dict=self, ids=ids)
 
     @overload
     def __getitem__(self, key: str) -> RangedList[T]: ...
@@ -355,6 +431,33 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
         else:
             raise KeyError(f"Unexpected key type: {type(key)}")
 
+    def set_value_from_function(
+            self, key: str, function: Callable[[Any], T], *,
+            vectorised: bool = False, executor: Optional[Executor] = None,
+            chunk_size: int = 65536):
+        """
+        Sets the values of a key by calling a function for every ID.
+
+        See :py:meth:`RangedList.from_function` for how the function is
+        called.
+
+        :param str key: Existing or *new* dictionary key
+        :param function: Gives the value for an ID, or if vectorised, the
+            values for an array of IDs
+        :type function: ~collections.abc.Callable[[int], object]
+        :param bool vectorised: True if the function takes an array of IDs
+        :param executor: The pool to evaluate the IDs in, if any
+        :type executor: ~concurrent.futures.Executor or None
+        :param int chunk_size: The number of IDs to evaluate at a time
+        """
+        new_list: RangedList[T] = RangedList.from_function(
+            self._size, function, key=key, vectorised=vectorised,
+            executor=executor, chunk_size=chunk_size)
+        if key in self:
+            self._value_lists[key].copy_into(new_list)
+        else:
+            self._value_lists[key] = self._list_like(key, new_list)
+
     @overrides(AbstractDict.ids)
     def ids(self) -> Sequence[int]:
         """
@@ -376,32 +479,90 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
     def _merge_ranges(
             self, range_iters: Dict[str, Iterator[Tuple[int, int, T]]]
             ) -> Iterator[Tuple[int, int, Dict[str, T]]]:
-        current: Dict[str, T] = dict()
-        ranges: Dict[str, Tuple[int, int, T]] = dict()
-        start = 0
-        stop = self._size
-        keys = range_iters.keys()
-        for key in keys:
-            ranges[key] = next(range_iters[key])
-            start = ranges[key][0]
-            current[key] = ranges[key][2]
-            stop = min(ranges[key][1], stop)
-        yield (start, stop, current)
-        while stop < self._size:
-            current = dict()
-            start = self._size
-            next_stop = self._size
-            for key in keys:
-                try:
-                    if ranges[key][1] == stop:
-                        ranges[key] = next(range_iters[key])
-                except StopIteration:
-                    return
-                start = min(max(ranges[key][0], stop), start)
-                next_stop = min(ranges[key][1], next_stop)
-                current[key] = ranges[key][2]
-            stop = next_stop
-            yield (start, stop, current)
+        keys = list(range_iters.keys())
+        for (start, stop, values) in self._merge_tuples(
+                list(range_iters.values())):
+            yield (start, stop, dict(zip(keys, values)))
+
+    def _merge_tuples(
+            self, range_iters: Sequence[Iterator[Tuple[int, int, T]]]
+            ) -> _TupleRangeIter:
+        """
+        Merges the ranges of several keys with a heap, so each range costs
+        O(log k) for k keys rather than O(k).
+        """
+        if not range_iters:
+            return iter([(0, self._size, ())])
+        return _merge_range_iters(range_iters)
+
+    def iter_ranges_as_tuples(
+            self, key: Optional[_StrSeq] = None,
+            slice_start: Optional[int] = None,
+            slice_stop: Optional[int] = None) -> _TupleRangeIter:
+        """
+        Same as :py:meth:`iter_ranges` for several keys, but yields the
+        values of each range as a tuple in the order of the keys rather than
+        as a new dictionary.
+
+        :param key: The keys in the order of the values;
+            if ``None``, all keys in the order of :py:meth:`keys`
+        :type key: iterable(str) or None
+        :param slice_start: Inclusive i.e. first ID; if ``None``, the start
+        :param slice_stop: Exclusive to last ID + 1; if ``None``, the end
+        :return: yields (start, stop, values) with one value per key
+        """
+        if key is None:
+            key = list(self.keys())
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if slice_start == 0 and slice_stop == self._size:
+            return self._merge_tuples([
+                self._value_lists[a_key].iter_ranges() for a_key in key])
+        return self._merge_tuples([
+            self._value_lists[a_key].iter_ranges_by_slice(
+                slice_start=slice_start, slice_stop=slice_stop)
+            for a_key in key])
+
+    def ranges_to_records(
+            self, key: Optional[_StrSeq] = None,
+            slice_start: Optional[int] = None,
+            slice_stop: Optional[int] = None
+            ) -> Tuple[NDArray, NDArray, NDArray]:
+        """
+        Gets the ranges of several keys as NumPy arrays.
+
+        The values are a structured array with one field per key, so each
+        range is a single record rather than a dictionary.
+
+        :param key: The keys in the order of the fields;
+            if ``None``, all keys in the order of :py:meth:`keys`
+        :type key: iterable(str) or None
+        :param slice_start: Inclusive i.e. first ID; if ``None``, the start
+        :param slice_stop: Exclusive to last ID + 1; if ``None``, the end
+        :return: The starts, the stops and the values of the ranges
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        if key is None:
+            key = list(self.keys())
+        else:
+            key = list(key)
+        starts: List[int] = []
+        stops: List[int] = []
+        columns: List[List[Any]] = [[] for _ in key]
+        for (start, stop, values) in self.iter_ranges_as_tuples(
+                key, slice_start, slice_stop):
+            starts.append(start)
+            stops.append(stop)
+            for column, value in zip(columns, values):
+                column.append(value)
+        arrays = [numpy.array(column) for column in columns]
+        records = numpy.empty(len(starts), dtype=[
+            (a_key, array.dtype, array.shape[1:])
+            for a_key, array in zip(key, arrays)])
+        for a_key, array in zip(key, arrays):
+            records[a_key] = array
+        return (numpy.array(starts, dtype=numpy.intp),
+                numpy.array(stops, dtype=numpy.intp), records)
 
     @overload
     def iter_ranges(self, key: str) -> Iterator[Tuple[int, int, T]]:
@@ -489,6 +650,71 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
                 slice_start=slice_start, slice_stop=slice_stop)
             for a_key in key})
 
+    @overload
+    def iter_ranges_by_slices(
+            self, boundaries: Sequence[int],
+            key: str) -> Iterator[List[_Range]]:
+        ...
+
+    @overload
+    def iter_ranges_by_slices(
+            self, boundaries: Sequence[int],
+            key: Optional[_StrSeq] = None) -> Iterator[
+                List[Tuple[int, int, Dict[str, T]]]]:
+        ...
+
+    def iter_ranges_by_slices(self, boundaries: Sequence[int], key=None):
+        """
+        Same as :py:meth:`iter_ranges_by_slice` for many slices at once,
+        reading the ranges in a single pass.
+
+        See :py:meth:`AbstractList.iter_ranges_by_slices`
+
+        :param boundaries: The sorted IDs at which slices start and stop;
+            each slice runs from one boundary up to the next
+        :type boundaries: list(int)
+        :param key: see :py:meth:`iter_ranges` parameter ``key``
+        :return: yields the list of the ranges of each slice in turn
+        """
+        if isinstance(key, str):
+            return self._value_lists[key].iter_ranges_by_slices(boundaries)
+        boundaries = self._check_boundaries(boundaries)
+        if len(boundaries) < 2:
+            return iter(())
+        return _split_ranges(self.iter_ranges_by_slice(
+            key, boundaries[0], boundaries[-1]), boundaries)
+
+    def partition(self, boundaries: Sequence[int]) -> List[RangeDictionary[T]]:
+        """
+        Splits this dictionary into an independent dictionary for each slice,
+        for example so each can be sent to a different worker process.
+
+        The IDs of each new dictionary start at 0 for the start of its slice.
+        The ranges of each key are read in a single pass.
+
+        :param boundaries: The sorted IDs at which slices start and stop;
+            each slice runs from one boundary up to the next
+        :type boundaries: list(int)
+        :return: A dictionary for each slice in turn
+        :rtype: list(RangeDictionary)
+        :raises ValueError: If the boundaries are not sorted or out of range
+        """
+        boundaries = self._check_boundaries(boundaries)
+        parts: List[RangeDictionary[T]] = [
+            RangeDictionary(stop - start)
+            for start, stop in zip(boundaries, boundaries[1:])]
+        for key, ranged_list in self._value_lists.items():
+            for part, start, ranges in zip(
+                    parts, boundaries,
+                    ranged_list.iter_ranges_by_slices(boundaries)):
+                new_list = self.list_factory(len(part), cast(T, None), key)
+                new_list.apply_patch([
+                    (range_start - start, range_stop - start, value)
+                    for (range_start, range_stop, value) in ranges])
+                new_list.set_default(ranged_list.get_default())
+                part[key] = new_list
+        return parts
+
     @overload
     def iter_ranges_by_ids(
             self, ids: IdsType, key: str) -> _SimpleRangeIter:
@@ -518,6 +744,192 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
             a_key: self._value_lists[a_key].iter_ranges_by_ids(ids=ids)
             for a_key in key})
 
+    def sum(self, key: str) -> Any:
+        """
+        Adds up the values of a key over all IDs.
+
+        See :py:meth:`AbstractList.sum`
+
+        :param str key: The key to add up
+        """
+        return self._value_lists[key].sum()
+
+    def min(self, key: str) -> T:
+        """
+        Finds the smallest value of a key for any ID.
+
+        See :py:meth:`AbstractList.min`
+
+        :param str key: The key to search
+        """
+        return self._value_lists[key].min()
+
+    def max(self, key: str) -> T:
+        """
+        Finds the largest value of a key for any ID.
+
+        See :py:meth:`AbstractList.max`
+
+        :param str key: The key to search
+        """
+        return self._value_lists[key].max()
+
+    def mean(self, key: str) -> Any:
+        """
+        Finds the mean value of a key over all IDs.
+
+        See :py:meth:`AbstractList.mean`
+
+        :param str key: The key to average
+        """
+        return self._value_lists[key].mean()
+
+    def unique(self, key: str) -> List[T]:
+        """
+        Finds the different values of a key.
+
+        See :py:meth:`AbstractList.unique`
+
+        :param str key: The key to search
+        :rtype: list(object)
+        """
+        return self._value_lists[key].unique()
+
+    def value_counts(self, key: str) -> List[Tuple[T, int]]:
+        """
+        Counts the number of IDs with each different value of a key.
+
+        See :py:meth:`AbstractList.value_counts`
+
+        :param str key: The key to count
+        :rtype: list(tuple(object, int))
+        """
+        return self._value_lists[key].value_counts()
+
+    def diff(self, other: RangeDictionary[T]) -> Dict[str, List[_Range]]:
+        """
+        Finds the ranges of each key where another dictionary of the same
+        size has different values to this one.
+
+        :param RangeDictionary other: The dictionary with the new values
+        :return: The :py:meth:`AbstractList.diff` of each key which has
+            changed; keys which have not changed are left out
+        :rtype: dict(str, list(tuple(int, int, object)))
+        :raises KeyError: If the dictionaries do not have the same keys
+        :raises ValueError: If the dictionaries are not the same size
+        """
+        if set(self.keys()) != set(other.keys()):
+            raise KeyError(
+                f"Can not diff keys {sorted(other.keys())} with keys "
+                f"{sorted(self.keys())}")
+        patches = {}
+        for key, ranged_list in self._value_lists.items():
+            patch = ranged_list.diff(other.get_list(key))
+            if patch:
+                patches[key] = patch
+        return patches
+
+    def apply_patch(self, patches: Dict[str, Sequence[_Range]]):
+        """
+        Sets the values of the ranges of each key in the patches, such as
+        those returned by :py:meth:`diff`.
+
+        :param patches: The :py:meth:`RangedList.apply_patch` patch of each
+            key to change
+        :type patches: dict(str, list(tuple(int, int, object)))
+        :raises KeyError: If a key is not in this dictionary
+        """
+        for key, patch in patches.items():
+            self._value_lists[key].apply_patch(patch)
+
+    def to_structured_array(
+            self, keys: Optional[_StrSeq] = None) -> NDArray:
+        """
+        Get the values of all the IDs as a NumPy structured array with one
+        field per key.
+
+        Each field is filled using :py:meth:`AbstractList.to_numpy` so range
+        based keys do not create an object per ID.
+
+        :param keys: The keys to include, in the order of the fields;
+            if ``None``, all keys are included
+        :type keys: iterable(str) or None
+        :rtype: ~numpy.ndarray
+        """
+        if keys is None:
+            keys = list(self.keys())
+        columns = [self._value_lists[key].to_numpy() for key in keys]
+        result = numpy.empty(self._size, dtype=[
+            (key, column.dtype, column.shape[1:])
+            for key, column in zip(keys, columns)])
+        for key, column in zip(keys, columns):
+            result[key] = column
+        return result
+
+    def save(self, path: str):
+        """
+        Saves the dictionary in a columnar format to a directory.
+
+        Each key is saved as an array of the stops of its ranges and an
+        array of the values of the ranges.
+        Values which are all simple numbers or strings of one type are saved
+        as a typed array; others are saved as indices into a table of the
+        different values, which is pickled along with the defaults.
+
+        :param str path: The directory to save to; created if needed
+        """
+        os.makedirs(path, exist_ok=True)
+        index = []
+        for number, key in enumerate(self.keys()):
+            ranged_list = self._value_lists[key]
+            stops = []
+            values = []
+            for (_, stop, value) in ranged_list.iter_ranges():
+                stops.append(stop)
+                values.append(value)
+            array = _typed_values(values)
+            table = None
+            if array is None:
+                array, table = _interned_values(values)
+            numpy.save(os.path.join(path, f"{number}_stops.npy"),
+                       numpy.array(stops, dtype=numpy.int64))
+            numpy.save(os.path.join(path, f"{number}_values.npy"), array)
+            index.append((key, ranged_list.get_default(), table))
+        with open(os.path.join(path, _INDEX_FILE), "wb") as f:
+            pickle.dump({"size": self._size, "keys": index}, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> Self:
+        """
+        Loads a dictionary saved by :py:meth:`save`.
+
+        .. warning::
+            The value tables and defaults are unpickled, so only load
+            directories from a trusted source.
+
+        :param str path: The directory the dictionary was saved to
+        :param bool mmap:
+            If True the arrays are memory mapped rather than read, so nothing
+            is copied until a value is changed
+        :rtype: RangeDictionary
+        """
+        with open(os.path.join(path, _INDEX_FILE), "rb") as f:
+            index = pickle.load(f)
+        size = index["size"]
+        mmap_mode: Optional[Literal["r"]] = "r" if mmap else None
+        range_dict = cls(size)
+        for number, (key, default, table) in enumerate(index["keys"]):
+            stops = numpy.load(os.path.join(path, f"{number}_stops.npy"),
+                               mmap_mode=mmap_mode)
+            values = numpy.load(os.path.join(path, f"{number}_values.npy"),
+                                mmap_mode=mmap_mode)
+            ranged_list: RangedList[T] = RangedList.from_range_arrays(
+                size, stops, values, table=table, key=key)
+            ranged_list.set_default(default)
+            range_dict._value_lists[key] = range_dict._list_like(
+                key, ranged_list)
+        return range_dict
+
     def set_default(self, key: str, default: T):
         """
         Sets the default value for a single key.
@@ -563,6 +975,8 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
         """
         Make a copy of this dictionary. Inner ranged entities are deep copied,
         inner leaf values are shallow copied.
+        Each copied list shares its storage with the original until either
+        is changed, so copies that are never changed cost little.
 
         :return: The copy.
         :rtype: RangeDictionary
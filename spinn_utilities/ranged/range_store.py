@@ -0,0 +1,320 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import (
+    Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar)
+import numpy
+from numpy.typing import NDArray
+from typing_extensions import TypeAlias
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.overrides import overrides
+#: :meta private:
+T = TypeVar("T")
+#: The type of a range descriptor
+_RangeType: TypeAlias = Tuple[int, int, T]
+
+
+class AbstractRangeStore(Generic[T], metaclass=AbstractBase):
+    """
+    Holds the ranges of a range based
+    :py:class:`~spinn_utilities.ranged.RangedList`.
+
+    The ranges are kept in ID order and together cover every ID of the list
+    exactly once.
+    All lookups and updates are by ID rather than by position so that
+    implementations are free to organise the ranges however they like.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        The number of ranges held.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[_RangeType]:
+        """
+        Fast but *not* update-safe iterator of all the ranges.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_range(self, the_id: int) -> _RangeType:
+        """
+        Gets the range which contains the ID.
+
+        :param int the_id: An ID known to be in range
+        :rtype: tuple(int, int, object)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_from(self, the_id: int) -> Iterator[_RangeType]:
+        """
+        Fast but *not* update-safe iterator of the ranges starting with the
+        one which contains the ID.
+
+        :param int the_id: An ID known to be in range
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace(self, start: int, stop: int, new_ranges: List[_RangeType]):
+        """
+        Replaces all the ranges covering ``start`` up to ``stop`` with the
+        new ranges.
+
+        :param int start: The start of an existing range
+        :param int stop: The stop of an existing range
+        :param list(tuple(int, int, object)) new_ranges:
+            The ranges that replace the old ones;
+            these must cover exactly ``start`` up to ``stop``
+        """
+        raise NotImplementedError
+
+
+class ListRangeStore(AbstractRangeStore[T], Generic[T]):
+    """
+    Holds the ranges in a single Python list with a parallel list of the
+    range stops to search.
+
+    Lookups are O(log n) but updates move every range after the change, so
+    are O(n) in the number of ranges.
+    """
+    __slots__ = ("_ranges", "_stops")
+
+    def __init__(self, ranges: Iterable[_RangeType] = ()):
+        """
+        :param iterable(tuple(int, int, object)) ranges:
+            The ranges in ID order
+        """
+        self._ranges: List[_RangeType] = list(ranges)
+        self._stops = [stop for (_, stop, _) in self._ranges]
+
+    @overrides(AbstractRangeStore.__len__)
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    @overrides(AbstractRangeStore.__iter__)
+    def __iter__(self) -> Iterator[_RangeType]:
+        return iter(self._ranges)
+
+    @overrides(AbstractRangeStore.get_range)
+    def get_range(self, the_id: int) -> _RangeType:
+        return self._ranges[bisect_right(self._stops, the_id)]
+
+    @overrides(AbstractRangeStore.iter_from)
+    def iter_from(self, the_id: int) -> Iterator[_RangeType]:
+        ranges = self._ranges
+        for index in range(bisect_right(self._stops, the_id), len(ranges)):
+            yield ranges[index]
+
+    @overrides(AbstractRangeStore.replace)
+    def replace(self, start: int, stop: int, new_ranges: List[_RangeType]):
+        first = bisect_right(self._stops, start)
+        last = bisect_left(self._stops, stop) + 1
+        self._ranges[first:last] = new_ranges
+        self._stops[first:last] = [
+            range_stop for (_, range_stop, _) in new_ranges]
+
+
+class BlockedRangeStore(AbstractRangeStore[T], Generic[T]):
+    """
+    Holds the ranges in a list of blocks of bounded size, each with its own
+    list of stops, plus the last stop of every block.
+
+    Lookups are O(log n) and an update only rebuilds the blocks it touches,
+    so heavily fragmented lists do not pay for moving every range on every
+    change.
+    """
+    __slots__ = ("_blocks", "_block_stops", "_len", "_load", "_maxes")
+
+    def __init__(self, ranges: Iterable[_RangeType] = (), load: int = 512):
+        """
+        :param iterable(tuple(int, int, object)) ranges:
+            The ranges in ID order
+        :param int load: The target number of ranges in each block
+        """
+        self._load = load
+        self._blocks: List[List[_RangeType]] = []
+        self._block_stops: List[List[int]] = []
+        self._maxes: List[int] = []
+        self._len = 0
+        all_ranges = list(ranges)
+        self.__set_blocks(0, 0, all_ranges)
+
+    def __set_blocks(self, first: int, last: int, ranges: List[_RangeType]):
+        """
+        Replaces the blocks from ``first`` up to but not including ``last``
+        with new blocks holding the ranges.
+        """
+        if len(ranges) > 2 * self._load:
+            blocks = [ranges[i:i + self._load]
+                      for i in range(0, len(ranges), self._load)]
+        elif ranges:
+            blocks = [ranges]
+        else:
+            blocks = []
+        self._len += len(ranges) - sum(
+            len(block) for block in self._blocks[first:last])
+        self._blocks[first:last] = blocks
+        self._block_stops[first:last] = [
+            [stop for (_, stop, _) in block] for block in blocks]
+        self._maxes[first:last] = [block[-1][1] for block in blocks]
+
+    def __locate(self, the_id: int) -> Tuple[int, int]:
+        """
+        Finds the block, and the index in that block, of the range which
+        contains the ID.
+        """
+        block = bisect_right(self._maxes, the_id)
+        if block == len(self._blocks):
+            return block, 0
+        return block, bisect_right(self._block_stops[block], the_id)
+
+    @overrides(AbstractRangeStore.__len__)
+    def __len__(self) -> int:
+        return self._len
+
+    @overrides(AbstractRangeStore.__iter__)
+    def __iter__(self) -> Iterator[_RangeType]:
+        for block in self._blocks:
+            yield from block
+
+    @overrides(AbstractRangeStore.get_range)
+    def get_range(self, the_id: int) -> _RangeType:
+        block, index = self.__locate(the_id)
+        return self._blocks[block][index]
+
+    @overrides(AbstractRangeStore.iter_from)
+    def iter_from(self, the_id: int) -> Iterator[_RangeType]:
+        first, index = self.__locate(the_id)
+        blocks = self._blocks
+        for block in range(first, len(blocks)):
+            ranges = blocks[block]
+            for position in range(index, len(ranges)):
+                yield ranges[position]
+            index = 0
+
+    @overrides(AbstractRangeStore.replace)
+    def replace(self, start: int, stop: int, new_ranges: List[_RangeType]):
+        first_block, first = self.__locate(start)
+        last_block, last = self.__locate(stop - 1)
+
+        # Changes inside one block that leave it a reasonable size can be
+        # made in place
+        if first_block == last_block:
+            block = self._blocks[first_block]
+            change = len(new_ranges) - (last + 1 - first)
+            if self._load // 4 <= len(block) + change <= 2 * self._load:
+                block[first:last + 1] = new_ranges
+                self._block_stops[first_block][first:last + 1] = [
+                    range_stop for (_, range_stop, _) in new_ranges]
+                self._len += change
+                return
+
+        ranges = (self._blocks[first_block][:first] + new_ranges +
+                  self._blocks[last_block][last + 1:])
+
+        # Fold small blocks into the one before to stop them building up
+        if len(ranges) < self._load // 2 and first_block > 0:
+            first_block -= 1
+            ranges = self._blocks[first_block] + ranges
+        self.__set_blocks(first_block, last_block + 1, ranges)
+
+
+class ArrayRangeStore(AbstractRangeStore[T], Generic[T]):
+    """
+    Holds the ranges as an array of range stops and an array of values,
+    such as arrays memory mapped from a file.
+
+    The arrays are only ever read, so are not copied until the first
+    change, at which point the ranges are copied into a
+    :py:class:`ListRangeStore` which holds them from then on.
+    """
+    __slots__ = ("_copy", "_stops", "_table", "_values")
+
+    #: The number of ranges converted to Python objects at a time
+    _CHUNK = 4096
+
+    def __init__(self, stops: NDArray[numpy.integer], values: NDArray,
+                 table: Optional[Sequence[T]] = None):
+        """
+        :param ~numpy.ndarray stops: The stop of each range in ID order;
+            each range starts where the one before stops
+        :param ~numpy.ndarray values: The value of each range, or if there is
+            a table, the index into the table of the value of each range
+        :param table: The values indexed by ``values``, if any
+        :type table: list or None
+        """
+        self._stops = stops
+        self._values = values
+        self._table = table
+        self._copy: Optional[ListRangeStore[T]] = None
+
+    def __index(self, the_id: int) -> int:
+        return int(numpy.searchsorted(self._stops, the_id, side="right"))
+
+    def __values(self, first: int, last: int) -> List[T]:
+        values = self._values[first:last].tolist()
+        if self._table is None:
+            return values
+        table = self._table
+        return [table[index] for index in values]
+
+    def __iter_from_index(self, first: int) -> Iterator[_RangeType]:
+        stops = self._stops
+        start = int(stops[first - 1]) if first else 0
+        for chunk in range(first, len(stops), self._CHUNK):
+            chunk_stops = stops[chunk:chunk + self._CHUNK].tolist()
+            for stop, value in zip(chunk_stops, self.__values(
+                    chunk, chunk + len(chunk_stops))):
+                yield (start, stop, value)
+                start = stop
+
+    @overrides(AbstractRangeStore.__len__)
+    def __len__(self) -> int:
+        if self._copy is not None:
+            return len(self._copy)
+        return len(self._stops)
+
+    @overrides(AbstractRangeStore.__iter__)
+    def __iter__(self) -> Iterator[_RangeType]:
+        if self._copy is not None:
+            return iter(self._copy)
+        return self.__iter_from_index(0)
+
+    @overrides(AbstractRangeStore.get_range)
+    def get_range(self, the_id: int) -> _RangeType:
+        if self._copy is not None:
+            return self._copy.get_range(the_id)
+        index = self.__index(the_id)
+        start = int(self._stops[index - 1]) if index else 0
+        return (start, int(self._stops[index]),
+                self.__values(index, index + 1)[0])
+
+    @overrides(AbstractRangeStore.iter_from)
+    def iter_from(self, the_id: int) -> Iterator[_RangeType]:
+        if self._copy is not None:
+            return self._copy.iter_from(the_id)
+        return self.__iter_from_index(self.__index(the_id))
+
+    @overrides(AbstractRangeStore.replace)
+    def replace(self, start: int, stop: int, new_ranges: List[_RangeType]):
+        if self._copy is None:
+            self._copy = ListRangeStore(self.__iter_from_index(0))
+        self._copy.replace(start, stop, new_ranges)
@@ -13,15 +13,23 @@
 # limitations under the License.
 from __future__ import annotations
 from collections.abc import Sized
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
 from typing import (
     Any, Callable, Generic, List, Iterable, Iterator, Optional, Sequence,
     Tuple, Union, cast, final)
-from typing_extensions import TypeAlias, TypeGuard
+import numpy
+from numpy.typing import DTypeLike, NDArray
+from typing_extensions import Self, TypeAlias, TypeGuard
 from spinn_utilities.overrides import overrides
 from spinn_utilities.helpful_functions import is_singleton
 from .abstract_sized import Selector
-from .abstract_list import AbstractList, T, _eq, IdsType
+from .abstract_list import (
+    AbstractList, T, _array_ranges, _eq, IdsType, is_number)
 from .multiple_values_exception import MultipleValuesException
+from .range_store import (
+    AbstractRangeStore, ArrayRangeStore, ListRangeStore)
 
 #: The type of a range descriptor
 _RangeType: TypeAlias = Tuple[int, int, T]
@@ -29,6 +37,14 @@ _RangeType: TypeAlias = Tuple[int, int, T]
 _ListType: TypeAlias = Union[Callable[[int], T], Sequence[T]]
 # The type of value arguments in several places
 _ValueType: TypeAlias = Optional[Union[T, _ListType]]
+# The type of things that create a range store from ranges
+_StoreFactory: TypeAlias = Callable[
+    [Iterable[_RangeType]], AbstractRangeStore[T]]
+
+#: Suggested ratios of ranges to size below which a list switches to being
+#: range based, and above which it switches to holding a value per ID,
+#: for use as the ``compaction`` of a :py:class:`RangedList`
+DEFAULT_COMPACTION = (0.1, 0.5)
 
 
 def function_iterator(
@@ -56,17 +72,42 @@ def function_iterator(
         yield function(_id)
 
 
-class RangedList(AbstractList[T], Generic[T]):
+def _evaluate_ids(function: Callable[[Any], Any], vectorised: bool,
+                  start: int, stop: int) -> Union[List[Any], NDArray]:
+    """
+    Calls a function for the IDs from ``start`` up to ``stop``.
+
+    This is at module level so it can be sent to a process pool.
+
+    :return: The value for each ID
+    """
+    if not vectorised:
+        return [function(_id) for _id in range(start, stop)]
+    values = numpy.asarray(function(numpy.arange(start, stop)))
+    if values.shape[:1] != (stop - start, ):
+        raise ValueError(
+            f"The function returned {values.shape} values for "
+            f"{stop - start} IDs")
+    return values
+
+
+class RangedList(  # pylint: disable=too-many-instance-attributes
+        AbstractList[T], Generic[T]):
     """
     A list that is able to efficiently hold large numbers of elements
     that all have the same value.
     """
     __slots__ = [
-        "_default", "_ranged_based", "_ranges"]
+        "_changes", "_compaction", "_default", "_dtype", "_range_store",
+        "_ranged_based", "_ranges", "_sharers", "_version"]
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
             self, size: Optional[int] = None, value: _ValueType = None,
-            key=None, use_list_as_value=False):
+            key=None, use_list_as_value=False,
+            dtype: Optional[DTypeLike] = None,
+            range_store: Optional[_StoreFactory] = None,
+            compaction: Optional[Tuple[float, float]] = None):
         """
         :param size:
             Fixed length of the list;
@@ -77,6 +118,29 @@ class RangedList(AbstractList[T], Generic[T]):
         :param key: The dict key this list covers.
             This is used only for better Exception messages
         :param bool use_list_as_value: True if the value *is* a list
+        :param dtype:
+            If not ``None``, values set per ID are held in a
+            :py:class:`numpy.ndarray` of this type rather than a Python list.
+            Only suitable for numeric values.
+        :type dtype: ~numpy.typing.DTypeLike or None
+        :param range_store:
+            Creates the store of the ranges, when range based, from an
+            iterable of ranges. Defaults to :py:class:`ListRangeStore`;
+            :py:class:`BlockedRangeStore` suits lists which become heavily
+            fragmented.
+        :type range_store:
+            ~collections.abc.Callable[[iterable(tuple(int,int,object))],
+            AbstractRangeStore] or None
+        :param compaction:
+            The ratio of ranges to size below which a list holding a value
+            per ID switches to being range based, and the ratio above which
+            a range based list switches to a value per ID.
+            The gap between the two stops a list switching back and forth.
+            The switch is made lazily, on the first read after enough
+            changes. By default (``None``) a list never switches
+            automatically; :py:data:`DEFAULT_COMPACTION` is a suitable
+            choice otherwise.
+        :type compaction: tuple(float, float) or None
         """
         if size is None:
             try:
@@ -90,8 +154,17 @@ class RangedList(AbstractList[T], Generic[T]):
             self._default: Optional[T] = cast(Optional[T], value)
         else:
             self._default = None
-        self._ranges: Union[List[T], List[_RangeType]]
+        self._dtype = dtype
+        self._range_store: _StoreFactory = range_store or ListRangeStore
+        self._compaction = compaction
+        # The number of IDs set since the representation was last checked
+        self._changes = 0
+        self._version = 0
+        self._ranges: Union[List[T], AbstractRangeStore[T], NDArray]
         self._ranged_based: Optional[bool] = None
+        # The number of lists sharing the storage, shared by all of them, or
+        # None if the storage is not shared
+        self._sharers: Optional[List[int]] = None
         self.set_value(value, use_list_as_value=use_list_as_value)
 
     def __length(self, value: Any) -> int:
@@ -101,34 +174,142 @@ class RangedList(AbstractList[T], Generic[T]):
             return 1
         return len(value)
 
+    @property
+    @overrides(AbstractList.version)
+    def version(self) -> int:
+        return self._version
+
     @overrides(AbstractList.range_based)
     def range_based(self) -> bool:
+        if self._changes:
+            self.__adapt()
         return self._ranged_based or False
 
+    def __adapt(self):
+        """
+        Switches between being range based and holding a value per ID if the
+        ratio of ranges to size has crossed the compaction thresholds.
+        """
+        if self._compaction is None:
+            return
+        low, high = self._compaction
+        if self._ranged_based:
+            self._changes = 0
+            if len(self.__the_ranges) > high * self._size:
+                self.__to_values()
+            return
+
+        # Counting ranges of values is expensive so wait for enough changes
+        if self._changes < low * self._size:
+            return
+        self._changes = 0
+        ranges: List[_RangeType] = []
+        for a_range in self.__value_ranges():
+            ranges.append(a_range)
+            if len(ranges) >= low * self._size:
+                return
+        self.__release()
+        self._ranges = self._range_store(ranges)
+        self._ranged_based = True
+
+    def __release(self):
+        """
+        Stops sharing the storage with any copies, before it is replaced.
+        """
+        if self._sharers is not None:
+            self._sharers[0] -= 1
+            self._sharers = None
+
+    def __own(self):
+        """
+        Makes sure the storage is not shared with any copies, before it is
+        changed in place.
+
+        The last list sharing the storage keeps it; the others each take a
+        copy of their own.
+        """
+        if self._sharers is None:
+            return
+        shared = self._sharers[0] > 1
+        self.__release()
+        if not shared:
+            return
+        if isinstance(self._ranges, numpy.ndarray):
+            self._ranges = self._ranges.copy()
+        elif self._ranged_based:
+            self._ranges = self._range_store(self.__the_ranges)
+        else:
+            self._ranges = self.__the_values.copy()
+
+    def __to_values(self):
+        """
+        Switches a range based list to holding a value per ID.
+        """
+        ranges = list(self.__the_ranges)
+        if self._dtype is None:
+            self.__release()
+            self._ranges = self._values_store([
+                value for (start, stop, value) in ranges
+                for _ in range(start, stop)])
+        else:
+            # Stay range based if the values do not suit the type
+            try:
+                values = numpy.array(
+                    [value for (_, _, value) in ranges], dtype=self._dtype)
+            except (TypeError, ValueError):
+                return
+            if values.ndim != 1:
+                return
+            self.__release()
+            self._ranges = numpy.repeat(
+                values, [stop - start for (start, stop, _) in ranges])
+        self._ranged_based = False
+
+    def _values_store(self, values: List[T]) -> List[T]:
+        """
+        Holds the values of a list with a value per ID that are not held in
+        an array.
+
+        Subclasses may hold the values in some other way, as long as it can
+        be indexed, sliced, assigned to by index and copied like a list.
+
+        :param list values: A value for each ID, which may be kept
+        :return: The values to hold
+        """
+        return values
+
     @property
-    def __the_ranges(self) -> List[_RangeType]:
+    def __the_ranges(self) -> AbstractRangeStore[T]:
         assert self._ranged_based
-        return cast(List[_RangeType], self._ranges)
+        return cast(AbstractRangeStore[T], self._ranges)
 
     @property
     def __the_values(self) -> List[T]:
         assert not self._ranged_based
         return cast(List[T], self._ranges)
 
+    @property
+    def __the_array(self) -> Optional[NDArray]:
+        """
+        The values if held in a NumPy array, otherwise ``None``.
+        """
+        if isinstance(self._ranges, numpy.ndarray):
+            return self._ranges
+        return None
+
     @overrides(AbstractList.get_value_by_id)
     def get_value_by_id(self, the_id: int) -> T:
         the_id = self._check_id_in_range(the_id)
+        if self._changes:
+            self.__adapt()
 
         # If range based, find the range containing the value and return
         if self._ranged_based:
-            for (_, stop, value) in self.__the_ranges:
-                if the_id < stop:
-                    return value  # pragma: no cover
-
-            # Must never get here because the ID is in range
-            raise ValueError  # pragma: no cover
+            return self.__the_ranges.get_range(the_id)[2]
 
         # Non-range-based so just return the value
+        if self.__the_array is not None:
+            return self.__the_array[the_id].item()
         return self.__the_values[the_id]
 
     @overrides(AbstractList.get_single_value_by_slice)
@@ -136,38 +317,31 @@ class RangedList(AbstractList[T], Generic[T]):
             self, slice_start: int, slice_stop: int) -> T:
         slice_start, slice_stop = self._check_slice_in_range(
             slice_start, slice_stop)
+        if self._changes:
+            self.__adapt()
 
         # If the list is formed of ranges...
         if self._ranged_based:
-            found_value = False
-            result = None
-
-            # Go through the ranges until in range (assumed sorted)
-            for (_, stop, value) in self.__the_ranges:
-
-                # If we have found a range in the slice
-                if slice_start < stop:
-
-                    # If we have already found a range in the slice, check the
-                    # value is the same
-                    if found_value:
-                        if not _eq(result, value):
-                            raise MultipleValuesException(
-                                self._key, result, value)
-
-                    # If this is the first range in the slice, store it
-                    else:
-                        result = value
-                        found_value = True
-
-                    # If we have found a range that finishes outside of the
-                    # slice, we have done, and can safely return the value
-                    if slice_stop <= stop:
-                        return value
-
-            # This must be never possible, as the slices must be in range of
-            # the list
-            raise ValueError  # pragma: no cover
+            # Every range up to the one holding the last ID must match
+            ranges = self.__the_ranges.iter_from(slice_start)
+            (_, _, result) = next(ranges)
+            for (start, _, value) in ranges:
+                if start >= slice_stop:
+                    break
+                if not _eq(result, value):
+                    raise MultipleValuesException(self._key, result, value)
+            return result
+
+        # An array can be checked in one go
+        array = self.__the_array
+        if array is not None:
+            values = array[slice_start:slice_stop]
+            different = numpy.flatnonzero(values != values[0])
+            if len(different):
+                raise MultipleValuesException(
+                    self._key, values[0].item(),
+                    values[different[0]].item())
+            return values[0].item()
 
         # A non-range based list just has lots of single values, so check
         # they are all the same within the slice
@@ -182,12 +356,102 @@ class RangedList(AbstractList[T], Generic[T]):
         # Take the first ID, and then simply check all the others are the same
         # This works for both range-based and non-range-based
         result = self.get_value_by_id(ids[0])
-        for id_value in ids[1:]:
-            value = self.get_value_by_id(id_value)
+        for (_, _, value) in self.iter_ranges_by_ids(ids):
             if not _eq(result, value):
                 raise MultipleValuesException(self._key, result, value)
         return result
 
+    def __lookup(self, ids: NDArray[numpy.intp]) -> Tuple[
+            Optional[NDArray], Callable[[int], T]]:
+        """
+        Finds the values of a collection of IDs.
+
+        :param ~numpy.ndarray ids: Checked IDs
+        :return: An array which is the same for two IDs only if they have
+            the same value (or ``None`` if not known), and a function giving
+            the value of the ID at a position in ``ids``
+        """
+        if not self._ranged_based:
+            array = self.__the_array
+            if array is not None:
+                values = array[ids]
+
+                def array_value(position: int) -> T:
+                    return values[position].item()
+                return values, array_value
+
+            the_values = self.__the_values
+
+            def list_value(position: int) -> T:
+                return the_values[ids[position]]
+            return None, list_value
+
+        store = self.__the_ranges
+        # Looking up a few IDs one by one is cheaper than listing the ranges
+        if len(ids) * 8 < len(store):
+            found = [store.get_range(the_id) for the_id in ids.tolist()]
+            starts = numpy.array([start for (start, _, _) in found])
+
+            def found_value(position: int) -> T:
+                return found[position][2]
+            return starts, found_value
+
+        ranges = list(store)
+        stops = numpy.fromiter((stop for (_, stop, _) in ranges),
+                               dtype=numpy.intp, count=len(ranges))
+        index = numpy.searchsorted(stops, ids, side="right")
+
+        def range_value(position: int) -> T:
+            return ranges[index[position]][2]
+        return index, range_value
+
+    @overrides(AbstractList.iter_by_ids)
+    def iter_by_ids(self, ids: IdsType) -> Iterator[T]:
+        if self._changes:
+            self.__adapt()
+        id_array = self.__check_ids(ids)
+        array = self.__the_array
+        if array is not None:
+            yield from array[id_array].tolist()
+            return
+        _, value_of = self.__lookup(id_array)
+        for position in range(len(id_array)):
+            yield value_of(position)
+
+    @overrides(AbstractList.iter_ranges_by_ids)
+    def iter_ranges_by_ids(self, ids: IdsType) -> Iterator[_RangeType]:
+        if self._changes:
+            self.__adapt()
+        id_array = self.__check_ids(ids)
+        if len(id_array) == 0:
+            return
+        keys, value_of = self.__lookup(id_array)
+
+        # Split where the IDs are not consecutive or the value may change
+        changes = numpy.diff(id_array) != 1
+        if keys is None:
+            changes[:] = True
+        else:
+            changes |= keys[1:] != keys[:-1]
+        breaks = numpy.flatnonzero(changes) + 1
+        firsts = numpy.concatenate(([0], breaks)).tolist()
+        stops = (id_array[numpy.concatenate(
+            (breaks - 1, [len(id_array) - 1]))] + 1).tolist()
+
+        # Runs next to each other with equal values are still joined
+        result: Optional[_RangeType] = None
+        for first, stop in zip(firsts, stops):
+            start = int(id_array[first])
+            value = value_of(first)
+            if result is not None:
+                if result[1] == start and _eq(result[2], value):
+                    result = (result[0], stop, result[2])
+                    continue
+                yield result
+            result = (start, stop, value)
+        if result is not None:
+            yield result
+
     def __iter__(self) -> Iterator[T]:
         """
         Fast but *not* update-safe iterator of all elements.
@@ -197,10 +461,14 @@ class RangedList(AbstractList[T], Generic[T]):
 
         :return: yields each element one by one
         """
+        if self._changes:
+            self.__adapt()
         if self._ranged_based:
             for (start, stop, value) in self.__the_ranges:
                 for _ in range(stop - start):
                     yield value
+        elif self.__the_array is not None:
+            yield from self.__the_array.tolist()
         else:
             for value in self.__the_values:
                 yield value
@@ -209,85 +477,100 @@ class RangedList(AbstractList[T], Generic[T]):
     def iter_by_slice(self, slice_start: int, slice_stop: int) -> Iterator[T]:
         slice_start, slice_stop = self._check_slice_in_range(
             slice_start, slice_stop)
+        if self._changes:
+            self.__adapt()
 
         # If non-range-based, just go through the values
         if not self._ranged_based:
-            yield from self.__the_values[slice_start: slice_stop]
+            if self.__the_array is not None:
+                yield from self.__the_array[slice_start: slice_stop].tolist()
+            else:
+                yield from self.__the_values[slice_start: slice_stop]
             return
 
         # Range-based, so go through the ranges that intersect the slice
-
-        # Find the first range within the slice
-        ranges = self.iter_ranges()
-        (start, stop, value) = next(ranges)
-        while stop < slice_start:
-            (start, stop, value) = next(ranges)
-
-        # Continue until outside of the slice
-        while start < slice_stop:
-            first = max(start, slice_start)
-            end_point = min(stop, slice_stop)
-            for _ in range(end_point - first):
+        if slice_start >= slice_stop:
+            return
+        for (start, stop, value) in self.__the_ranges.iter_from(slice_start):
+            for _ in range(max(start, slice_start), min(stop, slice_stop)):
                 yield value
-            try:
-                (start, stop, value) = next(ranges)
-            except StopIteration:
+            if slice_stop <= stop:
                 return
 
     @overrides(AbstractList.iter_ranges)
     def iter_ranges(self) -> Iterator[_RangeType]:
+        if self._changes:
+            self.__adapt()
+
         # If range based just yield the ranges
         if self._ranged_based:
             yield from self.__the_ranges
             return
+        yield from self.__value_ranges()
+
+    def __value_ranges(self) -> Iterator[_RangeType]:
+        """
+        Builds the ranges of a list holding a value per ID.
+        """
+        # If held in an array, build the ranges in one pass
+        if self.__the_array is not None:
+            yield from _array_ranges(self.__the_array)
+            return
 
         # If non-range based, build the ranges
-        previous_value = self.__the_values[0]
-        previous_start = 0
-        current_start = 0
-        current_value = None
-        any_value = False
-        for start, value in enumerate(self.__the_values):
-            current_start = start
-            current_value = value
+        yield from self._value_ranges(0, self._size)
+
+    def _value_ranges(
+            self, slice_start: int, slice_stop: int) -> Iterator[_RangeType]:
+        """
+        Builds the ranges of a slice of a list with a value per ID that are
+        not held in an array.
+
+        :param int slice_start: The first ID
+        :param int slice_stop: The ID after the last one
+        :return: yields each range one by one
+        """
+        if slice_start >= slice_stop:
+            return
+        values = self.__the_values
+        previous_value = values[slice_start]
+        previous_start = slice_start
+        for index, value in enumerate(values[slice_start: slice_stop]):
             if not _eq(value, previous_value):
-                yield (previous_start, start, previous_value)
-                previous_start = start
+                # Index is one ahead so no need for a + 1 here
+                yield (previous_start, slice_start + index, previous_value)
+                previous_start = slice_start + index
                 previous_value = value
-            any_value = True
-        if any_value:
-            yield (previous_start, current_start + 1, cast(T, current_value))
+        yield (previous_start, slice_stop, previous_value)
 
     @overrides(AbstractList.iter_ranges_by_slice)
     def iter_ranges_by_slice(
             self, slice_start: int, slice_stop: int) -> Iterator[_RangeType]:
         slice_start, slice_stop = self._check_slice_in_range(
             slice_start, slice_stop)
+        if self._changes:
+            self.__adapt()
 
         # If range-based, go through ranges that intersect the slice
         if self._ranged_based:
-            for (start, stop, value) in self.__the_ranges:
-                if slice_start < stop:
-
-                    # The range is updated so that the start and stop values
-                    # are within the slice requested
-                    yield (max(start, slice_start), min(stop, slice_stop),
-                           value)
-                    if slice_stop <= stop:
-                        break
+            for (start, stop, value) in self.__the_ranges.iter_from(
+                    slice_start):
+
+                # The range is updated so that the start and stop values
+                # are within the slice requested
+                yield (max(start, slice_start), min(stop, slice_stop), value)
+                if slice_stop <= stop:
+                    break
+            return
+
+        # If held in an array, build the ranges in one pass
+        if self.__the_array is not None:
+            yield from _array_ranges(
+                self.__the_array[slice_start:slice_stop], slice_start)
             return
 
         # If non-range based, just go through the values
-        previous_value = self.__the_values[slice_start]
-        previous_start = slice_start
-        for index, value in enumerate(
-                self.__the_values[slice_start: slice_stop]):
-            if not _eq(value, previous_value):
-                # Index is one ahead so no need for a + 1 here
-                yield (previous_start, slice_start + index, previous_value)
-                previous_start = slice_start + index
-                previous_value = value
-        yield (previous_start, slice_stop, previous_value)
+        yield from self._value_ranges(slice_start, slice_stop)
 
     # pylint: disable=unused-argument
     @final
@@ -339,6 +622,18 @@ class RangedList(AbstractList[T], Generic[T]):
                              f"does not equal the size:{size}")
         return values
 
+    def __as_array(self, value: _ListType, size: int,
+                   ids: Optional[IdsType] = None) -> NDArray:
+        """
+        As :py:meth:`as_list` but returns an array of this list's type.
+        """
+        if isinstance(value, numpy.ndarray):
+            if len(value) != size:
+                raise ValueError(f"The number of values:{len(value)} "
+                                 f"does not equal the size:{size}")
+            return numpy.array(value, dtype=self._dtype)
+        return numpy.array(self.as_list(value, size, ids), dtype=self._dtype)
+
     def set_value(self, value: _ValueType, use_list_as_value=False):
         """
         Sets *all* elements in the list to this value.
@@ -350,16 +645,25 @@ class RangedList(AbstractList[T], Generic[T]):
         :param use_list_as_value: True if the value to be set *is* a list
         """
 
+        self.__release()
         # If the value to set is a list, just copy the values
         if not use_list_as_value and self.is_list(value, self._size):
-            self._ranges = self.as_list(value, self._size)
+            if self._dtype is None:
+                self._ranges = self._values_store(
+                    self.as_list(value, self._size))
+            else:
+                self._ranges = self.__as_array(value, self._size)
             self._ranged_based = False
+            self._changes = self._size
+            self._version += 1
 
         # Otherwise store the value directly assuming it is the same value
         # for all items
         else:
-            self._ranges = [(0, self._size, value)]
+            self._ranges = self._range_store([(0, self._size, value)])
             self._ranged_based = True
+            self._changes = 0
+            self._version += 1
 
     def set_value_by_id(self, the_id: int, value: T):
         """
@@ -374,51 +678,21 @@ class RangedList(AbstractList[T], Generic[T]):
         :param object value: The value to save
         """
         the_id = self._check_id_in_range(the_id)
+        self._changes += 1
 
         # If non-range-based, set the value directly
         if not self._ranged_based:
+            self.__own()
             self.__the_values[the_id] = value
-            return
-
-        # Find the range in which to set the value
-        for idx, (start, stop, old_value) in enumerate(self.__the_ranges):
-            if the_id < stop:
-                break
-        else:
+            self._version += 1
             return
 
         # If already set as needed, do nothing
-        if _eq(value, old_value):
+        if _eq(value, self.__the_ranges.get_range(the_id)[2]):
             return
-
-        ranges = self.__the_ranges
-
-        # Split the ID out of the range
-        ranges[idx] = (the_id, the_id + 1, value)
-
-        # Need a new range after the ID
-        if the_id + 1 < stop:
-            ranges.insert(idx + 1, (the_id + 1, stop, old_value))
-
-        # Need a new range before the ID
-        if the_id > start:
-            ranges.insert(idx, (start, the_id, old_value))
-
-        # If not at the last range, update the start and stop value of
-        # the next range
-        if idx < len(ranges) - 1:
-            if _eq(ranges[idx][2], ranges[idx + 1][2]):
-                ranges[idx] = (
-                    ranges[idx][0], ranges[idx + 1][1], ranges[idx + 1][2])
-                ranges.pop(idx + 1)
-
-        # If not at the first range, update the start and stop value
-        # of the first range
-        if idx > 0:
-            if _eq(ranges[idx][2], ranges[idx - 1][2]):
-                ranges[idx - 1] = (
-                    ranges[idx - 1][0], ranges[idx][1], ranges[idx][2])
-                ranges.pop(idx)
+        self._version += 1
+        self.__own()
+        self.__set_range(the_id, the_id + 1, value)
 
     def set_value_by_slice(
             self, slice_start: int, slice_stop: int, value: _ValueType,
@@ -444,85 +718,213 @@ class RangedList(AbstractList[T], Generic[T]):
         if not use_list_as_value and self.is_list(
                 value, size=slice_stop - slice_start):
             return self._set_values_list(range(slice_start, slice_stop), value)
+        self._changes += slice_stop - slice_start
+        self._version += 1
+        self.__own()
 
         # If non-ranged-based, set the values directly
+        if self.__the_array is not None:
+            self.__the_array[slice_start:slice_stop] = value
+            return
         if not self._ranged_based:
             for id_value in range(slice_start, slice_stop):
                 self.__the_values[id_value] = cast(T, value)
             return
 
-        # Skip ranges before start of slice
-        ranges = self.__the_ranges
-        index = 0
-        while index < len(ranges) - 1 and ranges[index][1] <= slice_start:
-            index += 1
-
-        # Strip off start of first range in case needed
-        (_start, _stop, old_value) = ranges[index]
-
-        # If the slice to set starts after the current range,
-        # we may need a new range before the key
-        if slice_start > _start:
-
-            # If the values are different, add a new range with the old value
-            if not _eq(value, old_value):
-                ranges.insert(index, (_start, slice_start, old_value))
-
-                # We have added a value so move on one
-                index += 1
-
-                # Change start of old range but leave value for now
-                ranges[index] = (slice_start, _stop, old_value)
-                (_start, _stop, old_value) = ranges[index]
+        self.__set_range(slice_start, slice_stop, cast(T, value))
 
-            # Existing already has this value so start the slice to set
-            # at the start of this range
+    def __set_range(self, slice_start: int, slice_stop: int, value: T):
+        """
+        Sets a non-empty slice of a range based list to a single value.
+        """
+        # Find the first and last ranges that overlap the slice
+        ranges = self.__the_ranges
+        (span_start, _, first_value) = ranges.get_range(slice_start)
+        (_, span_stop, last_value) = ranges.get_range(slice_stop - 1)
+
+        # Keep the part of the first range before the slice, unless it can
+        # be merged, in which case the merged range starts earlier
+        new_ranges: List[_RangeType] = []
+        if slice_start > span_start:
+            if _eq(value, first_value):
+                slice_start = span_start
             else:
-                slice_start = _start
-
-        # Merge with next if overlaps with that one
-        while slice_stop > _stop:
-            (_start, _stop, old_value) = ranges.pop(index + 1)
-            ranges[index] = (slice_start, _stop, old_value)
+                new_ranges.append((span_start, slice_start, first_value))
+        elif span_start > 0:
+            (previous_start, _, previous_value) = ranges.get_range(
+                span_start - 1)
+            if _eq(previous_value, value):
+                slice_start = span_start = previous_start
+
+        # Likewise for the part of the last range after the slice
+        tail: List[_RangeType] = []
+        if slice_stop < span_stop:
+            if _eq(value, last_value):
+                slice_stop = span_stop
+            else:
+                tail.append((slice_stop, span_stop, last_value))
+        elif span_stop < self._size:
+            (_, next_stop, next_value) = ranges.get_range(span_stop)
+            if _eq(next_value, value):
+                slice_stop = span_stop = next_stop
 
-        # Split off end of merged range if required
-        if slice_stop < _stop:
-            ranges[index] = (slice_start, slice_stop, old_value)
-            ranges.insert(index+1, (slice_stop, _stop, old_value))
+        new_ranges.append((slice_start, slice_stop, value))
+        new_ranges.extend(tail)
+        ranges.replace(span_start, span_stop, new_ranges)
 
-        # merge with previous if same value
-        if index > 0 and _eq(ranges[index-1][2], value):
-            ranges[index-1] = (ranges[index-1][0], slice_stop, value)
-            ranges.pop(index)
-            index -= 1
+    def __check_ids(self, ids: IdsType) -> NDArray[numpy.intp]:
+        """
+        Checks the type and range of a collection of IDs.
 
-        # merge with next if same value
-        if index < len(ranges) - 1 and _eq(ranges[index+1][2], value):
-            ranges[index] = (ranges[index][0], ranges[index + 1][1], value)
-            ranges.pop(index + 1)
+        :return: The IDs as an array
+        """
+        array = numpy.asarray(ids)
+        if len(array) == 0:
+            return array.astype(numpy.intp)
+        if array.dtype.kind not in "iu":
+            raise TypeError(f"Invalid argument type {array.dtype}.")
+        for bad in (array.min(), array.max()):
+            if not 0 <= bad < self._size:
+                raise IndexError(f"The index {bad} is out of range.")
+        return array.astype(numpy.intp, copy=False)
+
+    def __last_writes(
+            self, ids: IdsType) -> Tuple[NDArray[numpy.intp], NDArray]:
+        """
+        Sorts the IDs, dropping all but the last occurrence of any repeats.
 
-        # set the value in case missed elsewhere
-        ranges[index] = (ranges[index][0], ranges[index][1], value)
+        :return: The sorted unique IDs, and for each the index into ``ids``
+            of its last occurrence
+        """
+        array = self.__check_ids(ids)
+        if len(array) == 0:
+            return array, array
+        order = numpy.argsort(array, kind="stable")
+        sorted_ids = array[order]
+        last = numpy.append(sorted_ids[1:] != sorted_ids[:-1], True)
+        return sorted_ids[last], order[last]
+
+    def __set_runs(self, runs: List[_RangeType]):
+        """
+        Sets the values of sorted, non-overlapping runs of IDs in one sweep
+        over the ranges they touch.
+        """
+        if not runs:
+            return
+        self.__own()
+        ranges = self.__the_ranges
+        span_start = ranges.get_range(runs[0][0])[0]
+        span_stop = ranges.get_range(runs[-1][1] - 1)[1]
+        new_ranges: List[_RangeType] = []
+        old_ranges = ranges.iter_from(span_start)
+        (_, stop, old_value) = next(old_ranges)
+        pos = span_start
+        for (run_start, run_stop, run_value) in runs + [
+                (span_stop, span_stop, None)]:
+            # Keep the old values up to the start of the run
+            while pos < run_start:
+                while stop <= pos:
+                    (_, stop, old_value) = next(old_ranges)
+                end = min(stop, run_start)
+                self.__append_range(new_ranges, pos, end, old_value)
+                pos = end
+            if run_start < run_stop:
+                self.__append_range(new_ranges, run_start, run_stop, run_value)
+                pos = run_stop
+
+        # Merge with the untouched ranges on either side if possible
+        if span_start > 0:
+            (previous_start, _, previous_value) = ranges.get_range(
+                span_start - 1)
+            if _eq(previous_value, new_ranges[0][2]):
+                new_ranges[0] = (
+                    previous_start, new_ranges[0][1], previous_value)
+                span_start = previous_start
+        if span_stop < self._size:
+            (_, next_stop, next_value) = ranges.get_range(span_stop)
+            if _eq(next_value, new_ranges[-1][2]):
+                new_ranges[-1] = (
+                    new_ranges[-1][0], next_stop, new_ranges[-1][2])
+                span_stop = next_stop
+        ranges.replace(span_start, span_stop, new_ranges)
+
+    @staticmethod
+    def __append_range(
+            ranges: List[_RangeType], start: int, stop: int, value: T):
+        if ranges and _eq(ranges[-1][2], value):
+            ranges[-1] = (ranges[-1][0], stop, ranges[-1][2])
+        else:
+            ranges.append((start, stop, value))
 
     def _set_values_list(self, ids: IdsType, value: _ListType):
+        self._changes += len(ids)
+        self._version += 1
+        self.__own()
+        array = self.__the_array
+        if array is not None:
+            array[self.__check_ids(ids)] = self.__as_array(
+                value, len(ids), ids)
+            return
         values = self.as_list(value=value, size=len(ids), ids=ids)
-        for id_value, val in zip(ids, values):
-            self.set_value_by_id(id_value, val)
+        if not self._ranged_based:
+            for id_value, val in zip(self.__check_ids(ids).tolist(), values):
+                self.__the_values[id_value] = val
+            return
+
+        # Group the IDs into runs of consecutive IDs with the same value
+        runs: List[_RangeType] = []
+        unique_ids, indices = self.__last_writes(ids)
+        for the_id, index in zip(unique_ids.tolist(), indices.tolist()):
+            val = values[index]
+            if runs and runs[-1][1] == the_id and _eq(runs[-1][2], val):
+                runs[-1] = (runs[-1][0], the_id + 1, runs[-1][2])
+            else:
+                runs.append((the_id, the_id + 1, val))
+        self.__set_runs(runs)
 
     def set_value_by_ids(
             self, ids: IdsType, value: _ValueType, use_list_as_value=False):
         """
         Sets a already existing key to the new value. For the ids specified.
 
+        The IDs are sorted and grouped into runs of consecutive IDs so that
+        the ranges are rebuilt once rather than once per ID.
+        If an ID is repeated the last value given for it is kept.
+
         :param str key:
         :type ids: iter(int) or numpy.array
         :param value:
         """
         if not use_list_as_value and self.is_list(value, len(ids)):
             self._set_values_list(ids, value)
-        else:
-            for id_value in ids:
-                self.set_value_by_id(id_value, cast(T, value))
+            return
+        if len(ids) == 1:
+            self.set_value_by_id(ids[0], cast(T, value))
+            return
+        self._changes += len(ids)
+        self._version += 1
+        self.__own()
+        if not self._ranged_based:
+            checked = self.__check_ids(ids)
+            array = self.__the_array
+            if array is not None:
+                array[checked] = value
+            else:
+                for id_value in checked.tolist():
+                    self.__the_values[id_value] = cast(T, value)
+            return
+
+        # Find the runs of consecutive IDs
+        unique_ids, _ = self.__last_writes(ids)
+        if len(unique_ids) == 0:
+            return
+        breaks = numpy.flatnonzero(numpy.diff(unique_ids) != 1) + 1
+        starts = unique_ids[numpy.concatenate(([0], breaks))]
+        stops = unique_ids[numpy.concatenate(
+            (breaks - 1, [len(unique_ids) - 1]))] + 1
+        self.__set_runs([
+            (start, stop, cast(T, value))
+            for start, stop in zip(starts.tolist(), stops.tolist())])
 
     def set_value_by_selector(
             self, selector: Selector, value: _ValueType,
@@ -546,11 +948,51 @@ class RangedList(AbstractList[T], Generic[T]):
                 return
 
         ids = self.selector_to_ids(selector)
+        if self._is_contiguous(ids):
+            self.set_value_by_slice(
+                ids.start, ids.stop, value,
+                use_list_as_value=use_list_as_value)
+            return
         self.set_value_by_ids(
             ids=ids, value=value, use_list_as_value=use_list_as_value)
 
     __setitem__ = set_value_by_selector
 
+    def apply_patch(self, patch: Sequence[_RangeType]):
+        """
+        Sets the values of the ranges in a patch, such as one returned by
+        :py:meth:`diff`.
+
+        Each value is used as is, even if it is a list.
+        A range based list is updated in one sweep over the ranges touched.
+
+        :param patch: (start, stop, value) of each range to set, sorted and
+            not overlapping
+        :type patch: list(tuple(int, int, object))
+        :raises ValueError: If the ranges are not sorted or overlap
+        """
+        runs: List[_RangeType] = []
+        last_stop = 0
+        for (start, stop, value) in patch:
+            start, stop = self._check_slice_in_range(start, stop)
+            if start < last_stop:
+                raise ValueError(
+                    f"The patch range {start}:{stop} overlaps or is before "
+                    "the one before it")
+            if start < stop:
+                runs.append((start, stop, value))
+                last_stop = stop
+        if not runs:
+            return
+        if not self._ranged_based:
+            for (start, stop, value) in runs:
+                self.set_value_by_slice(
+                    start, stop, value, use_list_as_value=True)
+            return
+        self._changes += sum(stop - start for (start, stop, _) in runs)
+        self._version += 1
+        self.__set_runs(runs)
+
     def get_ranges(self) -> List[_RangeType]:
         """
         Returns a copy of the list of ranges.
@@ -560,10 +1002,231 @@ class RangedList(AbstractList[T], Generic[T]):
 
         :rtype: list(tuple(int,int,object))
         """
-        if self._ranged_based:
-            return list(self.__the_ranges)
         return list(self.iter_ranges())
 
+    @overrides(AbstractList.to_numpy)
+    def to_numpy(self, dtype: Optional[DTypeLike] = None,
+                 selector: Selector = None) -> NDArray:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is None:
+            return super().to_numpy(dtype, selector)
+        if selector is None:
+            return numpy.array(array, dtype=dtype)
+        if isinstance(selector, slice):
+            return numpy.array(array[selector], dtype=dtype)
+        return numpy.array(
+            array[numpy.asarray(self.selector_to_ids(selector),
+                                dtype=numpy.intp)], dtype=dtype)
+
+    @classmethod
+    def from_numpy(
+            cls, values: NDArray, key=None,
+            range_store: Optional[_StoreFactory] = None,
+            compaction: Optional[Tuple[float, float]] = None
+            ) -> Self:
+        """
+        Creates a range based list from the values in an array.
+
+        The array is run-length encoded in a single vectorised pass.
+
+        :param ~numpy.ndarray values: A one dimensional array of values
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :param range_store: See :py:class:`RangedList`
+        :param compaction: See :py:class:`RangedList`
+        :rtype: RangedList
+        """
+        values = numpy.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(
+                f"Only one dimensional arrays are supported "
+                f"not {values.ndim} dimensions")
+        ranged_list = cls(len(values), key=key, range_store=range_store,
+                          compaction=compaction)
+        if len(values):
+            ranged_list._ranges = ranged_list._range_store(
+                _array_ranges(values))
+            ranged_list._changes = len(values)
+            ranged_list._version += 1
+        return ranged_list
+
+    @classmethod
+    def from_function(
+            cls, size: int, function: Callable[[Any], Any], key=None, *,
+            vectorised: bool = False, executor: Optional[Executor] = None,
+            chunk_size: int = 65536, dtype: Optional[DTypeLike] = None,
+            range_store: Optional[_StoreFactory] = None,
+            compaction: Optional[Tuple[float, float]] = None
+            ) -> Self:
+        """
+        Creates a list by calling a function for every ID.
+
+        The IDs are split into chunks which, if an executor is given, are
+        evaluated in parallel.
+        If the function is vectorised it is called once per chunk with an
+        array of the IDs and must return an array of the values.
+        The results are run-length encoded, in a single vectorised pass if
+        the function is vectorised, or otherwise by merging equal
+        neighbours.
+        If compaction is given and there are too many ranges for it, the
+        values are instead held one per ID.
+
+        .. note::
+            To use a process pool the function must be picklable, so a
+            module level function rather than a lambda.
+
+        :param int size: Fixed length of the list
+        :param function: Gives the value for an ID, or if vectorised, the
+            values for an array of IDs
+        :type function: ~collections.abc.Callable[[int], object]
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :param bool vectorised: True if the function takes an array of IDs
+        :param executor: The pool to evaluate the chunks in, or ``None`` to
+            evaluate them in this thread
+        :type executor: ~concurrent.futures.Executor or None
+        :param int chunk_size: The number of IDs to evaluate at a time
+        :param dtype: See :py:class:`RangedList`
+        :param range_store: See :py:class:`RangedList`
+        :param compaction: See :py:class:`RangedList`
+        :rtype: RangedList
+        """
+        starts = range(0, size, chunk_size)
+        stops = [min(start + chunk_size, size) for start in starts]
+        evaluate = partial(_evaluate_ids, function, vectorised)
+        if executor is None:
+            results = list(map(evaluate, starts, stops))
+        else:
+            results = list(executor.map(evaluate, starts, stops))
+        if vectorised and results:
+            array = numpy.concatenate(results)
+            if array.ndim != 1:
+                raise ValueError(
+                    f"Only one dimensional values are supported "
+                    f"not {array.ndim} dimensions")
+            runs = 1 + int(numpy.count_nonzero(array[1:] != array[:-1]))
+            if compaction is None or runs <= compaction[0] * size:
+                ranged_list = cls.from_numpy(
+                    array, key=key, range_store=range_store,
+                    compaction=compaction)
+                ranged_list._dtype = dtype
+                return ranged_list
+            return cls(size, array.tolist() if dtype is None else array,
+                       key=key, dtype=dtype, range_store=range_store,
+                       compaction=compaction)
+
+        values = list(chain.from_iterable(results))
+        ranges: List[_RangeType] = []
+        for the_id, value in enumerate(values):
+            cls.__append_range(ranges, the_id, the_id + 1, value)
+        if not ranges or (
+                compaction is not None and
+                len(ranges) > compaction[0] * size):
+            return cls(size, values, key=key, dtype=dtype,
+                       range_store=range_store, compaction=compaction)
+        ranged_list = cls(size, key=key, range_store=range_store,
+                          compaction=compaction)
+        ranged_list._ranges = ranged_list._range_store(ranges)
+        ranged_list._changes = size
+        ranged_list._version += 1
+        ranged_list._dtype = dtype
+        return ranged_list
+
+    @classmethod
+    def from_range_arrays(
+            cls, size: int, stops: NDArray[numpy.integer], values: NDArray,
+            table: Optional[Sequence[T]] = None, key=None) -> Self:
+        """
+        Creates a range based list whose ranges are held in arrays, without
+        copying them.
+
+        The arrays may be memory mapped; they are only read.
+        See :py:class:`ArrayRangeStore`.
+
+        :param int size: Fixed length of the list
+        :param ~numpy.ndarray stops: The stop of each range in ID order;
+            the last must be the size
+        :param ~numpy.ndarray values: The value of each range, or if there is
+            a table, the index into the table of the value of each range
+        :param table: The values indexed by ``values``, if any
+        :type table: list or None
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :rtype: RangedList
+        """
+        if len(stops) != len(values):
+            raise ValueError(
+                f"There are {len(stops)} stops but {len(values)} values")
+        ranged_list = cls(size, key=key)
+        if size:
+            if len(stops) == 0 or stops[-1] != size:
+                raise ValueError(f"The ranges do not end at the size {size}")
+            ranged_list._ranges = ArrayRangeStore(stops, values, table)
+            ranged_list._version += 1
+        return ranged_list
+
+    @overrides(AbstractList.count)
+    def count(self, x: T) -> int:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is not None and is_number(x):
+            return int(numpy.count_nonzero(array == x))
+        return super().count(x)
+
+    @overrides(AbstractList.index)
+    def index(self, x: T) -> int:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is not None and is_number(x):
+            found = numpy.flatnonzero(array == x)
+            if len(found):
+                return int(found[0])
+            raise ValueError(f"{x} is not in list")
+        return super().index(x)
+
+    @overrides(AbstractList.sum)
+    def sum(self) -> Any:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is not None:
+            return array.sum().item()
+        return super().sum()
+
+    @overrides(AbstractList.min)
+    def min(self) -> T:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is not None:
+            return array.min().item()
+        return super().min()
+
+    @overrides(AbstractList.max)
+    def max(self) -> T:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is not None:
+            return array.max().item()
+        return super().max()
+
+    @overrides(AbstractList.value_counts)
+    def value_counts(self) -> List[Tuple[T, int]]:
+        if self._changes:
+            self.__adapt()
+        array = self.__the_array
+        if array is None:
+            return super().value_counts()
+        values, first, counts = numpy.unique(
+            array, return_index=True, return_counts=True)
+        order = numpy.argsort(first)
+        return list(zip(values[order].tolist(), counts[order].tolist()))
+
     def set_default(self, default: Optional[T]):
         """
         Sets the default value.
@@ -595,28 +1258,67 @@ class RangedList(AbstractList[T], Generic[T]):
         Depth is just enough so that any changes done through the RangedList
         API on other will not change self
 
+        The storage is shared with the other list if it holds its values in
+        the same way, and is only copied by whichever list is changed first.
+
         :param RangedList other: Another Ranged List to copy the values from
         """
         # Assume the _default and key remain unchanged
+        if other is self:
+            return
+        self.__release()
         self._ranged_based = other.range_based()
-        # clear the list fast and 2.7 safe
-        self._ranges *= 0
-        if self._ranged_based:
-            self.__the_ranges.extend(other.iter_ranges())
+        if self.__can_share(other):
+            # pylint: disable=protected-access
+            if other._sharers is None:
+                other._sharers = [1]
+            other._sharers[0] += 1
+            self._sharers = other._sharers
+            self._ranges = other._ranges
+            # Shared as already checked by the other list
+            self._changes = 0
+        elif self._ranged_based:
+            self._ranges = self._range_store(other.iter_ranges())
+            self._changes = 0
         else:
-            self.__the_values.extend(other)
+            if self._dtype is not None:
+                self._ranges = numpy.fromiter(
+                    other, dtype=self._dtype, count=len(other))
+            else:
+                self._ranges = self._values_store(list(other))
+            self._changes = self._size
+        self._version += 1
+
+    def __can_share(self, other: RangedList[T]) -> bool:
+        """
+        Whether this list could hold the other list's storage as its own.
+        """
+        if not isinstance(other, RangedList):
+            return False
+        # pylint: disable=protected-access
+        if type(self)._values_store is not type(other)._values_store:
+            return False
+        if other.range_based():
+            return self._range_store is other._range_store
+        array = other.__the_array  # pylint: disable=protected-access
+        if array is None:
+            return self._dtype is None
+        return (self._dtype is not None and
+                array.dtype == numpy.dtype(self._dtype))
 
     def copy(self) -> RangedList[T]:
         """
         Creates a copy of this list.
 
         Depth is just enough so that any changes done through the RangedList
-        API on other will not change self
+        API on other will not change self.
+        The copy shares the storage of this list until either is changed.
 
         :return: The copy
         :rtype: RangedList
         """
         clone: RangedList[T] = RangedList(
-            self._size, self._default, self._key)
+            self._size, self._default, self._key, dtype=self._dtype,
+            range_store=self._range_store, compaction=self._compaction)
         clone.copy_into(self)
         return clone
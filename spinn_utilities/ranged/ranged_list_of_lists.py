@@ -11,24 +11,236 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
+from __future__ import annotations
 from collections.abc import Sized
+from itertools import chain
+from operator import index as as_index
 from typing import (
-    Callable, Generic, List, Optional, Sequence, TypeVar, Union)
+    Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Tuple,
+    TypeVar, Union, overload)
+import numpy
+from numpy.typing import DTypeLike, NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.overrides import overrides
+from .abstract_list import _eq
+from .abstract_sized import Selector
 from .ranged_list import RangedList
 #: :meta private:
 T = TypeVar("T")
 # ranged_list._ValueType but specialised for how we use it here
 _ValueType: TypeAlias = Optional[Union[
     List[T], Callable[[int], List[T]], Sequence[List[T]]]]
+# The Python types of elements that can be held in an array of numbers
+_NUMBER_DTYPES: Dict[type, DTypeLike] = {
+    bool: numpy.bool_, int: numpy.int64, float: numpy.float64}
+
+
+def _as_elements(row: Sequence[Any]) -> NDArray:
+    """
+    Puts the elements of a row into a one dimensional array, which is of
+    objects unless they are all of one number type, so that the elements
+    read back are exactly those put in.
+    """
+    kinds = {type(element) for element in row}
+    if len(kinds) == 1:
+        dtype = _NUMBER_DTYPES.get(kinds.pop())
+        if dtype is not None:
+            try:
+                return numpy.asarray(row, dtype=dtype)
+            except OverflowError:
+                # Integers too big for the array
+                pass
+    elements = numpy.empty(len(row), dtype=object)
+    for position, element in enumerate(row):
+        elements[position] = element
+    return elements
+
+
+def _join(pieces: List[NDArray]) -> NDArray:
+    """
+    Joins arrays of elements, keeping them numbers only if all are the same
+    type of number.
+    """
+    pieces = [piece for piece in pieces if len(piece)] or pieces[:1]
+    if any(piece.dtype != pieces[0].dtype for piece in pieces):
+        pieces = [piece.astype(object) for piece in pieces]
+    return numpy.concatenate(pieces)
+
+
+class _RaggedValues(Generic[T]):
+    """
+    The lists of a :py:class:`RangedListOfList` with a list per ID, held as
+    one flat array of all their elements and the offset in it of the start
+    of each list.
+
+    Lists are returned as new Python lists.
+    Changing a list to one of a different length (or type) needs the arrays
+    rebuilding, so such changes are held separately until enough build up
+    or all the lists are read.
+    """
+    __slots__ = ("_flat", "_offsets", "_pending")
+
+    def __init__(self, flat: NDArray, offsets: NDArray[numpy.intp]):
+        """
+        :param ~numpy.ndarray flat: The elements of all the lists in order
+        :param ~numpy.ndarray offsets: Where each list starts in ``flat``,
+            followed by the length of ``flat``
+        """
+        self._flat = flat
+        self._offsets = offsets
+        self._pending: Dict[int, List[T]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: List[List[T]]) -> Optional[_RaggedValues[T]]:
+        """
+        Holds lists in arrays.
+
+        :return: The held lists, or ``None`` if any is not a sized iterable
+        """
+        if not all(isinstance(row, Sized) for row in rows):
+            return None
+        offsets = numpy.zeros(len(rows) + 1, dtype=numpy.intp)
+        numpy.cumsum([len(row) for row in rows], out=offsets[1:])
+        return cls(_as_elements(list(chain.from_iterable(rows))), offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __flush(self):
+        """
+        Rebuilds the arrays to hold the changes held separately.
+        """
+        if not self._pending:
+            return
+        offsets = self._offsets
+        lengths = numpy.diff(offsets)
+        pieces: List[NDArray] = []
+        position = 0
+        for the_id in sorted(self._pending):
+            row = self._pending[the_id]
+            pieces.append(self._flat[position:offsets[the_id]])
+            pieces.append(_as_elements(row))
+            lengths[the_id] = len(row)
+            position = offsets[the_id + 1]
+        pieces.append(self._flat[position:])
+        self._flat = _join(pieces)
+        self._offsets = numpy.zeros_like(offsets)
+        numpy.cumsum(lengths, out=self._offsets[1:])
+        self._pending = {}
+
+    def __rows(self, start: int, stop: int) -> List[List[T]]:
+        self.__flush()
+        offsets = self._offsets[start:stop + 1]
+        elements = self._flat[offsets[0]:offsets[-1]].tolist()
+        bounds = (offsets - offsets[0]).tolist()
+        return [elements[first:last]
+                for first, last in zip(bounds[:-1], bounds[1:])]
+
+    @overload
+    def __getitem__(self, the_id: int) -> List[T]:
+        ...
+
+    @overload
+    def __getitem__(self, the_id: slice) -> List[List[T]]:
+        ...
+
+    def __getitem__(self, the_id: Union[int, slice]) -> Any:
+        if isinstance(the_id, slice):
+            start, stop, step = the_id.indices(len(self))
+            if step == 1:
+                return self.__rows(start, max(start, stop))
+            return [self[an_id] for an_id in range(start, stop, step)]
+        the_id = range(len(self))[as_index(the_id)]
+        if the_id in self._pending:
+            return list(self._pending[the_id])
+        return self._flat[
+            self._offsets[the_id]:self._offsets[the_id + 1]].tolist()
+
+    def __setitem__(self, the_id: int, row: List[T]):
+        the_id = range(len(self))[as_index(the_id)]
+        start = self._offsets[the_id]
+        stop = self._offsets[the_id + 1]
+        elements = _as_elements(row)
+        if elements.shape == (stop - start, ) and (
+                start == stop or self._flat.dtype in (
+                    elements.dtype, numpy.dtype(object))):
+            # Never changes the type of the other lists
+            self._flat[start:stop] = elements.astype(self._flat.dtype)
+            self._pending.pop(the_id, None)
+            return
+        self._pending[the_id] = list(row)
+        if len(self._pending) > 16 + len(self) // 8:
+            self.__flush()
+
+    def __iter__(self) -> Iterator[List[T]]:
+        return iter(self.__rows(0, len(self)))
+
+    def copy(self) -> _RaggedValues[T]:
+        """
+        Copies the held lists.
+        """
+        self.__flush()
+        return _RaggedValues(self._flat.copy(), self._offsets.copy())
+
+    def to_ragged(self) -> Tuple[NDArray, NDArray[numpy.intp]]:
+        """
+        The flat array of the elements of all the lists and the offsets of
+        the start of each list in it, followed by its length.
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        self.__flush()
+        return self._flat.copy(), self._offsets.copy()
+
+    def iter_ranges(self, start: int, stop: int) -> Iterator[
+            Tuple[int, int, List[T]]]:
+        """
+        Finds the ranges of equal lists by comparing all the lists with the
+        ones before them at once.
+
+        :param int start: The first ID
+        :param int stop: The ID after the last one
+        """
+        if start >= stop:
+            return
+        self.__flush()
+        offsets = self._offsets[start:stop + 1]
+        lengths = numpy.diff(offsets)
+        # Only lists the same length as the one before can be equal to it
+        same = numpy.flatnonzero(lengths[1:] == lengths[:-1]) + 1
+        counts = lengths[same]
+        firsts = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        within = numpy.arange(int(counts.sum())) - firsts
+        elements = numpy.repeat(offsets[same], counts) + within
+        previous = numpy.repeat(offsets[same - 1], counts) + within
+        try:
+            unequal = numpy.asarray(
+                self._flat[elements] != self._flat[previous], dtype=bool)
+        except (TypeError, ValueError):
+            unequal = numpy.array([
+                not _eq(self._flat[element], self._flat[before])
+                for element, before in zip(elements, previous)], dtype=bool)
+        differs = numpy.bincount(numpy.repeat(
+            numpy.arange(len(same)), counts)[unequal], minlength=len(same))
+        equal = numpy.zeros(len(lengths), dtype=bool)
+        equal[same[differs == 0]] = True
+        starts = numpy.flatnonzero(~equal)
+        stops = numpy.append(starts[1:], len(lengths))
+        for first, last in zip(starts.tolist(), stops.tolist()):
+            yield (start + first, start + last, self[start + first])
 
 
 class RangedListOfList(RangedList[List[T]], Generic[T]):
     """
     A Ranged object for lists of list.
+
+    When there is a list per ID they are held in one flat array of all their
+    elements plus the offsets of the start of each list, rather than as a
+    Python list of Python lists.
+    The lists are still returned as Python lists, with the elements as they
+    were given; the array is only of numbers while all the elements are the
+    same type of number, and is otherwise of objects.
     """
     # pylint: disable=unused-argument
     @overrides(RangedList.listness_check)
@@ -56,3 +268,61 @@ class RangedListOfList(RangedList[List[T]], Generic[T]):
             raise TypeError(
                 "Value must be an iterable or iterable of iterables") \
                 from original
+
+    @overrides(RangedList._values_store)  # pylint: disable=protected-access
+    def _values_store(self, values: List[List[T]]) -> List[List[T]]:
+        ragged = _RaggedValues.from_rows(values)
+        if ragged is None:
+            return values
+        # The ragged values act as a list of lists
+        return ragged  # type: ignore[return-value]
+
+    @overrides(RangedList._value_ranges)  # pylint: disable=protected-access
+    def _value_ranges(self, slice_start: int, slice_stop: int) -> Iterator[
+            Tuple[int, int, List[T]]]:
+        if isinstance(self._ranges, _RaggedValues):
+            return self._ranges.iter_ranges(slice_start, slice_stop)
+        return super()._value_ranges(slice_start, slice_stop)
+
+    def to_ragged(self) -> Tuple[NDArray, NDArray[numpy.intp]]:
+        """
+        Gets the lists as a flat array of all their elements and an array of
+        the offset of the start of each list in it, followed by its length.
+
+        So the list of ID ``i`` is ``values[offsets[i]:offsets[i + 1]]``.
+
+        :return: values, offsets
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        if not self.range_based() and isinstance(
+                self._ranges, _RaggedValues):
+            return self._ranges.to_ragged()
+        ragged = _RaggedValues.from_rows(list(self))
+        assert ragged is not None
+        return ragged.to_ragged()
+
+    @overrides(RangedList.to_numpy)
+    def to_numpy(self, dtype: Optional[DTypeLike] = None,
+                 selector: Selector = None) -> NDArray:
+        """
+        If all the lists selected are the same length the result has a row
+        for each; otherwise it is an array of arrays.
+        """
+        values, offsets = self.to_ragged()
+        if selector is None:
+            ids = numpy.arange(self._size)
+        else:
+            ids = numpy.asarray(self.selector_to_ids(selector),
+                                dtype=numpy.intp)
+        starts = offsets[ids]
+        lengths = offsets[ids + 1] - starts
+        if len(ids) == 0 or bool(numpy.all(lengths == lengths[0])):
+            width = int(lengths[0]) if len(ids) else 0
+            return numpy.asarray(values[
+                starts[:, numpy.newaxis] + numpy.arange(width)], dtype=dtype)
+        result = numpy.empty(len(ids), dtype=object)
+        for position, (start, length) in enumerate(
+                zip(starts.tolist(), lengths.tolist())):
+            result[position] = numpy.asarray(
+                values[start:start + length], dtype=dtype)
+        return result
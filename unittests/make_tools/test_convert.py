@@ -24,6 +24,25 @@ from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 
 class TestConverter(unittest.TestCase):
 
+    def setUp(self):
+        self._old_dict = os.environ.get("C_LOGS_DICT")
+        # Cleaned up by tearDown
+        # pylint: disable=consider-using-with
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        if self._old_dict is None:
+            os.environ.pop("C_LOGS_DICT", None)
+        else:
+            os.environ["C_LOGS_DICT"] = self._old_dict
+        self._tmp_dir.cleanup()
+
+    def _use_new_dict(self, name="logs.sqlite3"):
+        """
+        Points C_LOGS_DICT at a database in the temporary directory.
+        """
+        os.environ["C_LOGS_DICT"] = os.path.join(self._tmp_dir.name, name)
+
     def test_convert(self):
         class_file = sys.modules[self.__module__].__file__
         path = os.path.dirname(os.path.abspath(class_file))
@@ -65,3 +84,112 @@ class TestConverter(unittest.TestCase):
         convert(src, dest, True)
         self.assertTrue(os.path.exists(e1))
         convert(src, dest, True)
+
+    def test_parallel(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.chdir(path)
+        src = "mock_src"
+        dest = "modified_src"
+        shutil.copyfile("formats.c1", os.path.join(src, "formats.c"))
+        self._use_new_dict("serial.sqlite3")
+        convert(src, dest, True)
+        serial = {}
+        for file_name in os.listdir(src):
+            if not file_name.endswith((".c", ".h")):
+                continue
+            with open(os.path.join(dest, file_name), encoding="utf-8") as f:
+                serial[file_name] = f.read()
+        with LogSqlLiteDatabase() as sql:
+            max_id = sql.get_max_log_id()
+
+        # A new database must give the same IDs and so the same files
+        self._use_new_dict("parallel.sqlite3")
+        convert(src, dest, True, processes=2)
+        for file_name, text in serial.items():
+            with open(os.path.join(dest, file_name), encoding="utf-8") as f:
+                self.assertEqual(text, f.read())
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual(max_id, sql.get_max_log_id())
+            sql.check_original("test -three %f")
+
+        # Unchanged files a second time should give the same IDs
+        convert(src, dest, False, processes=2)
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual(max_id, sql.get_max_log_id())
+
+    def test_incremental(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.chdir(path)
+        self._use_new_dict()
+        src = "mock_src"
+        dest = "modified_src"
+        formats = os.path.join(src, "formats.c")
+        modified = os.path.join(dest, "formats.c")
+        other = os.path.join(dest, "bit_field.c")
+        shutil.copyfile("formats.c1", formats)
+        convert(src, dest, True)
+        with LogSqlLiteDatabase() as sql:
+            max_id = sql.get_max_log_id()
+
+        # Unchanged files are not written again
+        os.utime(modified, ns=(0, 0))
+        convert(src, dest, False, incremental=True)
+        self.assertEqual(0, os.stat(modified).st_mtime_ns)
+
+        # Nor are files only touched
+        os.utime(formats)
+        convert(src, dest, False, incremental=True)
+        self.assertEqual(0, os.stat(modified).st_mtime_ns)
+
+        # Unless the destination is missing, and then the IDs are reused
+        os.remove(modified)
+        convert(src, dest, False, incremental=True)
+        self.assertTrue(os.path.exists(modified))
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual(max_id, sql.get_max_log_id())
+
+        # A changed file is converted again but not the others
+        os.utime(other, ns=(0, 0))
+        shutil.copyfile("formats.c2", formats)
+        convert(src, dest, False, processes=2, incremental=True)
+        self.assertEqual(0, os.stat(other).st_mtime_ns)
+        with LogSqlLiteDatabase() as sql:
+            self.assertEqual(max_id + 2, sql.get_max_log_id())
+
+        # But by default all files are converted
+        convert(src, dest, False)
+        self.assertNotEqual(0, os.stat(other).st_mtime_ns)
+
+    def test_log_lookup(self):
+        class_file = sys.modules[self.__module__].__file__
+        path = os.path.dirname(os.path.abspath(class_file))
+        os.chdir(path)
+        self._use_new_dict()
+        src = "mock_src"
+        dest = "modified_src"
+        shutil.copyfile("formats.c1", os.path.join(src, "formats.c"))
+        convert(src, dest, True, log_lookup=False)
+        with LogSqlLiteDatabase() as sql:
+            self.assertFalse(sql.has_log_lookup())
+            infos = [sql.get_log_info(str(log_id))
+                     for log_id in range(1, sql.get_max_log_id() + 1)]
+            sql.make_log_lookup()
+            self.assertTrue(sql.has_log_lookup())
+            self.assertEqual(infos, [
+                sql.get_log_info(str(log_id))
+                for log_id in range(1, sql.get_max_log_id() + 1)])
+            self.assertIsNone(sql.get_log_info("0"))
+
+        # Converting a file again empties the lookup until the end
+        shutil.copyfile("formats.c2", os.path.join(src, "formats.c"))
+        convert(src, dest, False)
+        with LogSqlLiteDatabase() as sql:
+            self.assertTrue(sql.has_log_lookup())
+            max_id = sql.get_max_log_id()
+            info = sql.get_log_info(str(max_id))
+            directory_id = sql.get_directory_id("a", "b")
+            sql.get_file_id(directory_id, "a.c")
+            self.assertFalse(sql.has_log_lookup())
+            self.assertEqual(info, sql.get_log_info(str(max_id)))
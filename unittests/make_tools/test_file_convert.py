@@ -24,6 +24,19 @@ ranged_file = "local_ranges.txt"
 
 class TestConverter(unittest.TestCase):
 
+    def setUp(self):
+        self._old_dict = os.environ.get("C_LOGS_DICT")
+        # Cleaned up by tearDown
+        # pylint: disable=consider-using-with
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        if self._old_dict is None:
+            os.environ.pop("C_LOGS_DICT", None)
+        else:
+            os.environ["C_LOGS_DICT"] = self._old_dict
+        self._tmp_dir.cleanup()
+
     def test_convert(self):
         class_file = sys.modules[self.__module__].__file__
         path = os.path.dirname(os.path.abspath(class_file))
@@ -193,3 +206,25 @@ class TestConverter(unittest.TestCase):
                           str(ex1))
             self.assertIn("mistakes", str(ex1))
             self.assertIn("too_many.c", str(ex1))
+
+    def test_set_log_infos(self):
+        os.environ["C_LOGS_DICT"] = os.path.join(
+            self._tmp_dir.name, "logs.sqlite3")
+        with LogSqlLiteDatabase(True) as sql:
+            directory_id = sql.get_directory_id("src", "dest")
+            file_id = sql.get_file_id(directory_id, "a.c")
+            self.assertEqual(1, sql.set_log_info(20, 3, "first", file_id))
+            records = [(20, 5, "second"), (20, 3, "first"), (30, 8, "123"),
+                       (20, 5, "second")]
+            self.assertEqual([2, 1, 3, 2],
+                             sql.set_log_infos(records, file_id))
+            # The same logs again get the same IDs
+            file_id = sql.get_file_id(directory_id, "a.c")
+            self.assertEqual([2, 1, 3, 2],
+                             sql.set_log_infos(records, file_id))
+            self.assertEqual(
+                (20, "a.c", 5, "second"), sql.get_log_info("2"))
+            self.assertEqual([4, 3], sql.set_log_infos(
+                [(20, 6, "second"), (30, 8, "123")], file_id))
+            self.assertEqual([], sql.set_log_infos([], file_id))
+            self.assertEqual(4, sql.get_max_log_id())
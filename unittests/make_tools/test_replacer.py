@@ -26,9 +26,15 @@ Note: if weird,file.c changes you may have to manually fix the tests
     especially the log_id and row numbers
 """
 
+import gc
 import math
 import unittest
 import os
+import shutil
+import sqlite3
+import stat
+import tempfile
+from spinn_utilities.make_tools.log_sqllite_database import LogSqlLiteDatabase
 from spinn_utilities.make_tools.replacer import Replacer
 from spinn_utilities.make_tools.file_converter import TOKEN
 
@@ -37,8 +43,31 @@ PATH = os.path.dirname(os.path.abspath(__file__))
 
 class TestReplacer(unittest.TestCase):
 
+    def setUp(self):
+        self._old_dict = os.environ.get("C_LOGS_DICT")
+        # Cleaned up by tearDown
+        # pylint: disable=consider-using-with
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        if self._old_dict is None:
+            os.environ.pop("C_LOGS_DICT", None)
+        else:
+            os.environ["C_LOGS_DICT"] = self._old_dict
+        self._tmp_dir.cleanup()
+
+    def _use_old_dict(self):
+        """
+        Points C_LOGS_DICT at a copy of replacer.sqlite3, so that tests
+        can not change it.
+        """
+        copy = os.path.join(self._tmp_dir.name, "replacer.sqlite3")
+        shutil.copyfile(os.path.join(PATH, "replacer.sqlite3"), copy)
+        os.environ["C_LOGS_DICT"] = copy
+        return copy
+
     def test_replacer(self):
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         with Replacer() as replacer:
             new = replacer.replace("5")
         assert ("[INFO] (weird,file.c: 37): this is ok" == new)
@@ -64,7 +93,7 @@ class TestReplacer(unittest.TestCase):
             assert ("Error accessing c_logs_dict" in str(ex))
 
     def test_tab(self):
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         with Replacer() as replacer:
             new = replacer.replace("11" + TOKEN + "10" + TOKEN + "20")
         message = "[INFO] (weird,file.c: 57): \t back off = 10, time between"\
@@ -72,14 +101,14 @@ class TestReplacer(unittest.TestCase):
         assert (message == new)
 
     def test_float(self):
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         replacer = Replacer()
         new = replacer.replace("2" + TOKEN + "0xc0400000")
         message = "[INFO] (weird,file.c: 31): test -three -3.0"
         assert (message == new)
 
     def test_double(self):
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         replacer = Replacer()
         new = replacer.replace(
             "3" + TOKEN + "40379999" + TOKEN + "9999999a")
@@ -87,7 +116,7 @@ class TestReplacer(unittest.TestCase):
         assert (message == new)
 
     def test_bad(self):
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         replacer = Replacer()
         new = replacer.replace("1007" + TOKEN + "10")
         # An exception so just output the input
@@ -106,7 +135,7 @@ class TestReplacer(unittest.TestCase):
         Test the converter against hex values returned from Spinnaker
 
         """
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         with Replacer() as replacer:
             assert self.near_equals(
                 -345443332234.13432143, replacer._hex_to_float("d2a0dc0e"))
@@ -135,7 +164,7 @@ class TestReplacer(unittest.TestCase):
         Test the converter against hexes values returned from Spinnaker
 
         """
-        os.environ["C_LOGS_DICT"] = str(os.path.join(PATH, "replacer.sqlite3"))
+        self._use_old_dict()
         with Replacer() as replacer:
             assert self.near_equals(
                 0, replacer._hexes_to_double("0", "0"))
@@ -154,3 +183,63 @@ class TestReplacer(unittest.TestCase):
             assert self.near_equals(
                 0.0000000004,
                 replacer._hexes_to_double("3dfb7cdf", "d9d7bdbb"))
+
+    def test_modes(self):
+        self._use_old_dict()
+        shorts = ["5", "11" + TOKEN + "10" + TOKEN + "20",
+                  "2" + TOKEN + "0xc0400000",
+                  "3" + TOKEN + "40379999" + TOKEN + "9999999a",
+                  "1007" + TOKEN + "10", "abc", "²", "0005"]
+        with Replacer(cache_size=0) as replacer:
+            expected = [replacer.replace(short) for short in shorts]
+        assert "[INFO] (weird,file.c: 37): this is ok" == expected[-1]
+        with Replacer(cache_size=2) as replacer:
+            # Twice to use the cache
+            for _ in range(2):
+                assert expected == [
+                    replacer.replace(short) for short in shorts]
+        with Replacer(preload=True) as replacer:
+            assert expected == [replacer.replace(short) for short in shorts]
+
+    def test_closed_when_unused(self):
+        self._use_old_dict()
+        gc.disable()
+        try:
+            replacer = Replacer()
+            replacer.replace("5")
+            db = replacer._db
+            del replacer
+            # Closed without waiting for the garbage collector
+            with self.assertRaises(sqlite3.ProgrammingError):
+                db.execute("SELECT 1")
+        finally:
+            gc.enable()
+
+    def test_upgrade(self):
+        copy = self._use_old_dict()
+        with LogSqlLiteDatabase():
+            pass
+        with sqlite3.connect(copy) as db:
+            tables = {row[0] for row in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"source", "current_log"} <= tables
+        with Replacer() as replacer:
+            assert "[INFO] (weird,file.c: 37): this is ok" == \
+                replacer.replace("5")
+
+    def test_read_only(self):
+        copy = self._use_old_dict()
+        with open(copy, "rb") as f:
+            before = f.read()
+        os.chmod(copy, stat.S_IRUSR)
+        os.chmod(self._tmp_dir.name, stat.S_IRUSR | stat.S_IXUSR)
+        try:
+            with Replacer() as replacer:
+                assert not replacer.has_log_lookup()
+                assert "[INFO] (weird,file.c: 37): this is ok" == \
+                    replacer.replace("5")
+        finally:
+            os.chmod(self._tmp_dir.name, stat.S_IRWXU)
+            os.chmod(copy, stat.S_IRUSR | stat.S_IWUSR)
+        with open(copy, "rb") as f:
+            assert before == f.read()
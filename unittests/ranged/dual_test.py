@@ -215,3 +215,20 @@ def test_numpy_array():
     right = RangedList(2, 2, "many")
     ans = left / right
     assert all(ans.get_single_value_all() == numpy.array([1, 2, 3]))
+
+
+def test_cached():
+    left = RangedList(6, 1, "left")
+    right = RangedList(6, 2, "right")
+    add = left + right
+    assert add.version == (left.version, right.version)
+    assert list(add.iter_ranges()) == [(0, 6, 3)]
+    right[4] = 5
+    assert list(add) == [3, 3, 3, 3, 6, 3]
+    assert add[2:5] == [3, 3, 6]
+    left.set_value_by_ids([0, 1], 4)
+    assert add[2:5] == [3, 3, 6]
+    assert add[0] == 6
+    other = RangedList(6, 3, "other")
+    left.copy_into(other)
+    assert list(add) == [5, 5, 5, 5, 8, 5]
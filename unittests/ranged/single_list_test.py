@@ -133,3 +133,55 @@ def test_defaults():
     assert a_list.get_default() == 12
     double = SingleList(a_list=a_list, operation=lambda x: x * 2)
     assert double.get_default() == 24
+
+
+def test_cached():
+    a_list = RangedList(6, 1, "one")
+    calls = []
+
+    def operation(x):
+        calls.append(x)
+        return x * 2
+
+    single = SingleList(a_list=a_list, operation=operation)
+    version = a_list.version
+    assert list(single) == [2, 2, 2, 2, 2, 2]
+    assert len(calls) == 1
+
+    # Repeated reads use the cached ranges
+    assert list(single) == [2, 2, 2, 2, 2, 2]
+    assert single[3] == 2
+    assert single[1:4] == [2, 2, 2]
+    assert list(single.iter_ranges_by_slice(1, 4)) == [(1, 4, 2)]
+    assert len(calls) == 1
+
+    # Any change to the source is seen
+    a_list[2:4] = 5
+    assert a_list.version != version
+    assert single[2] == 10
+    assert list(single.iter_ranges()) == [(0, 2, 2), (2, 4, 10), (4, 6, 2)]
+    assert list(single.iter_ranges_by_slice(3, 5)) == [(3, 4, 10), (4, 5, 2)]
+    calls.clear()
+    assert list(single) == [2, 2, 10, 10, 2, 2]
+    assert not calls
+
+
+def test_cached_not_range_based():
+    a_list = RangedList(4, [1, 2, 3, 4], "many")
+    single = SingleList(a_list=a_list, operation=lambda x: x + 1)
+    assert list(single) == [2, 3, 4, 5]
+    assert single[1:3] == [3, 4]
+    a_list.set_value_by_ids([0, 3], 10)
+    assert list(single) == [11, 3, 4, 11]
+    a_list.set_value([7, 7, 7, 7])
+    assert single[2] == 8
+
+
+def test_version():
+    a_list = RangedList(4, 3, "three")
+    version = a_list.version
+    # Setting a value that is already there is not a change
+    a_list.set_value_by_id(1, 3)
+    assert a_list.version == version
+    a_list.set_value_by_id(1, 4)
+    assert a_list.version == version + 1
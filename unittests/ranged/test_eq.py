@@ -0,0 +1,49 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from spinn_utilities.ranged.abstract_list import _eq
+
+
+def test_scalars():
+    assert _eq(1, 1)
+    assert _eq(1, 1.0)
+    assert _eq(True, 1)
+    assert _eq("a", "a")
+    assert _eq(None, None)
+    assert _eq(numpy.int32(3), 3)
+    assert _eq(numpy.float64(2.5), 2.5)
+    assert not _eq(1, 2)
+    assert not _eq(1, "1")
+    assert not _eq("a", "b")
+    assert not _eq(None, 0)
+
+
+def test_arrays():
+    assert _eq([1, 2], [1, 2])
+    assert _eq(numpy.arange(3), [0, 1, 2])
+    assert not _eq(numpy.arange(3), numpy.arange(4))
+    assert not _eq(1, [1, 1])
+    assert not _eq([1, 2], 1)
+
+
+def test_nan_identity():
+    # Different NaN objects are not equal, as with ==
+    assert not _eq(float("nan"), float("nan"))
+    assert not _eq(numpy.float64("nan"), float("nan"))
+    # but the very same NaN object is, as it is the same value
+    nan = float("nan")
+    assert _eq(nan, nan)
+    numpy_nan = numpy.float64("nan")
+    assert _eq(numpy_nan, numpy_nan)
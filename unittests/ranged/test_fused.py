@@ -0,0 +1,121 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import FusedList, RangedList
+
+
+def test_fuse_ranges():
+    a = RangedList(10, 1, "a")
+    b = RangedList(10, 2, "b")
+    c = RangedList(10, 3, "c")
+    a[2:5] = 4
+    b[4:8] = 5
+    c[7] = 6
+    expression = (a + b) * c - 1
+    fused = expression.fuse()
+    assert isinstance(fused, FusedList)
+    assert fused.range_based()
+    assert list(fused.iter_ranges()) == list(expression.iter_ranges())
+    assert list(fused) == list(expression)
+    assert fused.get_value_by_id(4) == expression.get_value_by_id(4)
+    assert list(fused.iter_ranges_by_slice(3, 9)) == \
+        list(expression.iter_ranges_by_slice(3, 9))
+    assert fused[3:9] == expression[3:9]
+    assert fused.get_single_value_by_slice(0, 2) == 8
+    assert fused.get_single_value_by_ids([0, 8, 9]) == 8
+    assert fused.get_default() == 8
+
+    # Changes to the leaves show in the fused list
+    c[0:10] = 1
+    assert list(fused) == list(expression)
+
+
+def test_repeated_leaf():
+    a = RangedList(5, 2, "a")
+    a[1] = 3
+    fused = (a * a + a).fuse()
+    assert list(fused) == [6, 12, 6, 6, 6]
+    assert list(fused.iter_ranges()) == [(0, 1, 6), (1, 2, 12), (2, 5, 6)]
+
+
+def test_fuse_leaf():
+    a = RangedList(5, 2, "a")
+    assert a.fuse() is a
+
+
+def test_fuse_arrays():
+    a = RangedList(6, [1, 2, 3, 4, 5, 6], "a")
+    b = RangedList(6, 2, "b")
+    assert not a.range_based()
+    expression = (a * b + 1) / b // 2
+    fused = expression.fuse()
+    assert not fused.range_based()
+    assert list(fused) == list(expression)
+    assert fused[2:5] == expression[2:5]
+    # Equal neighbouring values share a range
+    assert list(fused.iter_ranges()) == [
+        (0, 1, 0), (1, 3, 1), (3, 5, 2), (5, 6, 3)]
+    assert numpy.array_equal(
+        fused.to_numpy(), numpy.array(list(expression)))
+    assert fused.to_numpy(selector=[1, 3]).tolist() == [1, 2]
+    a[0] = 100
+    assert list(fused) == list(expression)
+
+
+def test_fuse_arrays_operation():
+    a = RangedList(4, [1, 2, 3, 4], "a")
+    # An arbitrary operation can not be done over arrays
+    fused = (a.apply_operation(lambda x: x * 10) + a).fuse()
+    assert list(fused) == [11, 22, 33, 44]
+
+
+def test_fuse_arrays_divide_by_zero():
+    a = RangedList(4, [1, 2, 3, 4], "a")
+    b = RangedList(4, [1, 1, 0, 1], "b")
+    fused = (a / b).fuse()
+    with pytest.raises(ZeroDivisionError):
+        list(fused)
+
+
+def test_fuse_floordiv():
+    a = RangedList(4, [-7, -2, 3, 9], "a")
+    fused = (a // 2).fuse()
+    assert list(fused) == list(a // 2)
+    fused = (a // RangedList(4, 2, "b")).fuse()
+    assert list(fused) == list(a // RangedList(4, 2, "b"))
+
+
+def test_fuse_bools():
+    a = RangedList(value=[True, False, True, True])
+    b = RangedList(value=[True, True, False, True])
+    assert not a.range_based()
+    for expression in (a + b, a - b, a * b, (a + b) * 3):
+        assert list(expression.fuse()) == list(expression)
+        assert expression.fuse().to_numpy().tolist() == list(expression)
+    assert list((a + b).fuse()) == [2, 1, 1, 2]
+    assert list((a - b).fuse()) == [0, -1, 1, 0]
+
+
+def test_fuse_overflow():
+    a = RangedList(value=[2 ** 62, 1, 2 ** 61, 3])
+    assert not a.range_based()
+    expression = a * 4
+    assert list(expression.fuse()) == list(expression)
+    assert list(expression.fuse())[0] == 2 ** 64
+    expression = (a * 4) // 8
+    assert list(expression.fuse()) == [2 ** 61, 0, 2 ** 60, 1]
+    # Results that fit are still done with NumPy
+    assert list((a + 1).fuse()) == [2 ** 62 + 1, 2, 2 ** 61 + 1, 4]
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import pytest
 import numpy
 from spinn_utilities.ranged import MultipleValuesException
-from spinn_utilities.ranged import RangedList
+from spinn_utilities.ranged import RangeDictionary, RangedList
+from spinn_utilities.ranged import BlockedRangeStore, ListRangeStore
+from spinn_utilities.ranged.ranged_list import DEFAULT_COMPACTION
 
 
 def test_simple():
@@ -222,7 +226,7 @@ def test_ranges_by_ids():
     assert [(1, 4, "a"), (7, 8, "a"), (4, 5, "a")] == \
         list(rl.iter_ranges_by_ids((1, 2, 3, 7, 4)))
     rl[6] = "foo"
-    assert [(1, 4, "a"), (7, 8, "a"), (4, 5, "foo")] == \
+    assert [(1, 4, "a"), (7, 8, "a"), (4, 5, "a")] == \
         list(rl.iter_ranges_by_ids((1, 2, 3, 7, 4)))
     rl[3] = "foo"
     assert [(1, 3, "a"), (3, 4, "foo"), (7, 8, "a"), (4, 5, "a")] == \
@@ -482,4 +486,392 @@ def test_warn():
 def test_numpy_selector():
     rl = RangedList(value=range(5))
     selector = numpy.array([1, 3, 4])
-    assert [1, 3, 4] == rl.selector_to_ids(selector)
+    assert [1, 3, 4] == list(rl.selector_to_ids(selector))
+
+
+def test_numpy_selector_types():
+    rl = RangedList(value=range(6))
+    ids = rl.selector_to_ids(numpy.array([4, 1, 4], dtype=numpy.uint8))
+    assert isinstance(ids, numpy.ndarray)
+    assert list(ids) == [4, 1, 4]
+    ids = rl.selector_to_ids(numpy.array([False, True, False, True]))
+    assert list(ids) == [1, 3]
+    # Consecutive IDs in order become a range
+    assert rl.selector_to_ids(numpy.array([2, 3, 4])) == range(2, 5)
+    assert rl.selector_to_ids(
+        numpy.array([False, True, True, False, False, False, True]),
+        warn=True) == range(1, 3)
+    assert list(rl.selector_to_ids(numpy.array([], dtype=int))) == []
+    with pytest.raises(TypeError):
+        rl.selector_to_ids(numpy.array([1, -1]))
+    with pytest.raises(TypeError):
+        rl.selector_to_ids(numpy.array([1, 6]))
+
+
+def test_numpy_selector_copied():
+    rl = RangedList(value=range(6))
+    selector = numpy.array([4, 1, 3])
+    ids = rl.selector_to_ids(selector)
+    selector[0] = 0
+    assert list(ids) == [4, 1, 3]
+    view = RangeDictionary(6, {"a": 2})[selector]
+    selector[1] = 5
+    assert list(view.ids()) == [0, 1, 3]
+
+
+def test_numpy_selector_values():
+    rl = RangedList(8, 0)
+    mask = numpy.zeros(8, dtype=bool)
+    mask[2:5] = True
+    rl[mask] = 1
+    assert rl.get_ranges() == [(0, 2, 0), (2, 5, 1), (5, 8, 0)]
+    rl[numpy.array([0, 7])] = 2
+    assert rl == [2, 0, 1, 1, 1, 0, 0, 2]
+    assert rl[numpy.array([3, 4, 5])] == [1, 1, 0]
+    assert rl.get_values(mask) == [1, 1, 1]
+    assert rl.to_numpy(selector=numpy.array([1, 2])).tolist() == [0, 1]
+    rl[numpy.array([4, 5, 6])] = [7, 8, 9]
+    assert rl == [2, 0, 1, 1, 7, 8, 9, 2]
+
+
+def test_merge_with_next_on_split():
+    rl = RangedList(10, "a")
+    rl[5:10] = "b"
+    rl[4] = "b"
+    assert rl.get_ranges() == [(0, 4, "a"), (4, 10, "b")]
+    rl[0:4] = "b"
+    assert rl.get_ranges() == [(0, 10, "b")]
+
+
+@pytest.mark.parametrize("range_store", [
+    ListRangeStore, partial(BlockedRangeStore, load=4)])
+def test_random_updates_match_list(range_store):
+    rng = numpy.random.default_rng(42)
+    size = 200
+    rl = RangedList(size, 0, range_store=range_store)
+    expected = [0] * size
+    for _ in range(500):
+        if rng.random() < 0.5:
+            the_id = int(rng.integers(size))
+            value = int(rng.integers(4))
+            rl[the_id] = value
+            expected[the_id] = value
+        else:
+            start = int(rng.integers(size))
+            stop = int(rng.integers(start, size + 1))
+            value = int(rng.integers(4))
+            rl[start:stop] = value
+            expected[start:stop] = [value] * (stop - start)
+        assert list(rl) == expected
+    assert [rl[i] for i in range(size)] == expected
+    ranges = rl.get_ranges()
+    for (_, stop, value), (start, _, next_value) in zip(ranges, ranges[1:]):
+        assert stop == start
+        assert value != next_value
+    for start in range(0, size, 7):
+        assert list(rl.iter_by_slice(start, start + 9)) == \
+            expected[start:start + 9]
+
+
+def test_set_value_by_ids_batch():
+    rl = RangedList(12, "a")
+    rl[6:9] = "b"
+    rl.set_value_by_ids([9, 3, 4, 5, 11, 2], "b")
+    assert rl.get_ranges() == [
+        (0, 2, "a"), (2, 10, "b"), (10, 11, "a"), (11, 12, "b")]
+    rl.set_value_by_ids(numpy.array([11, 0, 1, 11]), ["c", "c", "c", "a"])
+    assert rl.get_ranges() == [(0, 2, "c"), (2, 10, "b"), (10, 12, "a")]
+    rl.set_value_by_ids([], "d")
+    assert rl.get_ranges() == [(0, 2, "c"), (2, 10, "b"), (10, 12, "a")]
+    with pytest.raises(IndexError):
+        rl.set_value_by_ids([3, 12], "d")
+    with pytest.raises(IndexError):
+        rl.set_value_by_ids([-1], "d")
+    with pytest.raises(TypeError):
+        rl.set_value_by_ids([1.5], "d")
+
+
+@pytest.mark.parametrize("range_store", [
+    ListRangeStore, partial(BlockedRangeStore, load=4)])
+@pytest.mark.parametrize("initial", [0, list(range(100))])
+def test_random_set_value_by_ids(initial, range_store):
+    rng = numpy.random.default_rng(7)
+    size = 100
+    rl = RangedList(size, initial, range_store=range_store)
+    expected = list(rl)
+    for _ in range(100):
+        ids = rng.integers(size, size=int(rng.integers(1, 30)))
+        if rng.random() < 0.5:
+            value = int(rng.integers(3))
+            rl.set_value_by_ids(ids, value)
+            for the_id in ids:
+                expected[the_id] = value
+        else:
+            values = rng.integers(3, size=len(ids)).tolist()
+            rl.set_value_by_ids(ids, values)
+            for the_id, value in zip(ids, values):
+                expected[the_id] = value
+        assert list(rl) == expected
+    if rl.range_based():
+        ranges = rl.get_ranges()
+        for (_, stop, value), (start, _, nxt) in zip(ranges, ranges[1:]):
+            assert stop == start
+            assert value != nxt
+
+
+def test_compaction_to_values():
+    rl = RangedList(20, 0, compaction=DEFAULT_COMPACTION)
+    for the_id in range(0, 20, 2):
+        rl[the_id] = the_id
+    # Switched on the first read
+    assert not rl.range_based()
+    assert rl[4] == 4
+    assert rl[5] == 0
+    assert len(rl.get_ranges()) == 19
+
+    # Setting most of the list back to one value switches back
+    rl[0:20] = 1
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 20, 1)]
+
+
+def test_compaction_to_ranges():
+    rl = RangedList(value=[3] * 50, compaction=DEFAULT_COMPACTION)
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 50, 3)]
+
+    # Not enough ranges to switch yet
+    rl = RangedList(value=[0] * 10 + [1] * 10, compaction=DEFAULT_COMPACTION)
+    assert not rl.range_based()
+
+
+def test_compaction_hysteresis():
+    rl = RangedList(100, 0, compaction=(0.1, 0.5))
+    rl.set_value_by_ids(list(range(0, 60, 2)), 1)
+    # 60 ranges out of 100 is too many to stay range based
+    assert not rl.range_based()
+    rl[0:40] = 0
+    # 21 ranges is between the thresholds, so no switch
+    assert not rl.range_based()
+    rl[40:60] = 0
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 100, 0)]
+
+
+def test_compaction_disabled():
+    rl = RangedList(20, 0, compaction=None)
+    for the_id in range(0, 20, 2):
+        rl[the_id] = 1
+    assert rl.range_based()
+    assert not RangedList(value=[3] * 50, compaction=None).range_based()
+
+    # Which is the default
+    rl = RangedList(20, 0)
+    for the_id in range(0, 20, 2):
+        rl[the_id] = 1
+    assert rl.range_based()
+    assert not RangedList(value=[3] * 50).range_based()
+
+
+def test_compaction_typed():
+    rl = RangedList(20, 0, dtype=numpy.int16, compaction=DEFAULT_COMPACTION)
+    rl.set_value_by_ids(list(range(0, 20, 2)), 1)
+    assert not rl.range_based()
+    assert rl.to_numpy().dtype == numpy.int16
+    assert list(rl) == [1, 0] * 10
+
+    # Values the type cannot hold stay range based
+    rl = RangedList(
+        20, "a", dtype=numpy.int16, compaction=DEFAULT_COMPACTION)
+    rl.set_value_by_ids(list(range(0, 20, 2)), "b")
+    assert rl.range_based()
+    assert list(rl) == ["b", "a"] * 10
+
+
+def test_diff():
+    old = RangedList(10, 0)
+    old[2:5] = 1
+    new = RangedList(10, 0)
+    new[3:7] = 1
+    new[7] = 2
+    new.set_value_by_id(9, [1, 2])
+    assert old.diff(new) == [(2, 3, 0), (5, 7, 1), (7, 8, 2), (9, 10, [1, 2])]
+    assert new.diff(new.copy()) == []
+    old.apply_patch(old.diff(new))
+    assert old.get_ranges() == new.get_ranges()
+    with pytest.raises(ValueError):
+        old.diff(RangedList(5, 0))
+
+
+def test_apply_patch():
+    rl = RangedList(10, 0)
+    version = rl.version
+    rl.apply_patch([])
+    assert rl.version == version
+    rl.apply_patch([(0, 2, 1), (2, 4, 1), (8, 10, 2)])
+    assert rl.get_ranges() == [(0, 4, 1), (4, 8, 0), (8, 10, 2)]
+    assert rl.version != version
+    with pytest.raises(ValueError):
+        rl.apply_patch([(4, 6, 3), (5, 7, 3)])
+
+    rl = RangedList(value=list(range(10)))
+    rl.apply_patch([(0, 3, "a"), (8, 10, "b")])
+    assert list(rl) == ["a"] * 3 + list(range(3, 8)) + ["b"] * 2
+
+
+def _half(ids):
+    return ids // 2
+
+
+def test_from_function():
+    rl = RangedList.from_function(100, lambda x: x // 50, chunk_size=30,
+                                  compaction=DEFAULT_COMPACTION)
+    assert list(rl) == [0] * 50 + [1] * 50
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 50, 0), (50, 100, 1)]
+
+    rl = RangedList.from_function(
+        100, lambda ids: ids // 50, vectorised=True, chunk_size=40)
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 50, 0), (50, 100, 1)]
+
+    rl = RangedList.from_function(
+        10, lambda ids: ids * 1.5, vectorised=True, dtype=numpy.float64,
+        compaction=DEFAULT_COMPACTION)
+    assert not rl.range_based()
+    assert rl.to_numpy().tolist() == [x * 1.5 for x in range(10)]
+
+    assert list(RangedList.from_function(0, lambda x: x)) == []
+    with pytest.raises(ValueError):
+        RangedList.from_function(10, lambda ids: ids[1:], vectorised=True)
+
+
+def test_from_function_encoded():
+    rl = RangedList.from_function(100, lambda x: x // 50, chunk_size=30)
+    assert rl.range_based()
+    assert rl.get_ranges() == [(0, 50, 0), (50, 100, 1)]
+
+    rl = RangedList.from_function(
+        100, lambda x: [x // 50], range_store=BlockedRangeStore)
+    assert isinstance(rl._ranges, BlockedRangeStore)
+    assert rl.get_ranges() == [(0, 50, [0]), (50, 100, [1])]
+
+    rl = RangedList.from_function(
+        100, lambda ids: ids // 50, vectorised=True,
+        range_store=BlockedRangeStore)
+    assert isinstance(rl._ranges, BlockedRangeStore)
+
+    rl = RangedList.from_function(
+        10, lambda x: x, compaction=DEFAULT_COMPACTION)
+    assert not rl.range_based()
+    assert list(rl) == list(range(10))
+
+
+def test_from_function_executor():
+    with ThreadPoolExecutor(2) as executor:
+        rl = RangedList.from_function(
+            100, _half, vectorised=True, executor=executor, chunk_size=7)
+    assert list(rl) == [x // 2 for x in range(100)]
+
+
+def test_reductions():
+    rl = RangedList(10, 2)
+    rl[3:5] = 7
+    rl[8] = -1
+    assert rl.sum() == 2 * 7 + 14 - 1
+    assert rl.min() == -1
+    assert rl.max() == 7
+    assert rl.mean() == 2.7
+    assert rl.unique() == [2, 7, -1]
+    assert rl.value_counts() == [(2, 7), (7, 2), (-1, 1)]
+
+    rl = RangedList(value=[[1], [2], [1], "a"])
+    assert rl.unique() == [[1], [2], "a"]
+    assert rl.value_counts() == [([1], 2), ([2], 1), ("a", 1)]
+
+    rl = RangedList(value=[3, 1, 3, 2], dtype=numpy.int32)
+    assert rl.sum() == 9
+    assert type(rl.sum()) is int
+    assert rl.min() == 1
+    assert rl.max() == 3
+    assert rl.mean() == 2.25
+    assert rl.value_counts() == [(3, 2), (1, 1), (2, 1)]
+
+    rl = RangedList(0, 1)
+    assert rl.sum() == 0
+    assert rl.unique() == []
+    with pytest.raises(ValueError):
+        rl.min()
+    with pytest.raises(ValueError):
+        rl.mean()
+
+
+def test_reductions_derived():
+    left = RangedList(10, 2)
+    left[5:] = 4
+    assert (left * 3).sum() == 90
+    assert (left + left).max() == 8
+
+
+def test_copy_on_write():
+    rl = RangedList(10, 0)
+    rl[3:5] = 1
+    first = rl.copy()
+    second = rl.copy()
+    rl[0] = 2
+    assert list(rl) == [2, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    assert list(first) == [0, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    first.set_value_by_ids([7, 9], 3)
+    assert list(first) == [0, 0, 0, 1, 1, 0, 0, 3, 0, 3]
+    assert list(second) == [0, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+    second[5] = 4
+    assert list(second) == [0, 0, 0, 1, 1, 4, 0, 0, 0, 0]
+    assert list(rl) == [2, 0, 0, 1, 1, 0, 0, 0, 0, 0]
+
+    rl = RangedList(value=list(range(10)))
+    clone = rl.copy()
+    clone[2] = "a"
+    rl.set_value_by_slice(4, 6, "b")
+    assert list(clone) == [0, 1, "a"] + list(range(3, 10))
+    assert list(rl) == [0, 1, 2, 3, "b", "b"] + list(range(6, 10))
+
+    rl = RangedList(value=list(range(10)), dtype=numpy.int32)
+    clone = rl.copy()
+    clone.apply_patch([(0, 2, 5)])
+    rl.set_value_by_ids([8, 9], [1, 2])
+    assert list(clone) == [5, 5] + list(range(2, 10))
+    assert list(rl) == list(range(8)) + [1, 2]
+
+    # A shared copy needs no checking on its first read
+    rl = RangedList(value=list(range(10)), compaction=DEFAULT_COMPACTION)
+    assert not rl.range_based()
+    clone = rl.copy()
+    assert clone._changes == 0
+    assert not clone.range_based()
+
+
+def test_copy_into_other_type():
+    rl = RangedList(value=list(range(10)), dtype=numpy.int32)
+    other = RangedList(10, 0)
+    other.copy_into(rl)
+    other[0] = 1.5
+    assert list(other) == [1.5] + list(range(1, 10))
+    assert list(rl) == list(range(10))
+
+
+def test_ranges_by_slices():
+    rl = RangedList(20, 0)
+    rl[3:12] = 1
+    rl[15] = 2
+    assert list(rl.iter_ranges_by_slices([0, 5, 5, 12, 16, 20])) == [
+        [(0, 3, 0), (3, 5, 1)], [], [(5, 12, 1)],
+        [(12, 15, 0), (15, 16, 2)], [(16, 20, 0)]]
+    assert list(rl.iter_ranges_by_slices([4, 8])) == [[(4, 8, 1)]]
+    assert list(rl.iter_ranges_by_slices([4])) == []
+    for bad in ([5, 3], [-1, 3], [0, 21]):
+        with pytest.raises(ValueError):
+            list(rl.iter_ranges_by_slices(bad))
+
+    derived = rl * 2
+    assert list(derived.iter_ranges_by_slices([2, 4, 13])) == [
+        [(2, 3, 0), (3, 4, 2)], [(4, 12, 2), (12, 13, 0)]]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from spinn_utilities.ranged import MultipleValuesException, RangeDictionary
 from spinn_utilities.ranged.ranged_list import RangedList
 import numpy
 import pytest
@@ -68,3 +69,85 @@ def test_list_of_numpy_list(ranged_list, range_based):
         ranged_list.get_single_value_by_slice(0, 5), numpy.arange(10))
     assert numpy.array_equal(
         ranged_list.get_single_value_by_ids([0, 9]), numpy.arange(10))
+
+
+def test_typed_storage():
+    values = numpy.array([1.5, 1.5, 2.0, 2.0, 2.0, 3.0])
+    ranged_list = RangedList(value=values, dtype=numpy.float32)
+    assert not ranged_list.range_based()
+    assert list(ranged_list) == [1.5, 1.5, 2.0, 2.0, 2.0, 3.0]
+    assert ranged_list.get_ranges() == [
+        (0, 2, 1.5), (2, 5, 2.0), (5, 6, 3.0)]
+    assert list(ranged_list.iter_ranges_by_slice(1, 4)) == [
+        (1, 2, 1.5), (2, 4, 2.0)]
+    assert ranged_list[3] == 2.0
+    assert ranged_list.get_single_value_by_slice(2, 5) == 2.0
+    with pytest.raises(MultipleValuesException):
+        ranged_list.get_single_value_by_slice(1, 5)
+    assert ranged_list.count(2.0) == 3
+    assert ranged_list.index(3.0) == 5
+    with pytest.raises(ValueError):
+        ranged_list.index(7.0)
+
+    ranged_list[1:3] = 4
+    assert list(ranged_list.iter_by_slice(0, 4)) == [1.5, 4.0, 4.0, 2.0]
+    ranged_list[[0, 5]] = [8, 9]
+    assert ranged_list.get_values([0, 5]) == [8.0, 9.0]
+
+    clone = ranged_list.copy()
+    ranged_list[0] = 0
+    assert clone[0] == 8.0
+    assert list(clone) == [8.0, 4.0, 4.0, 2.0, 2.0, 9.0]
+
+
+def test_to_numpy():
+    ranged_list = RangedList(10, 1)
+    ranged_list[3:6] = 2
+    ranged_list[8] = 3
+    expected = numpy.array([1, 1, 1, 2, 2, 2, 1, 1, 3, 1])
+    assert numpy.array_equal(ranged_list.to_numpy(), expected)
+    assert ranged_list.to_numpy(dtype=numpy.float64).dtype == numpy.float64
+    assert numpy.array_equal(
+        ranged_list.to_numpy(selector=slice(2, 9)), expected[2:9])
+    assert numpy.array_equal(
+        ranged_list.to_numpy(selector=[8, 3, 4, 0]), [3, 2, 2, 1])
+    assert numpy.array_equal(
+        ranged_list.to_numpy(selector=expected == 2), [2, 2, 2])
+    assert numpy.array_equal(
+        (ranged_list * 2).to_numpy(), expected * 2)
+
+    per_id = RangedList(value=list(expected))
+    assert numpy.array_equal(per_id.to_numpy(), expected)
+    typed = RangedList(value=expected, dtype=numpy.int32)
+    assert numpy.array_equal(typed.to_numpy(selector=[8, 3]), [3, 2])
+    assert numpy.array_equal(
+        typed.to_numpy(selector=slice(0, 4)), [1, 1, 1, 2])
+
+
+def test_from_numpy():
+    values = numpy.array([1.0, 1.0, 2.0, 2.0, 2.0, 3.0])
+    ranged_list = RangedList.from_numpy(values, key="foo")
+    assert ranged_list.range_based()
+    assert ranged_list.get_ranges() == [(0, 2, 1.0), (2, 5, 2.0), (5, 6, 3.0)]
+    assert ranged_list[4] == 2.0
+    ranged_list[1] = 2.0
+    assert ranged_list.get_ranges() == [(0, 1, 1.0), (1, 5, 2.0), (5, 6, 3.0)]
+    assert numpy.array_equal(
+        RangedList.from_numpy(ranged_list.to_numpy()).to_numpy(),
+        ranged_list.to_numpy())
+    assert len(RangedList.from_numpy(numpy.array([]))) == 0
+    with pytest.raises(ValueError):
+        RangedList.from_numpy(numpy.zeros((2, 2)))
+
+
+def test_to_structured_array():
+    rd = RangeDictionary(5, {"a": 1, "b": 2.5})
+    rd["a"][2:4] = 7
+    rd["c"] = [numpy.arange(2) for _ in range(5)]
+    result = rd.to_structured_array(["b", "a"])
+    assert result.dtype.names == ("b", "a")
+    assert numpy.array_equal(result["a"], [1, 1, 7, 7, 1])
+    assert numpy.array_equal(result["b"], [2.5] * 5)
+    result = rd.to_structured_array()
+    assert result["c"].shape == (5, 2)
+    assert result.dtype.names == ("a", "b", "c")
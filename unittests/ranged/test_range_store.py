@@ -0,0 +1,67 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from functools import partial
+import pytest
+from spinn_utilities.ranged import (
+    BlockedRangeStore, ListRangeStore, RangeDictionary, RangedList)
+
+RANGES = [(i * 2, i * 2 + 2, i % 3) for i in range(50)]
+
+
+@pytest.mark.parametrize("range_store", [
+    ListRangeStore, partial(BlockedRangeStore, load=4)])
+def test_store(range_store):
+    store = range_store(RANGES)
+    assert len(store) == 50
+    assert list(store) == RANGES
+    assert store.get_range(0) == (0, 2, 0)
+    assert store.get_range(17) == (16, 18, 2)
+    assert store.get_range(99) == (98, 100, 1)
+    assert list(store.iter_from(95)) == RANGES[47:]
+    assert list(store.iter_from(100)) == []
+
+    # Replace many ranges with one
+    store.replace(10, 90, [(10, 90, "a")])
+    assert len(store) == 11
+    assert list(store) == RANGES[:5] + [(10, 90, "a")] + RANGES[45:]
+    assert store.get_range(50) == (10, 90, "a")
+
+    # Split one range into many
+    store.replace(10, 90, [(i, i + 1, i) for i in range(10, 90)])
+    assert len(store) == 90
+    assert list(store) == (RANGES[:5] + [(i, i + 1, i) for i in range(10, 90)]
+                           + RANGES[45:])
+    for the_id in range(100):
+        (start, stop, _) = store.get_range(the_id)
+        assert start <= the_id < stop
+
+
+def test_blocked_dictionary():
+    class BlockedDictionary(RangeDictionary):
+        def list_factory(self, size, value, key):
+            return RangedList(size, value, key, range_store=BlockedRangeStore)
+
+    rd = BlockedDictionary(1000, {"a": 0})
+    for i in range(0, 1000, 2):
+        rd["a"][i] = 1
+    assert len(rd["a"].get_ranges()) == 1000
+    assert rd["a"][500] == 1
+    assert rd["a"][501] == 0
+    rd["a"][100:900] = 2
+    assert rd["a"].get_ranges()[99:102] == [
+        (99, 100, 0), (100, 900, 2), (900, 901, 1)]
+    clone = rd.copy()
+    rd["a"][0:1000] = 3
+    assert clone["a"].count(2) == 800
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import unittest
+import numpy
 from spinn_utilities.ranged.ranged_list_of_lists import RangedListOfList
 
 
@@ -48,3 +49,82 @@ class TestRangeListOfLists(unittest.TestCase):
             rl.set_value(2)
         with self.assertRaises(TypeError):
             rl.set_value("bacon")
+
+    def test_ragged(self):
+        rl = RangedListOfList(5, [[1, 2], [3], [], [4, 5, 6], [3]])
+        values, offsets = rl.to_ragged()
+        self.assertListEqual([1, 2, 3, 4, 5, 6, 3], values.tolist())
+        self.assertListEqual([0, 2, 3, 3, 6, 7], offsets.tolist())
+        self.assertListEqual([[3], [], [4, 5, 6]], list(rl[1:4]))
+        self.assertEqual(values.dtype, numpy.int64)
+        rl[2] = [7, 8]
+        rl[0] = [9, 9]
+        rl[4] = [1.5]
+        self.assertListEqual(
+            [[9, 9], [3], [7, 8], [4, 5, 6], [1.5]], list(rl))
+        self.assertEqual(rl.get_value_by_id(2), [7, 8])
+        values, offsets = rl.to_ragged()
+        self.assertListEqual([0, 2, 3, 5, 8, 9], offsets.tolist())
+        self.assertEqual(values.dtype, object)
+
+    def test_ragged_exact(self):
+        rl = RangedListOfList(2, [[1, 2.5], [3]])
+        self.assertListEqual([[1, 2.5], [3]], list(rl))
+        self.assertIs(type(rl[1][0]), int)
+        rl = RangedListOfList(2, [[True], [2]])
+        self.assertListEqual([[True], [2]], list(rl))
+        self.assertIs(type(rl[0][0]), bool)
+        rl = RangedListOfList(2, [[2 ** 63], [-1]])
+        self.assertListEqual([[2 ** 63], [-1]], list(rl))
+
+    def test_ragged_write_keeps_types(self):
+        rl = RangedListOfList(3, [[1, 2], [3, 4], [5]])
+        rl[0] = [9.5, 1]
+        self.assertListEqual([[9.5, 1], [3, 4], [5]], list(rl))
+        self.assertIs(type(rl[1][0]), int)
+        self.assertIs(type(rl[0][1]), int)
+        rl[2] = [True]
+        self.assertListEqual([[9.5, 1], [3, 4], [True]], list(rl))
+        self.assertIs(type(rl[2][0]), bool)
+
+    def test_ragged_ranges(self):
+        rl = RangedListOfList(
+            100, [[1, 2]] * 30 + [[1, 3]] * 30 + [[1]] * 20 + [[]] * 20)
+        self.assertListEqual(
+            [(0, 30, [1, 2]), (30, 60, [1, 3]), (60, 80, [1]),
+             (80, 100, [])], list(rl.iter_ranges()))
+        self.assertListEqual(
+            [(25, 30, [1, 2]), (30, 35, [1, 3])],
+            list(rl.iter_ranges_by_slice(25, 35)))
+
+    def test_ragged_objects(self):
+        rl = RangedListOfList(3, [["a", "b"], [1], ["a", "b"]])
+        self.assertListEqual([["a", "b"], [1], ["a", "b"]], list(rl))
+        rl.set_value_by_id(1, [[1, 2], [3]])
+        self.assertListEqual([["a", "b"], [[1, 2], [3]], ["a", "b"]],
+                             list(rl))
+        rl[2] = ["c", "d"]
+        self.assertListEqual(["c", "d"], rl[2])
+
+    def test_copy_of_ragged(self):
+        rl = RangedListOfList(3, [[1], [2, 3], [4]])
+        clone = rl.copy()
+        clone[0] = 9
+        self.assertListEqual([9, [2, 3], [4]], list(clone))
+        self.assertListEqual([[1], [2, 3], [4]], list(rl))
+        other = RangedListOfList(3, [5])
+        other.copy_into(rl)
+        other[1] = [6, 7]
+        self.assertListEqual([[1], [6, 7], [4]], list(other))
+        self.assertListEqual([[1], [2, 3], [4]], list(rl))
+
+    def test_to_numpy(self):
+        rl = RangedListOfList(3, [[1, 2], [3, 4], [5, 6]])
+        self.assertListEqual([[1, 2], [3, 4], [5, 6]], rl.to_numpy().tolist())
+        self.assertListEqual([[3, 4]], rl.to_numpy(selector=[1]).tolist())
+        rl[1] = [3]
+        ragged = rl.to_numpy(dtype=float)
+        self.assertEqual(3, len(ragged))
+        self.assertListEqual([3.0], ragged[1].tolist())
+        rl = RangedListOfList(3, [1, 2])
+        self.assertListEqual([[1, 2]] * 3, rl.to_numpy().tolist())
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import (
+    ArrayRangeStore, RangeDictionary, RangedList)
+
+
+def _build():
+    rd = RangeDictionary(10, {
+        "int": 1, "float": 2.5, "str": "a", "none": None, "mixed": 1,
+        "dict": 0})
+    rd["int"][3:5] = 7
+    rd["float"].set_value([float(i) for i in range(10)])
+    rd["str"][9] = "bb"
+    rd["none"][2] = "x"
+    rd["mixed"][1] = 1.5
+    rd["mixed"][6:8] = 1.5
+    rd["dict"].set_value_by_id(4, {"y": 2})
+    rd["dict"].set_value_by_id(5, [1, 2])
+    rd.set_default("int", 4)
+    return rd
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, mmap):
+    rd = _build()
+    rd.save(str(tmp_path))
+    loaded = RangeDictionary.load(str(tmp_path), mmap=mmap)
+    assert len(loaded) == 10
+    assert list(loaded.keys()) == list(rd.keys())
+    for key in rd.keys():
+        assert list(loaded[key].iter_ranges()) == \
+            list(rd[key].iter_ranges())
+        assert loaded.get_default(key) == rd.get_default(key)
+    assert loaded.get_default("int") == 4
+    assert loaded["mixed"].get_value_by_id(1) == 1.5
+    assert type(loaded["mixed"].get_value_by_id(0)) is int
+    assert loaded["dict"][3:7] == [0, {"y": 2}, [1, 2], 0]
+    assert loaded["str"][8:10] == ["a", "bb"]
+    assert loaded["float"][3] == 3.0
+
+
+def test_change_after_load(tmp_path):
+    rd = _build()
+    rd.save(str(tmp_path))
+    loaded = RangeDictionary.load(str(tmp_path))
+    loaded["int"][0:4] = 9
+    assert loaded["int"] == [9, 9, 9, 9, 7, 1, 1, 1, 1, 1]
+    # The saved copy is not changed
+    again = RangeDictionary.load(str(tmp_path))
+    assert again["int"] == [1, 1, 1, 7, 7, 1, 1, 1, 1, 1]
+
+
+class _MyList(RangedList):
+    pass
+
+
+class _MyDictionary(RangeDictionary):
+    def list_factory(self, size, value, key):
+        return _MyList(size, value, key)
+
+
+def test_load_list_factory(tmp_path):
+    rd = _build()
+    rd.save(str(tmp_path))
+    loaded = _MyDictionary.load(str(tmp_path))
+    for key in rd.keys():
+        assert isinstance(loaded[key], _MyList)
+        assert list(loaded[key].iter_ranges()) == \
+            list(rd[key].iter_ranges())
+        assert loaded.get_default(key) == rd.get_default(key)
+    loaded["int"][0:4] = 9
+    assert loaded["int"] == [9, 9, 9, 9, 7, 1, 1, 1, 1, 1]
+    again = _MyDictionary.load(str(tmp_path))
+    assert again["int"] == [1, 1, 1, 7, 7, 1, 1, 1, 1, 1]
+
+
+def test_array_range_store():
+    store = ArrayRangeStore(
+        numpy.array([2, 5, 6]), numpy.array([0, 1, 0]), table=["a", "b"])
+    assert list(store) == [(0, 2, "a"), (2, 5, "b"), (5, 6, "a")]
+    assert store.get_range(4) == (2, 5, "b")
+    assert list(store.iter_from(5)) == [(5, 6, "a")]
+    store.replace(2, 5, [(2, 3, "b"), (3, 5, "c")])
+    assert len(store) == 4
+    assert store.get_range(4) == (3, 5, "c")
+
+
+def test_from_range_arrays():
+    a_list = RangedList.from_range_arrays(
+        6, numpy.array([2, 6]), numpy.array([1.5, 3.0]))
+    assert a_list == [1.5, 1.5, 3.0, 3.0, 3.0, 3.0]
+    a_list[1] = 3.0
+    assert list(a_list.iter_ranges()) == [(0, 1, 1.5), (1, 6, 3.0)]
+    with pytest.raises(ValueError):
+        RangedList.from_range_arrays(
+            6, numpy.array([2, 5]), numpy.array([1, 3]))
+    with pytest.raises(ValueError):
+        RangedList.from_range_arrays(
+            6, numpy.array([6]), numpy.array([1, 3]))
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
+import pytest
 from spinn_utilities.ranged import RangeDictionary
 
 defaults = {"a": "alpha", "b": "bravo"}
@@ -66,3 +68,52 @@ def test_double_list():
     assert [2, 7, 1, 3, 5, 8] == list(view1.ids())
     view2 = view1[2, 3, 5]
     assert [1, 3, 8] == list(view2.ids())
+
+
+def test_numpy_ids_view():
+    rd = RangeDictionary(100, {"a": 0, "b": "x"})
+    rd["a"][10:20] = 1
+    rd["b"][15] = "y"
+    ids = numpy.array([3, 12, 13, 14, 15, 16, 60])
+    view = rd[ids]
+    ids[0] = 99
+    assert list(view.ids()) == [3, 12, 13, 14, 15, 16, 60]
+    assert list(view.iter_all_values(key="a")) == [0, 1, 1, 1, 1, 1, 0]
+    assert list(view.iter_all_values(key=None)) == [
+        {"a": 0, "b": "x"}, {"a": 1, "b": "x"}, {"a": 1, "b": "x"},
+        {"a": 1, "b": "x"}, {"a": 1, "b": "y"}, {"a": 1, "b": "x"},
+        {"a": 0, "b": "x"}]
+    assert list(view.iter_all_values(key=None, update_safe=True)) == \
+        list(view.iter_all_values(key=None))
+    assert list(view.iter_ranges(key="a")) == [
+        (3, 4, 0), (12, 17, 1), (60, 61, 0)]
+    view["a"] = 5
+    assert view.get_value("a") == 5
+    assert rd["a"][11:14] == [1, 5, 5]
+    assert isinstance(rd[numpy.array([4, 5, 6])], type(rd[4:7]))
+    assert isinstance(rd[numpy.array([4])], type(rd[4]))
+
+
+def test_ids_view_list_value():
+    rd = RangeDictionary(6, {"a": 0})
+    view = rd[[1, 3, 4]]
+    assert view.ids() == (1, 3, 4)
+    assert view.ids()
+    view["a"] = [7, 8, 9]
+    assert list(rd["a"]) == [0, [7, 8, 9], 0, [7, 8, 9], [7, 8, 9], 0]
+    view.set_value("a", [5, 6])
+    assert list(rd["a"]) == [0, [5, 6], 0, [5, 6], [5, 6], 0]
+
+
+def test_bool_mask_not_ids():
+    rd = RangeDictionary(3, {"a": 0})
+    with pytest.raises(KeyError):
+        rd[numpy.array([True, False, True])]
+
+
+def test_ids_cached():
+    rd = RangeDictionary(6, {"a": 0})
+    view = rd[[1, 3, 4]]
+    assert view.ids() is view.ids()
+    assert 3 in view
+    assert 2 not in view
@@ -269,3 +269,148 @@ def test_copy():
     calc2_copy = rd2["calc2"]
     assert calc2_copy == [20, 20, 20]
     assert list(calc2_copy.iter_ranges()) == [(0, 3, 20)]
+
+
+def test_merge_many_keys():
+    rd = RangeDictionary(50)
+    keys = [f"k{index}" for index in range(20)]
+    for index, key in enumerate(keys):
+        rd[key] = index
+        rd[key][index:index * 2 + 1] = -index
+    ranges = list(rd.iter_ranges())
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == 50
+    for (start, stop, values), (next_start, _, _) in zip(
+            ranges, ranges[1:]):
+        assert stop == next_start
+        for key in keys:
+            assert rd[key][start:stop] == [values[key]] * (stop - start)
+    assert list(rd.iter_ranges_by_slice(None, 3, 7)) == [
+        (start, stop, values) for (start, stop, values) in
+        rd.iter_ranges_by_slice(keys, 3, 7)]
+    by_ids = list(rd.iter_ranges_by_ids(key=["k2", "k5"], ids=[1, 2, 9, 10]))
+    assert by_ids == [
+        (1, 2, {"k2": 2, "k5": 5}), (2, 3, {"k2": -2, "k5": 5}),
+        (9, 11, {"k2": 2, "k5": -5})]
+
+
+def test_ranges_as_tuples():
+    rd = RangeDictionary(10, {"a": 1, "b": 2.5, "c": "x"})
+    rd["a"][2:4] = 3
+    rd["c"][3:6] = "y"
+    assert list(rd.iter_ranges_as_tuples(["c", "a"])) == [
+        (0, 2, ("x", 1)), (2, 3, ("x", 3)), (3, 4, ("y", 3)),
+        (4, 6, ("y", 1)), (6, 10, ("x", 1))]
+    assert list(rd.iter_ranges_as_tuples(["a"], 1, 3)) == [
+        (1, 2, (1, )), (2, 3, (3, ))]
+    assert [(start, stop, tuple(values.values()))
+            for (start, stop, values) in rd.iter_ranges()] == \
+        list(rd.iter_ranges_as_tuples())
+
+
+def test_ranges_to_records():
+    rd = RangeDictionary(10, {"a": 1, "b": 2.5})
+    rd["a"][2:4] = 3
+    starts, stops, records = rd.ranges_to_records()
+    assert starts.tolist() == [0, 2, 4]
+    assert stops.tolist() == [2, 4, 10]
+    assert records.dtype.names == ("a", "b")
+    assert records["a"].tolist() == [1, 3, 1]
+    assert records["b"].tolist() == [2.5, 2.5, 2.5]
+    starts, stops, records = rd.ranges_to_records(["b"], 3, 5)
+    assert starts.tolist() == [3]
+    assert stops.tolist() == [5]
+    assert records.dtype.names == ("b", )
+
+
+def test_diff():
+    old = RangeDictionary(10, {"a": 1, "b": 2.5})
+    new = old.copy()
+    assert old.diff(new) == {}
+    new["a"][2:4] = 3
+    new["a"][8] = 4
+    patches = old.diff(new)
+    assert patches == {"a": [(2, 4, 3), (8, 9, 4)]}
+    old.apply_patch(patches)
+    assert list(old.iter_ranges()) == list(new.iter_ranges())
+    new["c"] = 1
+    with pytest.raises(KeyError):
+        old.diff(new)
+
+
+def test_set_value_from_function():
+    rd = RangeDictionary(10, {"a": 1})
+    a_list = rd.get_list("a")
+    rd.set_value_from_function("a", lambda x: x % 2)
+    rd.set_value_from_function("b", lambda ids: ids < 3, vectorised=True)
+    assert rd.get_list("a") is a_list
+    assert list(a_list) == [0, 1] * 5
+    assert list(rd["b"]) == [True] * 3 + [False] * 7
+
+
+class _MyList(RangedList):
+    pass
+
+
+class _MyDictionary(RangeDictionary):
+    def list_factory(self, size, value, key):
+        return _MyList(size, value, key)
+
+
+def test_set_value_from_function_list_factory():
+    rd = _MyDictionary(10, {"a": 1})
+    rd.set_value_from_function("b", lambda x: x // 5)
+    rd.set_value_from_function("c", lambda ids: ids * 2, vectorised=True)
+    assert isinstance(rd.get_list("b"), _MyList)
+    assert isinstance(rd.get_list("c"), _MyList)
+    assert list(rd["b"]) == [0] * 5 + [1] * 5
+    assert list(rd["c"]) == list(range(0, 20, 2))
+
+
+def test_reductions():
+    rd = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd["a"][6:] = 3
+    assert rd.sum("a") == 18
+    assert rd.min("a") == 1
+    assert rd.max("a") == 3
+    assert rd.mean("a") == 1.8
+    assert rd.unique("b") == ["x"]
+    assert rd.value_counts("a") == [(1, 6), (3, 4)]
+
+
+def test_copy_on_write():
+    original = RangeDictionary(10, {"a": 1, "b": "x"})
+    clone = original.copy()
+    clone["a"][2:4] = 2
+    original["b"][5] = "y"
+    assert list(clone["a"]) == [1, 1, 2, 2, 1, 1, 1, 1, 1, 1]
+    assert list(clone["b"]) == ["x"] * 10
+    assert list(original["a"]) == [1] * 10
+    assert list(original["b"]) == ["x"] * 5 + ["y"] + ["x"] * 4
+
+
+def test_ranges_by_slices():
+    rd = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd["a"][2:6] = 2
+    rd["b"][5:] = "y"
+    assert list(rd.iter_ranges_by_slices([0, 3, 10], "a")) == [
+        [(0, 2, 1), (2, 3, 2)], [(3, 6, 2), (6, 10, 1)]]
+    assert list(rd.iter_ranges_by_slices([1, 4, 7])) == [
+        [(1, 2, {"a": 1, "b": "x"}), (2, 4, {"a": 2, "b": "x"})],
+        [(4, 5, {"a": 2, "b": "x"}), (5, 6, {"a": 2, "b": "y"}),
+         (6, 7, {"a": 1, "b": "y"})]]
+
+
+def test_partition():
+    rd = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd["a"][2:6] = 2
+    rd["b"].set_value_by_slice(5, 10, [1, 2], use_list_as_value=True)
+    first, second = rd.partition([0, 4, 10])
+    assert len(first) == 4
+    assert len(second) == 6
+    assert list(first.iter_ranges("a")) == [(0, 2, 1), (2, 4, 2)]
+    assert list(second.iter_ranges("a")) == [(0, 2, 2), (2, 6, 1)]
+    assert list(second.iter_ranges("b")) == [(0, 1, "x"), (1, 6, [1, 2])]
+    assert second.get_default("a") == 1
+    second["a"][0] = 5
+    assert rd["a"][4] == 2